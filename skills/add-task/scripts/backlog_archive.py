@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Backlog Archive
+Cold storage for stale backlog sections. Date sections that were never pulled
+into a plan and old carryover blocks are moved out of the backlog into
+gzip-compressed markdown, one file per month of the section's date:
+
+    DailyPlans/archive/backlog-2026-01.md.gz
+
+Sections are added as new gzip members. The month file is replaced
+atomically (its intact members plus the new one, see vault_io), so a crash
+or sync conflict mid-write leaves the previous archive readable. A truncated
+trailing member, as left by an interrupted in-place append, is skipped when
+reading and dropped on the next write. Archives are only read on demand
+(`backlog_manager.py archive-show`), never by the daily scripts.
+"""
+
+import os
+import gzip
+import re
+import zlib
+
+import vault_io
+from backlog_document import BacklogDocument
+
+
+# Default horizon of `backlog_manager.py archive`; end-of-day cleanup only
+# archives when given --archive-days
+DEFAULT_ARCHIVE_DAYS = 30
+
+ARCHIVE_FILE_RE = re.compile(r'^backlog-(\d{4}-\d{2})\.md\.gz$')
+
+
+def gzip_members(data):
+    """
+    Split concatenated gzip data into its complete members
+
+    Reading stops at the first truncated or corrupt member.
+
+    Returns:
+        list: (compressed member bytes, decompressed bytes) pairs
+    """
+    members = []
+    while data:
+        decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)  # gzip header
+        try:
+            content = decompressor.decompress(data)
+        except zlib.error:
+            break
+        if not decompressor.eof:
+            break
+        size = len(data) - len(decompressor.unused_data)
+        members.append((data[:size], content))
+        data = decompressor.unused_data
+    return members
+
+
+def _read_bytes(path):
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        return b''
+
+
+def archive_dir(vault_path):
+    """Directory holding archived backlog sections (DailyPlans/archive/)"""
+    return os.path.join(vault_path, "DailyPlans", "archive")
+
+
+class BacklogArchive:
+    """Month-partitioned gzip archive of backlog sections"""
+
+    def __init__(self, vault_path):
+        self.directory = archive_dir(vault_path)
+
+    def path_for(self, month):
+        """Archive file for a YYYY-MM month"""
+        return os.path.join(self.directory, f"backlog-{month}.md.gz")
+
+    def append(self, sections):
+        """
+        Append sections to their month's archive, one write per month
+
+        Args:
+            sections: BacklogSection objects removed from the backlog
+
+        Returns:
+            int: Number of sections archived
+        """
+        by_month = {}
+        for section in sections:
+            if section.date:
+                by_month.setdefault(section.date[:7], []).extend(section.lines)
+
+        if by_month:
+            os.makedirs(self.directory, exist_ok=True)
+
+        for month, lines in by_month.items():
+            text = ''.join(lines)
+            if not text.endswith('\n'):
+                text += '\n'
+            path = self.path_for(month)
+            data = _read_bytes(path)
+            intact = b''.join(member for member, _ in gzip_members(data))
+            if len(intact) != len(data):
+                print(f"[!] Warning: Dropping a truncated block at the end of {path}")
+            vault_io.write_bytes(path, intact + gzip.compress(text.encode('utf-8')))
+
+        return sum(1 for section in sections if section.date)
+
+    def months(self):
+        """Return archived months (YYYY-MM), oldest first"""
+        try:
+            names = sorted(os.listdir(self.directory))
+        except OSError:
+            return []
+        return [m.group(1) for m in map(ARCHIVE_FILE_RE.match, names) if m]
+
+    def read_text(self, month):
+        """Return the archived markdown for a month ('' if none)"""
+        members = gzip_members(_read_bytes(self.path_for(month)))
+        return b''.join(content for _, content in members).decode('utf-8')
+
+    def load_document(self, month):
+        """
+        Parse a month's archive
+
+        Returns:
+            BacklogDocument: Archived sections (no preamble)
+        """
+        return BacklogDocument.parse(self.read_text(month))
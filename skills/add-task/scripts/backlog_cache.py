@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Backlog Parse Cache
+On-disk cache of the parsed backlog.md section index, keyed by the file's
+(mtime, size, content hash). When backlog.md hasn't changed since the last
+run, the document is rebuilt from the cached index with no markdown parsing.
+
+Cache files live outside the vault so they never sync:
+    Windows: %LOCALAPPDATA%\\pm-daily-planning\\cache
+    Others:  $XDG_CACHE_HOME/pm-daily-planning (default ~/.cache)
+"""
+
+import os
+import sys
+import json
+import hashlib
+
+import vault_io
+from backlog_document import BacklogDocument
+
+
+CACHE_VERSION = 1
+
+
+def cache_dir():
+    """Directory holding parse cache files"""
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+        return os.path.join(base, 'pm-daily-planning', 'cache')
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'pm-daily-planning')
+
+
+def content_hash(text):
+    """Hash of the decoded file contents"""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class BacklogParseCache:
+    """Parse cache for a single backlog.md"""
+
+    def __init__(self, backlog_file, directory=None):
+        self.backlog_file = os.path.abspath(backlog_file)
+        name = hashlib.sha1(self.backlog_file.encode('utf-8')).hexdigest()[:16]
+        self.path = os.path.join(directory or cache_dir(), f"backlog-{name}.json")
+
+    def load(self):
+        """
+        Read backlog.md and return its document, from cache when possible
+
+        Returns:
+            BacklogDocument: Parsed (or restored) backlog
+        """
+        text = vault_io.read_text(self.backlog_file)
+        if vault_io.is_pending(self.backlog_file):
+            # Written in an open batch but not on disk yet: nothing to key the cache on
+            return BacklogDocument.parse(text)
+        stat = os.stat(self.backlog_file)
+        digest = content_hash(text)
+
+        entry = self._read_entry()
+        if entry and entry.get('hash') == digest:
+            try:
+                document = BacklogDocument.from_index(text, entry['index'])
+                if (entry.get('mtime_ns'), entry.get('size')) != (stat.st_mtime_ns, stat.st_size):
+                    # Same content with a new mtime (e.g. touched by sync): refresh the key
+                    self._write_entry(stat, digest, entry['index'])
+                return document
+            except Exception:
+                pass
+
+        document = BacklogDocument.parse(text)
+        self._write_entry(stat, digest, document.to_index())
+        return document
+
+    def cached(self):
+        """
+        Document restored from the cache, only if backlog.md is unchanged
+
+        Unlike load(), a miss doesn't parse the file, so callers can fall
+        back to a cheaper streaming read.
+
+        Returns:
+            BacklogDocument or None: None if there is no valid entry
+        """
+        if vault_io.is_pending(self.backlog_file):
+            return None
+        try:
+            stat = os.stat(self.backlog_file)
+        except OSError:
+            return None
+
+        entry = self._read_entry()
+        if not entry or (entry.get('mtime_ns'), entry.get('size')) != (stat.st_mtime_ns, stat.st_size):
+            return None
+
+        text = vault_io.read_text(self.backlog_file)
+        if entry.get('hash') != content_hash(text):
+            return None
+        try:
+            return BacklogDocument.from_index(text, entry['index'])
+        except Exception:
+            return None
+
+    def store(self, text, document):
+        """
+        Record the index for text that was just written to backlog.md
+
+        Args:
+            text: Exactly what was written
+            document: The document it was serialized from
+        """
+        if vault_io.is_pending(self.backlog_file):
+            return
+        try:
+            stat = os.stat(self.backlog_file)
+        except OSError:
+            return
+        self._write_entry(stat, content_hash(text), document.to_index())
+
+    def invalidate(self):
+        """Drop the cache entry"""
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    def _read_entry(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get('version') != CACHE_VERSION or entry.get('file') != self.backlog_file:
+            return None
+        return entry
+
+    def _write_entry(self, stat, digest, index):
+        entry = {
+            'version': CACHE_VERSION,
+            'file': self.backlog_file,
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'hash': digest,
+            'index': index
+        }
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            vault_io.write_text(
+                self.path, json.dumps(entry, ensure_ascii=False, separators=(',', ':')), durable=False
+            )
+        except OSError:
+            # The cache is an optimization; never fail a backlog operation over it
+            pass
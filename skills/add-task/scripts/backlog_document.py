@@ -0,0 +1,788 @@
+#!/usr/bin/env python3
+"""
+Backlog Document Model
+Parses backlog.md once into an indexed model (date section -> category -> tasks)
+so lookups and edits only touch the section they need.
+"""
+
+import io
+import re
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+
+# Category tables live in task_categories
+from task_categories import (
+    CARRYOVER_CATEGORY_NAME,
+    CARRYOVER_ORDER,
+    category_header,
+    classify_header,
+)
+
+
+NEW_BACKLOG_TEMPLATE = """---
+title: {title}
+description: Tasks scheduled for dates without daily plans yet
+last_updated: {timestamp}
+---
+
+# {title}
+
+Tasks added for future dates are stored here until their daily plans are created.
+
+When you run `/plan-my-day` for a date, tasks from this backlog will be automatically added to that day's plan.
+
+---
+
+"""
+
+DATE_HEADER_RE = re.compile(r'^## (\d{4}-\d{2}-\d{2}) \(')
+CARRYOVER_HEADER_RE = re.compile(r'^## 🔄 Backlog due from (\d{4}-\d{2}-\d{2})')
+CARRIED_OVER_RE = re.compile(r'-\s*\*Carried over from:\*\s*(\d{4}-\d{2}-\d{2})')
+LAST_UPDATED_RE = re.compile(r'last_updated: .*')
+
+
+def date_header(date):
+    """Build the "## YYYY-MM-DD (Day)" header for a date"""
+    day_name = datetime.strptime(date, "%Y-%m-%d").strftime("%A")
+    return f"## {date} ({day_name})"
+
+
+def carryover_header(date):
+    """Build the "## 🔄 Backlog due from YYYY-MM-DD (Day)" header for a date"""
+    day_name = datetime.strptime(date, "%Y-%m-%d").strftime("%A")
+    return f"## 🔄 Backlog due from {date} ({day_name})"
+
+
+def new_backlog_text(timestamp=None, title='Task Backlog'):
+    """Initial contents of an empty backlog.md (or backlog shard)"""
+    if timestamp is None:
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+    return NEW_BACKLOG_TEMPLATE.format(timestamp=timestamp, title=title)
+
+
+def build_carryover_section(date, tasks):
+    """
+    Build a "## 🔄 Backlog due from <date>" section
+
+    Args:
+        date: Date the tasks were carried over from (YYYY-MM-DD)
+        tasks: Dict of category -> list of (task_text, original_carryover_date)
+
+    Returns:
+        BacklogSection or None if there are no tasks
+    """
+    total_tasks = sum(len(task_list) for task_list in tasks.values())
+    if total_tasks == 0:
+        return None
+
+    day_name = datetime.strptime(date, "%Y-%m-%d").strftime("%A")
+    lines = [
+        carryover_header(date) + "\n",
+        "\n",
+        f"*{total_tasks} tasks carried over from {day_name}*\n",
+    ]
+
+    for category in CARRYOVER_ORDER + sorted(set(tasks) - set(CARRYOVER_ORDER)):
+        if not tasks.get(category):
+            continue
+        lines.append("\n")
+        lines.append(category_header(category, CARRYOVER_CATEGORY_NAME) + "\n")
+        for task_text, original_date in tasks[category]:
+            lines.append(f"- [ ] {task_text}\n")
+            # Keep the original carryover date so long-running tasks stay visible
+            lines.append(f"  - *Carried over from:* {original_date or date}\n")
+
+    lines.extend(["\n", "---\n", "\n"])
+    return BacklogSection('carryover', date, lines)
+
+
+def classify_category(header):
+    """
+    Map a "### ..." header line to a category key
+
+    Returns:
+        str: Category key ('other' if nothing matches)
+    """
+    return classify_header(header) or 'other'
+
+
+def _is_blank(line):
+    return not line.strip()
+
+
+def _classify_section(header):
+    """Return (kind, date) for a "## " header line"""
+    match = CARRYOVER_HEADER_RE.match(header)
+    if match:
+        return 'carryover', match.group(1)
+    match = DATE_HEADER_RE.match(header)
+    if match:
+        return 'date', match.group(1)
+    return 'other', None
+
+
+def iter_sections(stream, want):
+    """
+    Stream sections from an open backlog file
+
+    Only sections for which want(kind, date) is true are materialized;
+    every other line is skipped as it is read, so memory stays flat and
+    callers can stop as soon as they have what they need.
+
+    Yields:
+        BacklogSection
+    """
+    kind = date = None
+    lines = None
+
+    for line in stream:
+        if line.startswith('## '):
+            if lines is not None:
+                yield BacklogSection(kind, date, lines)
+            kind, date = _classify_section(line)
+            lines = [line] if want(kind, date) else None
+        elif lines is not None:
+            lines.append(line)
+
+    if lines is not None:
+        yield BacklogSection(kind, date, lines)
+
+
+def rewrite_sections(src, dst, drop, timestamp=None, keep_dropped=True):
+    """
+    Copy a backlog from src to dst line by line, leaving out sections
+
+    Untouched lines are copied straight through. Blank lines left at the seam
+    of a dropped section are collapsed to one, and last_updated is stamped
+    with timestamp (if given).
+
+    Args:
+        src: Open backlog file to read
+        dst: Open file to write
+        drop: drop(kind, date) -> True for sections to leave out
+        timestamp: Value for the last_updated frontmatter field
+        keep_dropped: Materialize and return the dropped sections
+
+    Returns:
+        tuple: (number of sections dropped, list of dropped BacklogSections)
+    """
+    dropped = []
+    dropped_count = 0
+    current = None       # Lines of the section being dropped
+    pending = []         # Blank lines not yet written
+    frontmatter = None   # None before the first line, then True/False
+
+    for line in src:
+        if frontmatter is None:
+            frontmatter = line.strip() == '---'
+        elif frontmatter and line.strip() == '---':
+            frontmatter = False
+        elif frontmatter and timestamp and LAST_UPDATED_RE.match(line):
+            line = LAST_UPDATED_RE.sub(f'last_updated: {timestamp}', line)
+
+        if line.startswith('## '):
+            if current is not None and keep_dropped:
+                dropped.append(BacklogSection(*current))
+            current = None
+
+            kind, date = _classify_section(line)
+            if drop(kind, date):
+                dropped_count += 1
+                current = (kind, date, [line])
+                del pending[1:]
+                continue
+        elif current is not None:
+            current[2].append(line)
+            continue
+
+        if _is_blank(line):
+            pending.append(line)
+            continue
+
+        dst.writelines(pending)
+        pending.clear()
+        dst.write(line)
+
+    if current is not None and keep_dropped:
+        dropped.append(BacklogSection(*current))
+    dst.writelines(pending)
+
+    return dropped_count, dropped
+
+
+def collect_carryover_tasks(sections):
+    """
+    Collect tasks from carryover sections
+
+    Returns:
+        dict: category -> list of (task_text, carryover_date); each task
+              keeps its own "Carried over from" date, defaulting to the
+              section's date
+    """
+    tasks = {}
+    for section in sections:
+        for key, category in section.categories.items():
+            for task in category.tasks:
+                tasks.setdefault(key, []).append((task.text, task.carryover_date or section.date))
+    return tasks
+
+
+def task_fingerprint(text):
+    """
+    Normalized form of a task used for duplicate detection
+
+    Casefolded, with markdown bold markers removed and whitespace collapsed,
+    so "**Review** PRD" and "review  prd" are the same task.
+    """
+    return ' '.join(text.replace('**', '').casefold().split())
+
+
+def dedupe_carryover_tasks(date, tasks, pool):
+    """
+    Drop carryover tasks that are already in the carryover pool (or repeated
+    within tasks), keeping the oldest "Carried over from" date
+
+    Args:
+        date: Date the tasks are carried over from (YYYY-MM-DD)
+        tasks: Dict of category -> list of (task_text, original_carryover_date)
+        pool: Dict of fingerprint -> carryover date for tasks already carried
+              over; updated in place with any older dates
+
+    Returns:
+        tuple: (tasks still to add, {fingerprint: older date} for existing
+                pool tasks that need backdating, number of duplicates merged)
+    """
+    fresh = {}
+    positions = {}  # fingerprint -> (category, index) within fresh
+    backdate = {}
+    merged = 0
+
+    for category, task_list in tasks.items():
+        for task_text, original_date in task_list:
+            original_date = original_date or date
+            fingerprint = task_fingerprint(task_text)
+
+            if fingerprint in positions:
+                key, i = positions[fingerprint]
+                if original_date < fresh[key][i][1]:
+                    fresh[key][i] = (fresh[key][i][0], original_date)
+                merged += 1
+            elif fingerprint in pool:
+                if original_date < pool[fingerprint]:
+                    pool[fingerprint] = backdate[fingerprint] = original_date
+                merged += 1
+            else:
+                positions[fingerprint] = (category, len(fresh.setdefault(category, [])))
+                fresh[category].append((task_text, original_date))
+
+    return fresh, backdate, merged
+
+
+class BacklogTask:
+    """A single unchecked task inside a backlog section"""
+
+    __slots__ = ('text', 'line', 'carryover_date')
+
+    def __init__(self, text, line, carryover_date=None):
+        self.text = text
+        self.line = line                      # Line index within the section
+        self.carryover_date = carryover_date  # From "*Carried over from:*" metadata
+
+
+class BacklogCategory:
+    """A "### category" block inside a backlog section"""
+
+    __slots__ = ('key', 'header', 'start', 'end', 'tasks')
+
+    def __init__(self, key, header, start):
+        self.key = key
+        self.header = header
+        self.start = start  # Header line index within the section
+        self.end = start + 1  # Exclusive; extended while parsing
+        self.tasks = []
+
+
+class BacklogSection:
+    """
+    A top-level "## ..." block of backlog.md
+
+    kind is 'date' for "## YYYY-MM-DD (Day)", 'carryover' for
+    "## 🔄 Backlog due from ..." and 'other' for any other "## " header.
+    """
+
+    def __init__(self, kind, date, lines, index=None):
+        self.kind = kind
+        self.date = date
+        self.lines = lines  # Raw lines, each keeping its trailing newline
+        self._categories = {}
+        self._cached_index = None
+        self._fingerprints = None
+
+        # Spans within the serialized document (filled in by BacklogDocument)
+        self.start_line = 0
+        self.end_line = 0
+        self.start_byte = 0
+        self.end_byte = 0
+        self.byte_size = 0
+
+        if index is None:
+            self._index()
+        else:
+            # Categories are restored from the cached index on first access
+            self.byte_size = index[3]
+            self._cached_index = index
+
+    @property
+    def categories(self):
+        if self._cached_index is not None:
+            self._restore(self._cached_index)
+        return self._categories
+
+    def to_index(self):
+        """Serializable category/task index (see BacklogDocument.to_index)"""
+        if self._cached_index is not None:
+            return self._cached_index
+        return [
+            self.kind, self.date, len(self.lines), self.byte_size,
+            [
+                [c.key, c.header, c.start, c.end,
+                 [[t.text, t.line, t.carryover_date] for t in c.tasks]]
+                for c in self.categories.values()
+            ]
+        ]
+
+    def _restore(self, index):
+        """Rebuild categories from a cached index without re-parsing lines"""
+        self._cached_index = None
+        self._fingerprints = None
+        self._categories = {}
+        for key, header, start, end, tasks in index[4]:
+            category = BacklogCategory(key, header, start)
+            category.end = end
+            category.tasks = [BacklogTask(*task) for task in tasks]
+            self._categories[key] = category
+
+    @property
+    def header(self):
+        return self.lines[0].rstrip('\n') if self.lines else ''
+
+    def _index(self):
+        """(Re)build the category/task index for this section only"""
+        self._cached_index = None
+        self._fingerprints = None
+        self._categories = categories = {}
+        current = None
+        lines = self.lines
+
+        for i, line in enumerate(lines):
+            if line.startswith('### '):
+                key = classify_category(line)
+                if key in categories:
+                    # Repeated header for the same category: keep one task list
+                    current = categories[key]
+                    current.end = i + 1
+                else:
+                    current = BacklogCategory(key, line.rstrip('\n'), i)
+                    categories[key] = current
+                continue
+
+            if current is None:
+                continue
+
+            if line.startswith('## ') or line.strip() == '---':
+                current = None
+                continue
+
+            current.end = i + 1
+            stripped = line.strip()
+            if stripped.startswith('- [ ]'):
+                carryover_date = None
+                if i + 1 < len(lines):
+                    match = CARRIED_OVER_RE.match(lines[i + 1].strip())
+                    if match:
+                        carryover_date = match.group(1)
+                current.tasks.append(BacklogTask(stripped[6:].strip(), i, carryover_date))
+
+        self.byte_size = len(''.join(lines).encode('utf-8'))
+
+    @property
+    def fingerprints(self):
+        """{task_fingerprint: BacklogTask} for every task in this section (built on first use)"""
+        if self._fingerprints is None:
+            fingerprints = {}
+            for category in self.categories.values():
+                for task in category.tasks:
+                    fingerprints.setdefault(task_fingerprint(task.text), task)
+            self._fingerprints = fingerprints
+        return self._fingerprints
+
+    def has_task(self, task):
+        """True if an equivalent task (same fingerprint) is already in this section"""
+        return task_fingerprint(task) in self.fingerprints
+
+    def set_carryover_date(self, fingerprint, date):
+        """Rewrite the "Carried over from" date of the task with this fingerprint"""
+        task = self.fingerprints.get(fingerprint)
+        if task is None:
+            return
+
+        meta_line = f"  - *Carried over from:* {date}\n"
+        next_line = task.line + 1
+        if next_line < len(self.lines) and CARRIED_OVER_RE.match(self.lines[next_line].strip()):
+            self.lines[next_line] = meta_line
+        else:
+            self.lines.insert(next_line, meta_line)
+        self._index()
+
+    def tasks_by_category(self):
+        """Return {category: [task_text, ...]} for this section"""
+        return {key: [t.text for t in cat.tasks] for key, cat in self.categories.items()}
+
+    def add_task(self, category, task):
+        """Insert a task under its category header, creating the header if needed"""
+        lines = self.lines
+        task_line = f"- [ ] {task}\n"
+        existing = self.categories.get(category)
+
+        if existing is not None:
+            # Insert after the last non-blank line of the category block
+            insert_at = existing.end
+            while insert_at > existing.start + 1 and _is_blank(lines[insert_at - 1]):
+                insert_at -= 1
+            if not lines[insert_at - 1].endswith('\n'):
+                lines[insert_at - 1] += '\n'
+            lines.insert(insert_at, task_line)
+        else:
+            # New category goes before the section's "---" separator
+            insert_at = len(lines)
+            for i in range(len(lines) - 1, 0, -1):
+                if lines[i].strip() == '---':
+                    insert_at = i
+                    break
+            else:
+                while insert_at > 1 and _is_blank(lines[insert_at - 1]):
+                    insert_at -= 1
+
+            block = [category_header(category) + "\n", task_line, "\n"]
+            if insert_at > 0 and not _is_blank(lines[insert_at - 1]):
+                block.insert(0, "\n")
+            if insert_at == len(lines) and lines and not lines[-1].endswith('\n'):
+                lines[-1] += '\n'
+            lines[insert_at:insert_at] = block
+
+        self._index()
+
+
+class BacklogDocument:
+    """
+    Indexed model of backlog.md
+
+    The file is parsed once into a preamble (frontmatter and intro) plus an
+    ordered list of sections. Date and carryover sections are indexed by date,
+    so lookups are dictionary hits and edits rewrite a single section.
+    Serialization joins the untouched sections back together.
+    """
+
+    def __init__(self, preamble, sections):
+        self.preamble = preamble
+        self.sections = sections
+        self._by_date = {}
+        self._by_carryover = {}
+        self._dates = []
+        self._reindex()
+
+    @classmethod
+    def parse(cls, text):
+        """Parse backlog markdown into a BacklogDocument"""
+        preamble = []
+        sections = []
+        current = preamble
+        kind = date = None
+
+        def flush():
+            if current is not preamble:
+                sections.append(BacklogSection(kind, date, current))
+
+        for line in io.StringIO(text):
+            if line.startswith('## '):
+                flush()
+                kind, date = _classify_section(line)
+                current = [line]
+            else:
+                current.append(line)
+        flush()
+
+        return cls(preamble, sections)
+
+    def to_index(self):
+        """
+        Serializable index of the document (section kinds, line counts, byte
+        sizes, categories and tasks) used by the parse cache
+        """
+        return {
+            'preamble_lines': len(self.preamble),
+            'sections': [section.to_index() for section in self.sections]
+        }
+
+    @classmethod
+    def from_index(cls, text, index):
+        """
+        Rebuild a document from its text and a cached index
+
+        Only splits the text into lines; no header or task parsing happens.
+        """
+        lines = text.split('\n')
+        tail = lines.pop()
+        lines = [line + '\n' for line in lines]
+        if tail:
+            lines.append(tail)
+
+        pos = index['preamble_lines']
+        preamble = lines[:pos]
+        sections = []
+        for section_index in index['sections']:
+            count = section_index[2]
+            sections.append(BacklogSection(
+                section_index[0], section_index[1], lines[pos:pos + count], section_index
+            ))
+            pos += count
+
+        if pos != len(lines):
+            raise ValueError("Cached index does not match backlog text")
+
+        return cls(preamble, sections)
+
+    def _reindex(self):
+        """Rebuild date lookups and line/byte spans from cached section sizes"""
+        self._by_date = {}
+        self._by_carryover = {}
+
+        line_pos = len(self.preamble)
+        byte_pos = len(''.join(self.preamble).encode('utf-8'))
+
+        for section in self.sections:
+            if section.kind == 'date':
+                self._by_date.setdefault(section.date, section)
+            elif section.kind == 'carryover':
+                self._by_carryover.setdefault(section.date, section)
+
+            section.start_line = line_pos
+            section.start_byte = byte_pos
+            line_pos += len(section.lines)
+            byte_pos += section.byte_size
+            section.end_line = line_pos
+            section.end_byte = byte_pos
+
+        # ISO dates sort chronologically as strings
+        self._dates = sorted(self._by_date)
+
+    def get_section(self, date):
+        """Return the "## YYYY-MM-DD" section for a date, or None"""
+        return self._by_date.get(date)
+
+    def sections_between(self, start, end):
+        """
+        Return the date sections from start to end (inclusive), oldest first
+
+        Args:
+            start: First date (YYYY-MM-DD)
+            end: Last date (YYYY-MM-DD)
+        """
+        lo = bisect_left(self._dates, start)
+        hi = bisect_right(self._dates, end)
+        return [self._by_date[date] for date in self._dates[lo:hi]]
+
+    def get_carryover_section(self, date):
+        """Return the "## 🔄 Backlog due from" section for a date, or None"""
+        return self._by_carryover.get(date)
+
+    def carryover_sections(self):
+        """Return all carryover sections in file order"""
+        return [s for s in self.sections if s.kind == 'carryover']
+
+    def carryover_pool(self):
+        """
+        Fingerprint index over every carryover section
+
+        Returns:
+            dict: task_fingerprint -> (section, BacklogTask), first occurrence wins
+        """
+        pool = {}
+        for section in self.carryover_sections():
+            for fingerprint, task in section.fingerprints.items():
+                pool.setdefault(fingerprint, (section, task))
+        return pool
+
+    def add_carryover_section(self, date, tasks):
+        """
+        Append a carryover section, merging tasks already in the carryover pool
+
+        Duplicates are not written again; the existing task keeps the oldest
+        "Carried over from" date of the two.
+
+        Args:
+            date: Date the tasks were carried over from (YYYY-MM-DD)
+            tasks: Dict of category -> list of (task_text, original_carryover_date)
+
+        Returns:
+            int: Number of duplicate tasks merged
+        """
+        pool = self.carryover_pool()
+        dates = {
+            fingerprint: task.carryover_date or section.date
+            for fingerprint, (section, task) in pool.items()
+        }
+        fresh, backdate, merged = dedupe_carryover_tasks(date, tasks, dates)
+
+        for fingerprint, older_date in backdate.items():
+            pool[fingerprint][0].set_carryover_date(fingerprint, older_date)
+
+        section = build_carryover_section(date, fresh)
+        if section is not None:
+            self._append_section(section)
+        self._reindex()
+        return merged
+
+    def carryover_tasks(self):
+        """Collect tasks from every carryover section (see collect_carryover_tasks)"""
+        return collect_carryover_tasks(self.carryover_sections())
+
+    def add_task(self, date, category, task):
+        """
+        Add a task to a date section, appending the section if needed
+
+        Returns:
+            bool: False if the date already has the same task (nothing added)
+        """
+        section = self._by_date.get(date)
+
+        if section is not None:
+            if section.has_task(task):
+                return False
+            section.add_task(category, task)
+        else:
+            section = BacklogSection('date', date, [
+                date_header(date) + "\n",
+                "\n",
+                category_header(category) + "\n",
+                f"- [ ] {task}\n",
+                "\n",
+                "---\n",
+                "\n",
+            ])
+            self._append_section(section)
+
+        self._reindex()
+        return True
+
+    def append_section(self, section):
+        """Append a pre-built section at the end of the document"""
+        self._append_section(section)
+        self._reindex()
+
+    def _append_section(self, section):
+        # Keep exactly one blank line between the previous block and the new header
+        previous = self.sections[-1] if self.sections else None
+        lines = previous.lines if previous else self.preamble
+        if lines and not lines[-1].endswith('\n'):
+            lines[-1] += '\n'
+        if lines and not _is_blank(lines[-1]):
+            lines.append('\n')
+        if previous:
+            previous.byte_size = len(''.join(lines).encode('utf-8'))
+        self.sections.append(section)
+
+    def remove_sections(self, predicate):
+        """
+        Drop every section matching predicate
+
+        Returns:
+            int: Number of sections removed
+        """
+        kept = []
+        removed = 0
+
+        for section in self.sections:
+            if predicate(section):
+                removed += 1
+                self._trim_seam(kept[-1] if kept else None)
+                continue
+            kept.append(section)
+
+        if removed:
+            self.sections = kept
+            self._reindex()
+        return removed
+
+    def _trim_seam(self, previous):
+        """Collapse blank lines left at the end of the block before a removed section"""
+        lines = previous.lines if previous else self.preamble
+        changed = False
+        while len(lines) >= 2 and _is_blank(lines[-1]) and _is_blank(lines[-2]):
+            lines.pop()
+            changed = True
+        if changed and previous:
+            previous._index()
+
+    def remove_date_section(self, date):
+        """Remove the section for a date. Returns True if one was removed."""
+        return self.remove_sections(lambda s: s.kind == 'date' and s.date == date) > 0
+
+    def remove_carryover_section(self, date):
+        """Remove the carryover section for a date. Returns True if one was removed."""
+        return self.remove_sections(lambda s: s.kind == 'carryover' and s.date == date) > 0
+
+    def remove_carryover_sections(self):
+        """Remove every carryover section. Returns the number removed."""
+        return self.remove_sections(lambda s: s.kind == 'carryover')
+
+    def _frontmatter_end(self):
+        """Index of the closing "---" of the frontmatter, or None"""
+        if not self.preamble or self.preamble[0].strip() != '---':
+            return None
+        for i in range(1, len(self.preamble)):
+            if self.preamble[i].strip() == '---':
+                return i
+        return None
+
+    def get_field(self, name):
+        """Return a frontmatter field value as a string, or None"""
+        end = self._frontmatter_end()
+        if end is None:
+            return None
+        prefix = f"{name}:"
+        for line in self.preamble[1:end]:
+            if line.startswith(prefix):
+                return line[len(prefix):].strip()
+        return None
+
+    def set_field(self, name, value):
+        """Set a frontmatter field, adding it before the closing "---" if missing"""
+        end = self._frontmatter_end()
+        if end is None:
+            return
+        prefix = f"{name}:"
+        for i in range(1, end):
+            if self.preamble[i].startswith(prefix):
+                self.preamble[i] = f"{name}: {value}\n"
+                break
+        else:
+            self.preamble.insert(end, f"{name}: {value}\n")
+        self._reindex()
+
+    def touch(self, timestamp=None):
+        """Update the last_updated frontmatter field"""
+        if timestamp is None:
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+        for i, line in enumerate(self.preamble):
+            if LAST_UPDATED_RE.match(line):
+                self.preamble[i] = LAST_UPDATED_RE.sub(f'last_updated: {timestamp}', line)
+                break
+        self._reindex()
+
+    def to_text(self):
+        """Serialize the document back to markdown"""
+        parts = list(self.preamble)
+        for section in self.sections:
+            parts.extend(section.lines)
+        return ''.join(parts)
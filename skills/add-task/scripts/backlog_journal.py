@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Backlog Journal
+Append-only sidecar log for backlog.md so frequent /add-task calls append one
+small record instead of rewriting the whole backlog.
+
+Records are JSON lines. Each carries a sequence number; compaction folds the
+log into backlog.md and stamps the last applied sequence into its frontmatter
+(journal_applied), so a crash between writing backlog.md and truncating the
+log never applies a record twice.
+
+Sequence numbers are a counter (one past the journal's last record, or past
+journal_applied when the journal is empty), not a clock, so a clock stepping
+backwards or a vault synced between machines can't produce a record replay
+would skip. The last record is found by reading the journal from its end, so
+an append costs the same however long the journal is.
+"""
+
+import os
+import json
+
+import vault_io
+
+
+# Compact automatically once the journal grows past this many bytes
+DEFAULT_COMPACT_THRESHOLD = 64 * 1024
+
+APPLIED_FIELD = 'journal_applied'
+
+# Bytes read per step when scanning the journal backwards for its last record
+TAIL_CHUNK = 4096
+
+
+def _record_seq(line):
+    """seq of one journal line, or None for a blank or torn line"""
+    try:
+        return json.loads(line).get('seq') if line.strip() else None
+    except (ValueError, AttributeError):
+        return None
+
+
+class BacklogJournal:
+    """Sidecar journal next to backlog.md"""
+
+    def __init__(self, backlog_file):
+        """
+        Args:
+            backlog_file: Path to backlog.md (journal lives alongside it)
+        """
+        self.backlog_file = backlog_file
+        self.path = os.path.splitext(backlog_file)[0] + ".journal"
+
+    def exists(self):
+        """Journaled mode is on while the journal file exists"""
+        return vault_io.exists(self.path)
+
+    def size(self):
+        """Journal size in bytes (0 if missing)"""
+        return vault_io.getsize(self.path)
+
+    def append(self, *records):
+        """
+        Append records in one write
+
+        Args:
+            records: Dicts with an 'op' key plus op-specific fields
+        """
+        seq = self.last_seq() or self.applied_seq()
+
+        lines = []
+        for record in records:
+            seq += 1
+            record = dict(record)
+            record['seq'] = seq
+            lines.append(json.dumps(record, ensure_ascii=False) + "\n")
+
+        vault_io.append_text(self.path, ''.join(lines))
+
+    def records(self):
+        """
+        Read all journal records in order
+
+        A torn trailing line (e.g. from a crash mid-append) is ignored.
+        """
+        if not self.exists():
+            return []
+
+        records = []
+        with vault_io.open_text(self.path) as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+        return records
+
+    def last_seq(self):
+        """
+        Sequence number of the journal's last intact record (0 if none)
+
+        Sequence numbers only grow, so the last record has the highest one.
+        """
+        if vault_io.is_pending(self.path):
+            # Written in the open batch, not on disk yet
+            return max((record.get('seq', 0) for record in self.records()), default=0)
+
+        try:
+            with open(self.path, 'rb') as f:
+                position = f.seek(0, os.SEEK_END)
+                partial = b''
+                while position > 0:
+                    start = max(0, position - TAIL_CHUNK)
+                    f.seek(start)
+                    lines = (f.read(position - start) + partial).split(b'\n')
+                    position = start
+                    # Unless at the start of the file, the first piece is the
+                    # end of an earlier line
+                    partial = lines.pop(0) if position else b''
+                    for line in reversed(lines):
+                        seq = _record_seq(line)
+                        if seq:
+                            return seq
+        except OSError:
+            pass
+        return 0
+
+    def applied_seq(self):
+        """journal_applied from backlog.md's frontmatter (0 if missing)"""
+        try:
+            with vault_io.open_text(self.backlog_file) as f:
+                if f.readline().strip() != '---':
+                    return 0
+                prefix = f"{APPLIED_FIELD}:"
+                for line in f:
+                    if line.strip() == '---':
+                        break
+                    if line.startswith(prefix):
+                        return int(line[len(prefix):].strip() or 0)
+        except (OSError, ValueError):
+            pass
+        return 0
+
+    def create(self):
+        """Turn journaled mode on"""
+        if not self.exists():
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            vault_io.write_text(self.path, '')
+
+    def truncate(self):
+        """Empty the journal after compaction (journaled mode stays on)"""
+        if self.exists():
+            vault_io.write_text(self.path, '')
+
+    def remove(self):
+        """Turn journaled mode off"""
+        vault_io.remove(self.path)
+
+
+def replay(document, records):
+    """
+    Apply journal records to a BacklogDocument in memory
+
+    Records at or below the document's journal_applied sequence were already
+    folded in by a previous compaction and are skipped.
+
+    Returns:
+        int: Highest sequence number applied (or the previous one)
+    """
+    applied = int(document.get_field(APPLIED_FIELD) or 0)
+    last = applied
+
+    for record in records:
+        seq = record.get('seq', 0)
+        if seq <= applied:
+            continue
+
+        op = record.get('op')
+        if op == 'add':
+            document.add_task(record['date'], record['category'], record['task'])
+        elif op == 'remove_date':
+            document.remove_date_section(record['date'])
+        elif op == 'remove_carryover':
+            document.remove_carryover_section(record['date'])
+        elif op == 'remove_all_carryover':
+            document.remove_carryover_sections()
+
+        last = max(last, seq)
+
+    if last > applied:
+        document.set_field(APPLIED_FIELD, last)
+
+    return last
@@ -6,50 +6,73 @@ Manages tasks added for future dates that don't have daily plans yet
 
 import sys
 import os
-from datetime import datetime
-import re
+import json
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from backlog_archive import BacklogArchive, DEFAULT_ARCHIVE_DAYS
+from backlog_journal import DEFAULT_COMPACT_THRESHOLD
+from backlog_store import backlog_paths, open_store, shard_dir
+from parse_date import parse_natural_date
+from task_categories import CATEGORY_EMOJI, CATEGORY_NAME
 
 
 class BacklogManager:
     """Manages the backlog.md file for future tasks"""
 
-    def __init__(self, vault_path):
+    def __init__(self, vault_path, store=None, compact_threshold=DEFAULT_COMPACT_THRESHOLD):
         """
         Initialize backlog manager
 
         Args:
             vault_path: Path to Obsidian vault
+            store: Storage backend (default: SQLite if DailyPlans/backlog.db
+                   exists, month shards if DailyPlans/backlog/ exists,
+                   otherwise backlog.md)
+            compact_threshold: Journal size in bytes that triggers compaction
+                               (only used in journaled markdown mode)
         """
         self.vault_path = vault_path
-        self.backlog_file = os.path.join(vault_path, "DailyPlans", "backlog.md")
+        self.backlog_file, self.db_file = backlog_paths(vault_path)
+        self.store = store or open_store(vault_path, compact_threshold)
+
+    @property
+    def journaled(self):
+        """True when writes are appended to DailyPlans/backlog.journal"""
+        return self.store.journaled
 
     def ensure_backlog_exists(self):
         """Create backlog file if it doesn't exist"""
-        if not os.path.exists(self.backlog_file):
-            # Create directory if needed
-            os.makedirs(os.path.dirname(self.backlog_file), exist_ok=True)
-
-            # Create initial backlog file
-            initial_content = """---
-title: Task Backlog
-description: Tasks scheduled for dates without daily plans yet
-last_updated: {timestamp}
----
-
-# Task Backlog
-
-Tasks added for future dates are stored here until their daily plans are created.
+        if self.store.ensure_exists():
+            print(f"[*] Created backlog file: {self.backlog_file}")
 
-When you run `/plan-my-day` for a date, tasks from this backlog will be automatically added to that day's plan.
+    def load_document(self):
+        """
+        Parse the current backlog into a BacklogDocument
 
----
+        Returns:
+            BacklogDocument: Indexed model of the backlog
+        """
+        self.ensure_backlog_exists()
+        return self.store.load_document()
 
-""".format(timestamp=datetime.now().strftime("%Y-%m-%d %H:%M"))
+    def compact(self):
+        """
+        Fold the journal back into backlog.md
 
-            with open(self.backlog_file, 'w', encoding='utf-8') as f:
-                f.write(initial_content)
+        Returns:
+            bool: True if there was anything to compact
+        """
+        try:
+            record_count = self.store.compact()
+            if record_count:
+                print(f"[OK] Compacted {record_count} journal record(s) into backlog")
+            return record_count > 0
 
-            print(f"[*] Created backlog file: {self.backlog_file}")
+        except Exception as e:
+            print(f"[ERROR] Failed to compact backlog journal: {e}")
+            return False
 
     def add_task(self, date, category, task):
         """
@@ -63,188 +86,219 @@ When you run `/plan-my-day` for a date, tasks from this backlog will be automati
         Returns:
             bool: Success status
         """
-        self.ensure_backlog_exists()
-
         try:
-            # Read existing backlog
-            with open(self.backlog_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            # Validate the date before touching the file
+            datetime.strptime(date, "%Y-%m-%d")
 
-            # Parse date to get day name
-            date_obj = datetime.strptime(date, "%Y-%m-%d")
-            day_name = date_obj.strftime("%A")
+            self.ensure_backlog_exists()
+            if not self.store.add_tasks([(date, category, task)])[0]:
+                print(f"[*] Task already in backlog for {date}, skipped")
+                return True
 
-            # Check if date section exists
-            date_header = f"## {date} ({day_name})"
+            print(f"[OK] Task added to backlog for {date}")
+            return True
 
-            if date_header not in content:
-                # Add new date section at the end
-                new_section = f"""
-{date_header}
+        except Exception as e:
+            print(f"[ERROR] Failed to add task to backlog: {e}")
+            return False
 
-### {self._category_emoji(category)} {self._category_name(category)}
-- [ ] {task}
+    def add_tasks(self, tasks):
+        """
+        Add many tasks to the backlog in a single read/modify/write cycle
 
----
+        Args:
+            tasks: Iterable of (date, category, task) tuples or dicts with
+                   'date', 'category' and 'task' keys
 
-"""
-                content += new_section
-            else:
-                # Date section exists, check if category exists
-                category_header = f"### {self._category_emoji(category)} {self._category_name(category)}"
+        Tasks already in the backlog for their date succeed without being
+        written again and are flagged as duplicates.
 
-                # Find the date section
-                date_pos = content.find(date_header)
-                next_date_pos = content.find("\n## ", date_pos + 1)
-                if next_date_pos == -1:
-                    next_date_pos = len(content)
+        Returns:
+            list: One result dict per input task:
+                  {'date', 'category', 'task', 'success', 'duplicate', 'error'}
+        """
+        results = []
+        valid = []
+        valid_results = []
+
+        for item in tasks:
+            try:
+                date, category, task = self._unpack_task(item)
+                datetime.strptime(date, "%Y-%m-%d")
+                if category not in CATEGORY_NAME:
+                    raise ValueError(f"Invalid category: {category}")
+                if not task:
+                    raise ValueError("Empty task description")
+
+                valid.append((date, category, task))
+                results.append(self._batch_result(item, True))
+                valid_results.append(results[-1])
+
+            except Exception as e:
+                results.append(self._batch_result(item, False, str(e)))
+
+        added = 0
+
+        if valid:
+            try:
+                self.ensure_backlog_exists()
+                for result, was_added in zip(valid_results, self.store.add_tasks(valid)):
+                    result['duplicate'] = not was_added
+                    added += was_added
+            except Exception as e:
+                print(f"[ERROR] Failed to write backlog: {e}")
+                for result in results:
+                    if result['success']:
+                        result['success'] = False
+                        result['error'] = str(e)
+                return results
+
+        duplicates = len(valid) - added
+        if duplicates:
+            print(f"[OK] Added {added} of {len(results)} task(s) to backlog ({duplicates} duplicate(s) skipped)")
+        else:
+            print(f"[OK] Added {added} of {len(results)} task(s) to backlog")
+        return results
 
-                date_section = content[date_pos:next_date_pos]
+    def _unpack_task(self, item):
+        """Normalize a batch item to (date, category, task)"""
+        if isinstance(item, dict):
+            return item.get('date'), item.get('category'), (item.get('task') or '').strip()
 
-                if category_header in date_section:
-                    # Category exists, add task to it
-                    category_pos = content.find(category_header, date_pos)
-                    # Find next section or end
-                    next_section = content.find("\n###", category_pos + 1)
-                    if next_section == -1 or next_section > next_date_pos:
-                        next_section = next_date_pos
+        date, category, task = item
+        return date, category, (task or '').strip()
 
-                    # Insert task before next section
-                    new_task = f"- [ ] {task}\n"
+    def _batch_result(self, item, success, error=None):
+        """Build a per-task result for add_tasks"""
+        try:
+            date, category, task = self._unpack_task(item)
+        except Exception:
+            date = category = task = None
+
+        return {
+            'date': date,
+            'category': category,
+            'task': task,
+            'success': success,
+            'duplicate': False,
+            'error': error
+        }
 
-                    content = content[:next_section] + new_task + "\n" + content[next_section:]
-                else:
-                    # Category doesn't exist, add it before the --- separator
-                    separator_pos = content.find("---", date_pos)
-                    if separator_pos == -1 or separator_pos > next_date_pos:
-                        # No separator, add before next date section
-                        separator_pos = next_date_pos
+    def get_tasks_for_date(self, date):
+        """
+        Get all tasks for a specific date from backlog
 
-                    new_category = f"""
-{category_header}
-- [ ] {task}
+        Args:
+            date: Date in YYYY-MM-DD format
 
-"""
-                    content = content[:separator_pos] + new_category + content[separator_pos:]
+        Returns:
+            dict: Tasks organized by category
+        """
+        try:
+            datetime.strptime(date, "%Y-%m-%d")
 
-            # Update last_updated timestamp
-            content = re.sub(
-                r'last_updated: .*',
-                f'last_updated: {datetime.now().strftime("%Y-%m-%d %H:%M")}',
-                content
-            )
+            self.ensure_backlog_exists()
+            return self.store.get_tasks_for_date(date)
 
-            # Write back
-            with open(self.backlog_file, 'w', encoding='utf-8') as f:
-                f.write(content)
+        except Exception as e:
+            print(f"[ERROR] Failed to read backlog: {e}")
+            return {}
 
-            print(f"[OK] Task added to backlog for {date}")
-            return True
+    def get_tasks_between(self, start, end):
+        """
+        Get tasks for every backlog date from start to end (inclusive)
+
+        Args:
+            start: First date in YYYY-MM-DD format
+            end: Last date in YYYY-MM-DD format
+
+        Returns:
+            dict: {date: tasks by category}, in date order (dates without
+                  tasks are omitted)
+        """
+        try:
+            datetime.strptime(start, "%Y-%m-%d")
+            datetime.strptime(end, "%Y-%m-%d")
+
+            self.ensure_backlog_exists()
+            return self.store.get_tasks_between(start, end)
 
         except Exception as e:
-            print(f"[ERROR] Failed to add task to backlog: {e}")
-            return False
+            print(f"[ERROR] Failed to read backlog: {e}")
+            return {}
 
-    def get_tasks_for_date(self, date):
+    def next_n_days(self, n, today=None):
         """
-        Get all tasks for a specific date from backlog
+        Get backlog tasks for the next n days, starting today
 
         Args:
-            date: Date in YYYY-MM-DD format
+            n: Number of days (including today)
+            today: Start date in YYYY-MM-DD format (default: today)
 
         Returns:
-            dict: Tasks organized by category
+            dict: {date: tasks by category}, in date order
         """
-        self.ensure_backlog_exists()
+        start = datetime.strptime(today, "%Y-%m-%d") if today else datetime.now()
+        end = start + timedelta(days=max(n, 1) - 1)
+        return self.get_tasks_between(start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d"))
 
+    def get_carryover_tasks(self):
+        """
+        Get all carryover tasks (from "Backlog due from" sections)
+
+        Returns:
+            dict: Tasks by category with their original carryover dates,
+                  e.g. {'focus': [('task text', '2026-02-09')]}
+        """
         try:
-            with open(self.backlog_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Parse date to get day name
-            date_obj = datetime.strptime(date, "%Y-%m-%d")
-            day_name = date_obj.strftime("%A")
-            date_header = f"## {date} ({day_name})"
-
-            if date_header not in content:
-                return {}  # No tasks for this date
-
-            # Extract the date section
-            date_pos = content.find(date_header)
-            next_date_pos = content.find("\n## ", date_pos + 1)
-            if next_date_pos == -1:
-                next_date_pos = len(content)
-
-            date_section = content[date_pos:next_date_pos]
-
-            # Parse tasks by category
-            tasks = {}
-            current_category = None
-
-            for line in date_section.split('\n'):
-                if line.startswith('### '):
-                    # Category header
-                    for cat in ['email', 'message', 'reading', 'learning', 'work', 'other']:
-                        if cat in line.lower() or self._category_name(cat).lower() in line.lower():
-                            current_category = cat
-                            tasks[cat] = []
-                            break
-                elif line.strip().startswith('- [ ]') and current_category:
-                    # Task line
-                    task_text = line.strip()[6:].strip()  # Remove "- [ ] "
-                    tasks[current_category].append(task_text)
-
-            return tasks
+            self.ensure_backlog_exists()
+            return self.store.get_carryover_tasks()
 
         except Exception as e:
-            print(f"[ERROR] Failed to read backlog: {e}")
+            print(f"[ERROR] Failed to get carryover tasks: {e}")
             return {}
 
-    def remove_tasks_for_date(self, date):
+    def take_tasks_for_date(self, date, remove=False):
         """
-        Remove all tasks for a specific date from backlog
-        (Called after tasks are moved to daily plan)
+        Get a date's tasks plus all carryover tasks with a single backlog read
 
         Args:
             date: Date in YYYY-MM-DD format
+            remove: Also remove the date's tasks and ALL carryover sections
+                    (called once the daily plan has been written); the pruned
+                    backlog is written once
 
         Returns:
-            bool: Success status
+            tuple: (tasks by category, carryover tasks by category as
+                    (task_text, carryover_date) tuples)
         """
+        datetime.strptime(date, "%Y-%m-%d")
+
         self.ensure_backlog_exists()
+        tasks, carryover_tasks = self.store.take_tasks_for_date(date, remove=remove)
 
-        try:
-            with open(self.backlog_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+        if remove and (tasks or carryover_tasks):
+            print(f"[OK] Removed tasks for {date} and all carryover sections from backlog")
 
-            # Parse date to get day name
-            date_obj = datetime.strptime(date, "%Y-%m-%d")
-            day_name = date_obj.strftime("%A")
-            date_header = f"## {date} ({day_name})"
+        return tasks, carryover_tasks
 
-            if date_header not in content:
-                return True  # Nothing to remove
+    def remove_tasks_for_date(self, date):
+        """
+        Remove all tasks for a specific date from backlog
+        (Called after tasks are moved to daily plan)
 
-            # Find and remove the date section
-            date_pos = content.find(date_header)
-            next_date_pos = content.find("\n## ", date_pos + 1)
-            if next_date_pos == -1:
-                # Last section
-                content = content[:date_pos]
-            else:
-                # Remove section including the separator
-                content = content[:date_pos] + content[next_date_pos:]
+        Args:
+            date: Date in YYYY-MM-DD format
 
-            # Update last_updated timestamp
-            content = re.sub(
-                r'last_updated: .*',
-                f'last_updated: {datetime.now().strftime("%Y-%m-%d %H:%M")}',
-                content
-            )
+        Returns:
+            bool: Success status
+        """
+        try:
+            datetime.strptime(date, "%Y-%m-%d")
 
-            # Write back
-            with open(self.backlog_file, 'w', encoding='utf-8') as f:
-                f.write(content)
+            self.ensure_backlog_exists()
+            if not self.store.remove_date(date):
+                return True  # Nothing to remove
 
             print(f"[OK] Removed tasks for {date} from backlog")
             return True
@@ -264,42 +318,13 @@ When you run `/plan-my-day` for a date, tasks from this backlog will be automati
         Returns:
             bool: Success status
         """
-        self.ensure_backlog_exists()
-
         try:
-            with open(self.backlog_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Parse date to get day name
-            date_obj = datetime.strptime(date, "%Y-%m-%d")
-            day_name = date_obj.strftime("%A")
-            carryover_header = f"## 🔄 Backlog due from {date} ({day_name})"
+            datetime.strptime(date, "%Y-%m-%d")
 
-            if carryover_header not in content:
+            self.ensure_backlog_exists()
+            if not self.store.remove_carryover(date):
                 return True  # Nothing to remove
 
-            # Find and remove the carryover section
-            carryover_pos = content.find(carryover_header)
-            next_section_pos = content.find("\n## ", carryover_pos + 1)
-
-            if next_section_pos == -1:
-                # Last section - remove everything from carryover_header to end
-                content = content[:carryover_pos].rstrip() + "\n"
-            else:
-                # Remove section up to next section
-                content = content[:carryover_pos] + content[next_section_pos + 1:]
-
-            # Update last_updated timestamp
-            content = re.sub(
-                r'last_updated: .*',
-                f'last_updated: {datetime.now().strftime("%Y-%m-%d %H:%M")}',
-                content
-            )
-
-            # Write back
-            with open(self.backlog_file, 'w', encoding='utf-8') as f:
-                f.write(content)
-
             print(f"[OK] Removed carryover section for {date} from backlog")
             return True
 
@@ -315,49 +340,9 @@ When you run `/plan-my-day` for a date, tasks from this backlog will be automati
         Returns:
             int: Number of carryover sections removed
         """
-        self.ensure_backlog_exists()
-
         try:
-            with open(self.backlog_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            lines = content.split('\n')
-            new_lines = []
-            in_carryover = False
-            sections_removed = 0
-
-            for line in lines:
-                # Check if we're entering a carryover section
-                if line.startswith('## 🔄 Backlog due from'):
-                    in_carryover = True
-                    sections_removed += 1
-                    continue  # Skip this line
-
-                # Check if we're leaving carryover and entering a new section
-                elif line.startswith('## ') and not line.startswith('###'):
-                    in_carryover = False
-                    new_lines.append(line)
-
-                # Only keep lines if we're not in a carryover section
-                elif not in_carryover:
-                    new_lines.append(line)
-
-            # Rejoin content
-            content = '\n'.join(new_lines)
-
-            # Clean up extra blank lines
-            content = re.sub(r'\n{3,}', '\n\n', content)
-
-            # Update last_updated timestamp
-            content = re.sub(
-                r'last_updated: .*',
-                f'last_updated: {datetime.now().strftime("%Y-%m-%d %H:%M")}',
-                content
-            )
-
-            # Write back
-            with open(self.backlog_file, 'w', encoding='utf-8') as f:
-                f.write(content)
+            self.ensure_backlog_exists()
+            sections_removed = self.store.remove_all_carryover()
 
             if sections_removed > 0:
                 print(f"[OK] Removed {sections_removed} carryover section(s) from backlog")
@@ -368,33 +353,223 @@ When you run `/plan-my-day` for a date, tasks from this backlog will be automati
             print(f"[ERROR] Failed to remove carryover sections from backlog: {e}")
             return 0
 
+    def add_carryover_section(self, date, tasks):
+        """
+        Add unchecked tasks under a "Backlog due from <date>" section
+
+        Tasks already waiting in another carryover section are merged into it,
+        keeping the oldest "Carried over from" date.
+
+        Args:
+            date: Date in YYYY-MM-DD format the tasks are carried over from
+            tasks: Dict of category -> list of (task_text, original_carryover_date)
+
+        Returns:
+            int or None: Number of tasks written to the section (merged
+                         duplicates aren't counted), or None if the section
+                         already exists or the write failed
+        """
+        return self.add_carryover_sections([(date, tasks)])[0]
+
+    def add_carryover_sections(self, sections):
+        """
+        Add several "Backlog due from <date>" sections with one backlog write
+        (used to catch up on missed end-of-day cleanups)
+
+        Args:
+            sections: List of (date, tasks) pairs, oldest first; tasks as in
+                      add_carryover_section
+
+        Returns:
+            list: Per section, the number of tasks written (merged duplicates
+                  aren't counted), or None if it already exists or the write
+                  failed
+        """
+        try:
+            for date, _ in sections:
+                datetime.strptime(date, "%Y-%m-%d")
+
+            self.ensure_backlog_exists()
+            results = self.store.add_carryover_sections(sections)
+
+        except Exception as e:
+            print(f"[ERROR] Failed to add tasks to backlog: {e}")
+            return [None] * len(sections)
+
+        merged = 0
+        written = []
+        for (date, tasks), result in zip(sections, results):
+            if result is None:
+                print(f"[!] Warning: Carryover section for {date} already exists")
+                written.append(None)
+            else:
+                merged += result
+                written.append(sum(len(task_list) for task_list in tasks.values()) - result)
+
+        if merged:
+            print(f"[*] Merged {merged} task(s) already waiting in the carryover backlog")
+        return written
+
+    def archive_stale_sections(self, horizon_days=DEFAULT_ARCHIVE_DAYS, today=None):
+        """
+        Move date and carryover sections older than the horizon into
+        DailyPlans/archive/backlog-YYYY-MM.md.gz
+
+        Sections are written to the archive before they are removed from the
+        backlog, so an interrupted run can duplicate but never lose a section.
+
+        Args:
+            horizon_days: Archive sections dated more than this many days ago
+            today: Reference date in YYYY-MM-DD format (default: today)
+
+        Returns:
+            int: Number of sections archived
+        """
+        try:
+            reference = datetime.strptime(today, "%Y-%m-%d") if today else datetime.now()
+            cutoff = (reference - timedelta(days=horizon_days)).strftime("%Y-%m-%d")
+
+            self.ensure_backlog_exists()
+            sections = self.store.stale_sections(cutoff)
+            if not sections:
+                return 0
+
+            archive = BacklogArchive(self.vault_path)
+            archive.append(sections)
+            self.store.remove_before(cutoff)
+
+            print(f"[OK] Archived {len(sections)} backlog section(s) dated before {cutoff} to {archive.directory}")
+            carried = 0
+            for section in sections:
+                count = sum(len(category.tasks) for category in section.categories.values())
+                if section.kind == 'carryover':
+                    carried += count
+                    print(f"  - Backlog due from {section.date}: {count} task(s)")
+                else:
+                    print(f"  - {section.date}: {count} task(s)")
+            if carried:
+                print(f"[!] {carried} unfinished carried-over task(s) will no longer appear in daily plans; "
+                      f"view them with: backlog_manager.py archive-show <vault_path> YYYY-MM")
+            return len(sections)
+
+        except Exception as e:
+            print(f"[ERROR] Failed to archive backlog sections: {e}")
+            return 0
+
+    def migrate_to_sqlite(self):
+        """
+        Import the current backlog.md into DailyPlans/backlog.db
+
+        After migration every BacklogManager for this vault uses SQLite and
+        backlog.md becomes a rendered view.
+
+        Returns:
+            int: Number of tasks imported, or -1 on failure
+        """
+        try:
+            from backlog_sqlite import SQLiteBacklogStore
+
+            document = self.load_document()
+            store = SQLiteBacklogStore(self.db_file, self.backlog_file)
+            count = store.import_document(document)
+
+            if getattr(self.store, 'journal', None) is not None:
+                self.store.journal.remove()
+            self.store = store
+
+            print(f"[OK] Migrated {count} task(s) to {self.db_file}")
+            return count
+
+        except Exception as e:
+            print(f"[ERROR] Failed to migrate backlog to SQLite: {e}")
+            return -1
+
+    def migrate_to_shards(self):
+        """
+        Split the current backlog.md into DailyPlans/backlog/YYYY-MM.md month
+        shards plus DailyPlans/backlog/carryover.md
+
+        The original file is kept as backlog.md.bak. After migration every
+        BacklogManager for this vault uses the shards.
+
+        Returns:
+            int: Number of tasks migrated, or -1 on failure
+        """
+        if self.store.name != 'markdown':
+            print(f"[ERROR] Only a single backlog.md can be sharded (store is {self.store.name})")
+            return -1
+
+        try:
+            from backlog_shards import ShardedBacklogStore
+
+            document = self.load_document()
+            store = ShardedBacklogStore(shard_dir(self.vault_path), self.store.compact_threshold)
+            count, shard_count = store.import_document(document)
+
+            os.replace(self.backlog_file, self.backlog_file + '.bak')
+            self.store.journal.remove()
+            self.store.cache.invalidate()
+            self.store = store
+
+            print(f"[OK] Migrated {count} task(s) into {shard_count} shard(s) in {store.directory}")
+            print(f"[*] Original backlog kept as {self.backlog_file}.bak")
+            return count
+
+        except Exception as e:
+            print(f"[ERROR] Failed to shard backlog: {e}")
+            try:
+                # Don't leave an empty DailyPlans/backlog/ behind: it would switch the vault to shards
+                os.rmdir(shard_dir(self.vault_path))
+            except OSError:
+                pass
+            return -1
+
     def _category_emoji(self, category):
         """Get emoji for category"""
-        emoji_map = {
-            'focus': '🧠',
-            'comms': '💬',
-            'learning': '🎓',
-            'work': '💼',
-            'email': '📧',
-            'message': '💬',
-            'reading': '📚',
-            'other': '📋'
-        }
-        return emoji_map.get(category, '📋')
+        return CATEGORY_EMOJI.get(category, '📋')
 
     def _category_name(self, category):
         """Get display name for category"""
-        name_map = {
-            'focus': 'Focus Work',
-            'comms': 'Communications',
-            'learning': 'Learning & Development',
-            'work': 'Work Tasks',
-            'email': 'Emails',
-            'message': 'Messages',
-            'reading': 'Reading & Learning',
-            'other': 'Other Tasks'
-        }
-        return name_map.get(category, 'Tasks')
+        return CATEGORY_NAME.get(category, 'Tasks')
+
+
+def read_batch(stream):
+    """
+    Read batch tasks from JSONL or TSV
+
+    Each non-blank line is either a JSON object with date/category/task keys
+    or a tab-separated "date<TAB>category<TAB>task" row. Dates may be given in
+    any format parse_date.py understands.
+
+    Returns:
+        tuple: (list of task dicts, list of (line_number, error) tuples)
+    """
+    tasks = []
+    errors = []
+
+    for line_no, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+
+        try:
+            if line.startswith('{'):
+                item = json.loads(line)
+            else:
+                fields = line.split('\t', 2)
+                if len(fields) != 3:
+                    raise ValueError("Expected date<TAB>category<TAB>task")
+                item = {'date': fields[0], 'category': fields[1], 'task': fields[2]}
+
+            date = str(item.get('date') or '').strip()
+            item['date'] = parse_natural_date(date) or date
+            item['category'] = str(item.get('category') or '').strip().lower()
+            tasks.append(item)
+
+        except Exception as e:
+            errors.append((line_no, str(e)))
+
+    return tasks, errors
 
 
 def main():
@@ -403,7 +578,16 @@ def main():
         print("Usage:")
         print("  python backlog_manager.py add <vault_path> <date> <category> <task>")
         print("  python backlog_manager.py get <vault_path> <date>")
+        print("  python backlog_manager.py range <vault_path> <start_date> <end_date>")
+        print("  python backlog_manager.py next <vault_path> <days>")
         print("  python backlog_manager.py remove <vault_path> <date>")
+        print("  python backlog_manager.py add-batch <vault_path> < tasks.jsonl|tasks.tsv")
+        print("  python backlog_manager.py journal <vault_path> on|off")
+        print("  python backlog_manager.py compact <vault_path>")
+        print("  python backlog_manager.py migrate-sqlite <vault_path>")
+        print("  python backlog_manager.py migrate-shards <vault_path>")
+        print("  python backlog_manager.py archive <vault_path> [days]")
+        print("  python backlog_manager.py archive-show <vault_path> [YYYY-MM]")
         sys.exit(1)
 
     command = sys.argv[1]
@@ -431,11 +615,94 @@ def main():
             print(f"No tasks found for {date}")
         sys.exit(0)
 
+    elif command in ("range", "next"):
+        if command == "range":
+            start = parse_natural_date(sys.argv[3]) or sys.argv[3]
+            end = parse_natural_date(sys.argv[4]) or sys.argv[4]
+            by_date = manager.get_tasks_between(start, end)
+        else:
+            by_date = manager.next_n_days(int(sys.argv[3]))
+
+        if not by_date:
+            print("No tasks found in range")
+        for date, tasks in by_date.items():
+            print(f"\n{date}:")
+            for category, task_list in tasks.items():
+                print(f"  {category.upper()}:")
+                for task in task_list:
+                    print(f"    - {task}")
+        sys.exit(0)
+
     elif command == "remove":
         date = sys.argv[3]
         success = manager.remove_tasks_for_date(date)
         sys.exit(0 if success else 1)
 
+    elif command == "add-batch":
+        tasks, parse_errors = read_batch(sys.stdin)
+        results = manager.add_tasks(tasks) if tasks else []
+
+        for result in results:
+            if result['duplicate']:
+                print(f"[*] {result['date']} {result['category']}: {result['task']} (already in backlog)")
+            elif result['success']:
+                print(f"[OK] {result['date']} {result['category']}: {result['task']}")
+            else:
+                print(f"[ERROR] {result['date']} {result['category']}: {result['task']} ({result['error']})")
+        for line_no, error in parse_errors:
+            print(f"[ERROR] Line {line_no}: {error}")
+
+        succeeded = sum(1 for r in results if r['success'])
+        duplicates = sum(1 for r in results if r['duplicate'])
+        failed = len(parse_errors) + len(results) - succeeded
+        print(f"\n[*] {succeeded - duplicates} added, {duplicates} duplicate(s) skipped, {failed} failed")
+        sys.exit(0 if failed == 0 else 1)
+
+    elif command == "journal":
+        mode = sys.argv[3] if len(sys.argv) > 3 else ""
+        journal = getattr(manager.store, 'journal', None)
+        if journal is None and mode in ("on", "off"):
+            print(f"[ERROR] The {manager.store.name} backlog store has no journal")
+            sys.exit(1)
+        if mode == "on":
+            journal.create()
+            print(f"[OK] Journaled mode enabled: {journal.path}")
+        elif mode == "off":
+            manager.compact()
+            journal.remove()
+            print("[OK] Journaled mode disabled")
+        else:
+            print(f"[*] Journaled mode is {'on' if manager.journaled else 'off'}")
+        sys.exit(0)
+
+    elif command == "compact":
+        manager.compact()
+        sys.exit(0)
+
+    elif command == "migrate-sqlite":
+        count = manager.migrate_to_sqlite()
+        sys.exit(0 if count >= 0 else 1)
+
+    elif command == "archive":
+        days = int(sys.argv[3]) if len(sys.argv) > 3 else DEFAULT_ARCHIVE_DAYS
+        count = manager.archive_stale_sections(days)
+        if count == 0:
+            print(f"[*] No backlog sections older than {days} days")
+        sys.exit(0)
+
+    elif command == "archive-show":
+        archive = BacklogArchive(vault_path)
+        if len(sys.argv) > 3:
+            print(archive.read_text(sys.argv[3]) or f"No archive for {sys.argv[3]}")
+        else:
+            months = archive.months()
+            print("Archived months: " + (", ".join(months) if months else "none"))
+        sys.exit(0)
+
+    elif command == "migrate-shards":
+        count = manager.migrate_to_shards()
+        sys.exit(0 if count >= 0 else 1)
+
     else:
         print(f"Unknown command: {command}")
         sys.exit(1)
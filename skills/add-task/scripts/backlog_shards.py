@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Sharded Backlog Store
+Splits the backlog into one markdown file per month plus a carryover file:
+
+    DailyPlans/backlog/2026-03.md      Dated sections for March 2026
+    DailyPlans/backlog/carryover.md    "Backlog due from" sections (and any
+                                       hand-written sections)
+
+Every operation opens only the shard it needs, so adding a task for next
+March never reads or rewrites this week's carryover. Each shard is a regular
+MarkdownBacklogStore and keeps its own parse cache.
+
+Split an existing backlog.md with:
+    python backlog_manager.py migrate-shards <vault_path>
+"""
+
+import io
+import os
+import re
+
+import vault_io
+from backlog_document import BacklogDocument, new_backlog_text
+from backlog_journal import DEFAULT_COMPACT_THRESHOLD
+from backlog_store import MarkdownBacklogStore
+
+
+CARRYOVER_SHARD = "carryover.md"
+
+MONTH_SHARD_RE = re.compile(r'^(\d{4}-\d{2})\.md$')
+
+
+class ShardedBacklogStore:
+    """Month-sharded markdown files as the system of record"""
+
+    name = 'sharded'
+    journaled = False
+
+    def __init__(self, directory, compact_threshold=DEFAULT_COMPACT_THRESHOLD):
+        """
+        Args:
+            directory: DailyPlans/backlog/ directory holding the shards
+            compact_threshold: Passed through to each shard's store
+        """
+        self.directory = directory
+        self.compact_threshold = compact_threshold
+
+    def _month_shard(self, date):
+        """Store for the shard holding a YYYY-MM-DD date"""
+        month = date[:7]
+        return MarkdownBacklogStore(
+            os.path.join(self.directory, f"{month}.md"),
+            self.compact_threshold,
+            title=f"Task Backlog {month}"
+        )
+
+    def _carryover_shard(self):
+        return MarkdownBacklogStore(
+            os.path.join(self.directory, CARRYOVER_SHARD),
+            self.compact_threshold,
+            title="Task Backlog Carryover"
+        )
+
+    def _month_shards(self):
+        """Stores for every existing month shard, oldest first"""
+        try:
+            names = sorted(os.listdir(self.directory))
+        except OSError:
+            return []
+        return [self._month_shard(m.group(1) + "-01") for m in map(MONTH_SHARD_RE.match, names) if m]
+
+    def _existing(self, store):
+        """Return the store if its file exists, so reads never create empty shards"""
+        return store if vault_io.exists(store.backlog_file) else None
+
+    def ensure_exists(self):
+        """
+        Create the shard directory (shard files are created on first write)
+
+        Returns:
+            bool: Always False; there is no single backlog file to create
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        return False
+
+    def load_document(self):
+        """
+        Combine every shard into one read-only BacklogDocument
+
+        Month shards come first in date order, then the carryover shard.
+
+        Returns:
+            BacklogDocument: Current view of the whole backlog
+        """
+        sections = []
+        for store in self._month_shards() + [self._existing(self._carryover_shard())]:
+            if store is not None:
+                sections.extend(store.load_document().sections)
+
+        preamble = list(io.StringIO(new_backlog_text()))
+        return BacklogDocument(preamble, sections)
+
+    def compact(self):
+        """
+        Fold any per-shard journals back into their shards
+
+        Returns:
+            int: Number of journal records compacted
+        """
+        stores = self._month_shards() + [self._existing(self._carryover_shard())]
+        return sum(store.compact() for store in stores if store is not None)
+
+    def add_tasks(self, tasks):
+        """
+        Add validated tasks, writing each affected month shard once
+
+        Args:
+            tasks: List of (date, category, task) tuples
+
+        Returns:
+            list: One bool per task, False for skipped duplicates
+        """
+        by_month = {}
+        for i, (date, category, task) in enumerate(tasks):
+            by_month.setdefault(date[:7], []).append((i, (date, category, task)))
+
+        added = [False] * len(tasks)
+        for month_tasks in by_month.values():
+            store = self._month_shard(month_tasks[0][1][0])
+            results = store.add_tasks([task for _, task in month_tasks])
+            for (i, _), result in zip(month_tasks, results):
+                added[i] = result
+        return added
+
+    def get_tasks_for_date(self, date):
+        """Return {category: [task_text, ...]} for a date"""
+        store = self._existing(self._month_shard(date))
+        return store.get_tasks_for_date(date) if store else {}
+
+    def get_tasks_between(self, start, end):
+        """
+        Return {date: {category: [task_text, ...]}} from start to end
+        (inclusive), reading only the month shards in range
+        """
+        result = {}
+        for store in self._month_shards():
+            month = os.path.basename(store.backlog_file)[:7]
+            if start[:7] <= month <= end[:7]:
+                result.update(store.get_tasks_between(start, end))
+        return result
+
+    def get_carryover_tasks(self):
+        """Return {category: [(task_text, carryover_date), ...]} across carryover sections"""
+        store = self._existing(self._carryover_shard())
+        return store.get_carryover_tasks() if store else {}
+
+    def take_tasks_for_date(self, date, remove=False):
+        """
+        Read a date's tasks and all carryover tasks
+
+        Only the date's month shard and the carryover shard are opened.
+
+        Args:
+            date: Date in YYYY-MM-DD format
+            remove: Also drop the date section and every carryover section
+
+        Returns:
+            tuple: ({category: [task_text]}, {category: [(task_text, carryover_date)]})
+        """
+        tasks = {}
+        carryover_tasks = {}
+
+        month_store = self._existing(self._month_shard(date))
+        if month_store is not None:
+            tasks, _ = month_store.take_tasks_for_date(date, remove=remove)
+
+        carryover_store = self._existing(self._carryover_shard())
+        if carryover_store is not None:
+            _, carryover_tasks = carryover_store.take_tasks_for_date(date, remove=remove)
+
+        return tasks, carryover_tasks
+
+    def remove_date(self, date):
+        """
+        Remove a date section from its month shard
+
+        Returns:
+            bool: True if a section was removed
+        """
+        store = self._existing(self._month_shard(date))
+        return store.remove_date(date) if store else False
+
+    def remove_carryover(self, date):
+        """
+        Remove the carryover section for a date
+
+        Returns:
+            bool: True if a section was removed
+        """
+        store = self._existing(self._carryover_shard())
+        return store.remove_carryover(date) if store else False
+
+    def remove_all_carryover(self):
+        """
+        Remove every carryover section
+
+        Returns:
+            int: Number of sections removed
+        """
+        store = self._existing(self._carryover_shard())
+        return store.remove_all_carryover() if store else 0
+
+    def add_carryover_section(self, date, tasks):
+        """
+        Append a "Backlog due from <date>" section to the carryover shard
+
+        Returns:
+            int or None: Number of duplicates merged, or None if a carryover
+                         section for the date already exists
+        """
+        return self._carryover_shard().add_carryover_section(date, tasks)
+
+    def add_carryover_sections(self, sections):
+        """
+        Append several carryover sections to the carryover shard in one write
+
+        Returns:
+            list: Per section, the number of duplicates merged or None if a
+                  carryover section for that date already exists
+        """
+        return self._carryover_shard().add_carryover_sections(sections)
+
+    def _stale_shards(self, cutoff):
+        """Month shards that can hold sections before cutoff, plus the carryover shard"""
+        stores = [
+            store for store in self._month_shards()
+            if os.path.basename(store.backlog_file)[:7] <= cutoff[:7]
+        ]
+        carryover_store = self._existing(self._carryover_shard())
+        if carryover_store is not None:
+            stores.append(carryover_store)
+        return stores
+
+    def stale_sections(self, cutoff):
+        """Return date and carryover sections dated before cutoff (YYYY-MM-DD)"""
+        sections = []
+        for store in self._stale_shards(cutoff):
+            sections.extend(store.stale_sections(cutoff))
+        return sections
+
+    def remove_before(self, cutoff):
+        """
+        Remove date and carryover sections dated before cutoff
+
+        Returns:
+            int: Number of sections removed
+        """
+        return sum(store.remove_before(cutoff) for store in self._stale_shards(cutoff))
+
+    def import_document(self, document):
+        """
+        Split a parsed backlog.md into shards
+
+        Dated sections go to their month shard; carryover and any other
+        sections go to the carryover shard. Each shard is written once.
+
+        Args:
+            document: BacklogDocument to split
+
+        Returns:
+            tuple: (number of tasks imported, number of shard files written)
+        """
+        self.ensure_exists()
+        if any(MONTH_SHARD_RE.match(n) or n == CARRYOVER_SHARD for n in os.listdir(self.directory)):
+            raise ValueError(f"{self.directory} already contains backlog shards")
+
+        groups = {}
+        count = 0
+        for section in document.sections:
+            if section.kind == 'date':
+                store = self._month_shard(section.date)
+            else:
+                store = self._carryover_shard()
+            groups.setdefault(store.backlog_file, (store, []))[1].append(section)
+            count += sum(len(cat.tasks) for cat in section.categories.values())
+
+        for store, sections in groups.values():
+            preamble = list(io.StringIO(new_backlog_text(title=store.title)))
+            store.save_document(BacklogDocument(preamble, sections))
+
+        return count, len(groups)
@@ -0,0 +1,447 @@
+#!/usr/bin/env python3
+"""
+SQLite Backlog Store
+Keeps the backlog in DailyPlans/backlog.db and regenerates backlog.md as a
+read-only view for Obsidian. Lookups and removals are indexed queries.
+
+Create the database from an existing backlog.md with:
+    python backlog_manager.py migrate-sqlite <vault_path>
+"""
+
+import os
+import sqlite3
+
+import vault_io
+from backlog_document import (
+    BacklogDocument,
+    build_carryover_section,
+    date_header,
+    dedupe_carryover_tasks,
+    new_backlog_text,
+    task_fingerprint,
+)
+from task_categories import CARRYOVER_ORDER, category_header
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS buckets (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,              -- 'date', 'carryover' or 'other'
+    date TEXT,                       -- Due date / carried-over-from date (YYYY-MM-DD)
+    body TEXT,                       -- Raw markdown for 'other' sections
+    UNIQUE (kind, date)
+);
+CREATE INDEX IF NOT EXISTS idx_buckets_date ON buckets (date);
+
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    bucket_id INTEGER NOT NULL REFERENCES buckets (id) ON DELETE CASCADE,
+    category TEXT NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_bucket_category ON tasks (bucket_id, category);
+CREATE INDEX IF NOT EXISTS idx_tasks_category ON tasks (category);
+
+CREATE TABLE IF NOT EXISTS carryover_origins (
+    task_id INTEGER PRIMARY KEY REFERENCES tasks (id) ON DELETE CASCADE,
+    origin_date TEXT NOT NULL        -- First "Carried over from" date
+);
+CREATE INDEX IF NOT EXISTS idx_carryover_origin_date ON carryover_origins (origin_date);
+"""
+
+
+class SQLiteBacklogStore:
+    """SQLite as the system of record; backlog.md is rendered after every change"""
+
+    name = 'sqlite'
+    journaled = False
+
+    def __init__(self, db_file, backlog_file):
+        self.db_file = db_file
+        self.backlog_file = backlog_file
+
+    def _connect(self):
+        os.makedirs(os.path.dirname(self.db_file), exist_ok=True)
+        conn = sqlite3.connect(self.db_file)
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.executescript(SCHEMA)
+        return conn
+
+    def ensure_exists(self):
+        """
+        Create the database and render backlog.md if missing
+
+        Returns:
+            bool: True if backlog.md was created
+        """
+        self._connect().close()
+        if vault_io.exists(self.backlog_file):
+            return False
+        self.render()
+        return True
+
+    def compact(self):
+        """No journal to compact"""
+        return 0
+
+    def _bucket_id(self, conn, kind, date, create=False):
+        row = conn.execute(
+            "SELECT id FROM buckets WHERE kind = ? AND date = ?", (kind, date)
+        ).fetchone()
+        if row:
+            return row[0]
+        if not create:
+            return None
+        return conn.execute(
+            "INSERT INTO buckets (kind, date) VALUES (?, ?)", (kind, date)
+        ).lastrowid
+
+    def _fingerprints(self, conn, bucket_id):
+        """Fingerprints of the tasks already in a bucket"""
+        rows = conn.execute("SELECT text FROM tasks WHERE bucket_id = ?", (bucket_id,)).fetchall()
+        return {task_fingerprint(text) for text, in rows}
+
+    def add_tasks(self, tasks):
+        """
+        Add validated (date, category, task) tuples in one transaction
+
+        Returns:
+            list: One bool per task, False for duplicates already in the date's bucket
+        """
+        added = []
+        seen = {}  # bucket_id -> fingerprints
+        conn = self._connect()
+        try:
+            with conn:
+                for date, category, task in tasks:
+                    bucket_id = self._bucket_id(conn, 'date', date, create=True)
+                    if bucket_id not in seen:
+                        seen[bucket_id] = self._fingerprints(conn, bucket_id)
+
+                    fingerprint = task_fingerprint(task)
+                    if fingerprint in seen[bucket_id]:
+                        added.append(False)
+                        continue
+
+                    seen[bucket_id].add(fingerprint)
+                    conn.execute(
+                        "INSERT INTO tasks (bucket_id, category, text) VALUES (?, ?, ?)",
+                        (bucket_id, category, task)
+                    )
+                    added.append(True)
+        finally:
+            conn.close()
+        if any(added):
+            self.render()
+        return added
+
+    def get_tasks_for_date(self, date):
+        """Return {category: [task_text, ...]} for a date"""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                """SELECT t.category, t.text FROM tasks t
+                   JOIN buckets b ON b.id = t.bucket_id
+                   WHERE b.kind = 'date' AND b.date = ?
+                   ORDER BY t.id""",
+                (date,)
+            ).fetchall()
+        finally:
+            conn.close()
+
+        tasks = {}
+        for category, text in rows:
+            tasks.setdefault(category, []).append(text)
+        return tasks
+
+    def get_tasks_between(self, start, end):
+        """Return {date: {category: [task_text, ...]}} from start to end (inclusive), in date order"""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                """SELECT b.date, t.category, t.text FROM tasks t
+                   JOIN buckets b ON b.id = t.bucket_id
+                   WHERE b.kind = 'date' AND b.date BETWEEN ? AND ?
+                   ORDER BY b.date, t.id""",
+                (start, end)
+            ).fetchall()
+        finally:
+            conn.close()
+
+        result = {}
+        for date, category, text in rows:
+            result.setdefault(date, {}).setdefault(category, []).append(text)
+        return result
+
+    def get_carryover_tasks(self):
+        """Return {category: [(task_text, carryover_date), ...]} across carryover buckets"""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                """SELECT t.category, t.text, COALESCE(o.origin_date, b.date) FROM tasks t
+                   JOIN buckets b ON b.id = t.bucket_id
+                   LEFT JOIN carryover_origins o ON o.task_id = t.id
+                   WHERE b.kind = 'carryover'
+                   ORDER BY b.id, t.id"""
+            ).fetchall()
+        finally:
+            conn.close()
+
+        tasks = {}
+        for category, text, origin_date in rows:
+            tasks.setdefault(category, []).append((text, origin_date))
+        return tasks
+
+    def take_tasks_for_date(self, date, remove=False):
+        """
+        Read a date's tasks and all carryover tasks in one transaction
+
+        Args:
+            date: Date in YYYY-MM-DD format
+            remove: Also delete the date bucket and every carryover bucket
+
+        Returns:
+            tuple: ({category: [task_text]}, {category: [(task_text, carryover_date)]})
+        """
+        conn = self._connect()
+        removed = 0
+        try:
+            with conn:
+                rows = conn.execute(
+                    """SELECT b.kind, t.category, t.text, COALESCE(o.origin_date, b.date) FROM tasks t
+                       JOIN buckets b ON b.id = t.bucket_id
+                       LEFT JOIN carryover_origins o ON o.task_id = t.id
+                       WHERE (b.kind = 'date' AND b.date = ?) OR b.kind = 'carryover'
+                       ORDER BY b.id, t.id""",
+                    (date,)
+                ).fetchall()
+                if remove:
+                    removed = conn.execute(
+                        "DELETE FROM buckets WHERE (kind = 'date' AND date = ?) OR kind = 'carryover'",
+                        (date,)
+                    ).rowcount
+        finally:
+            conn.close()
+
+        if removed:
+            self.render()
+
+        tasks = {}
+        carryover_tasks = {}
+        for kind, category, text, origin_date in rows:
+            if kind == 'date':
+                tasks.setdefault(category, []).append(text)
+            else:
+                carryover_tasks.setdefault(category, []).append((text, origin_date))
+        return tasks, carryover_tasks
+
+    def _delete(self, where, params=()):
+        conn = self._connect()
+        try:
+            with conn:
+                removed = conn.execute(f"DELETE FROM buckets WHERE {where}", params).rowcount
+        finally:
+            conn.close()
+        if removed:
+            self.render()
+        return removed
+
+    def remove_date(self, date):
+        """Remove a date bucket. Returns True if one was removed."""
+        return self._delete("kind = 'date' AND date = ?", (date,)) > 0
+
+    def remove_carryover(self, date):
+        """Remove a carryover bucket. Returns True if one was removed."""
+        return self._delete("kind = 'carryover' AND date = ?", (date,)) > 0
+
+    def remove_all_carryover(self):
+        """Remove every carryover bucket. Returns the number removed."""
+        return self._delete("kind = 'carryover'")
+
+    def stale_sections(self, cutoff):
+        """Return rendered date and carryover sections dated before cutoff (YYYY-MM-DD)"""
+        return [
+            s for s in self.load_document().sections
+            if s.kind in ('date', 'carryover') and s.date < cutoff
+        ]
+
+    def remove_before(self, cutoff):
+        """Remove date and carryover buckets dated before cutoff. Returns the number removed."""
+        return self._delete("kind IN ('date', 'carryover') AND date < ?", (cutoff,))
+
+    def add_carryover_section(self, date, tasks):
+        """
+        Add a carryover bucket
+
+        Tasks already in another carryover bucket are merged into it (keeping
+        the oldest origin date) instead of inserted again.
+
+        Args:
+            date: Date the tasks were carried over from (YYYY-MM-DD)
+            tasks: Dict of category -> list of (task_text, original_carryover_date)
+
+        Returns:
+            int or None: Number of duplicates merged, or None if a carryover
+                         bucket for the date already exists
+        """
+        return self.add_carryover_sections([(date, tasks)])[0]
+
+    def add_carryover_sections(self, sections):
+        """
+        Add several carryover buckets in one transaction
+
+        Args:
+            sections: List of (date, tasks) pairs, oldest first
+
+        Returns:
+            list: Per bucket, the number of duplicates merged or None if a
+                  carryover bucket for that date already exists
+        """
+        results = []
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                """SELECT t.id, t.text, COALESCE(o.origin_date, b.date) FROM tasks t
+                   JOIN buckets b ON b.id = t.bucket_id
+                   LEFT JOIN carryover_origins o ON o.task_id = t.id
+                   WHERE b.kind = 'carryover'
+                   ORDER BY b.id, t.id"""
+            ).fetchall()
+            task_ids = {}
+            pool = {}
+            for task_id, text, origin_date in rows:
+                fingerprint = task_fingerprint(text)
+                if fingerprint not in pool:
+                    task_ids[fingerprint] = task_id
+                    pool[fingerprint] = origin_date
+
+            with conn:
+                for date, tasks in sections:
+                    if self._bucket_id(conn, 'carryover', date) is not None:
+                        results.append(None)
+                        continue
+
+                    fresh, backdate, merged = dedupe_carryover_tasks(date, tasks, pool)
+                    for fingerprint, older_date in backdate.items():
+                        conn.execute(
+                            "INSERT OR REPLACE INTO carryover_origins (task_id, origin_date) VALUES (?, ?)",
+                            (task_ids[fingerprint], older_date)
+                        )
+                    if any(fresh.values()):
+                        task_ids.update(self._insert_carryover(conn, date, fresh))
+                        for task_list in fresh.values():
+                            for task_text, original_date in task_list:
+                                pool.setdefault(task_fingerprint(task_text), original_date)
+                    results.append(merged)
+        finally:
+            conn.close()
+
+        if any(result is not None for result in results):
+            self.render()
+        return results
+
+    def _insert_carryover(self, conn, date, tasks):
+        """Insert a carryover bucket. Returns {task_fingerprint: task_id} for the new tasks."""
+        task_ids = {}
+        bucket_id = self._bucket_id(conn, 'carryover', date, create=True)
+        for category in CARRYOVER_ORDER + sorted(set(tasks) - set(CARRYOVER_ORDER)):
+            for task_text, original_date in tasks.get(category, []):
+                task_id = conn.execute(
+                    "INSERT INTO tasks (bucket_id, category, text) VALUES (?, ?, ?)",
+                    (bucket_id, category, task_text)
+                ).lastrowid
+                conn.execute(
+                    "INSERT INTO carryover_origins (task_id, origin_date) VALUES (?, ?)",
+                    (task_id, original_date or date)
+                )
+                task_ids.setdefault(task_fingerprint(task_text), task_id)
+        return task_ids
+
+    def import_document(self, document):
+        """
+        Replace the database contents with a parsed backlog.md
+
+        Args:
+            document: BacklogDocument to import
+
+        Returns:
+            int: Number of tasks imported
+        """
+        conn = self._connect()
+        count = 0
+        try:
+            with conn:
+                conn.execute("DELETE FROM buckets")
+                for section in document.sections:
+                    if section.kind == 'other':
+                        conn.execute(
+                            "INSERT INTO buckets (kind, body) VALUES ('other', ?)",
+                            (''.join(section.lines),)
+                        )
+                    elif section.kind == 'carryover':
+                        if self._bucket_id(conn, 'carryover', section.date) is not None:
+                            continue
+                        tasks = {
+                            key: [(t.text, t.carryover_date) for t in cat.tasks]
+                            for key, cat in section.categories.items()
+                        }
+                        self._insert_carryover(conn, section.date, tasks)
+                        count += sum(len(v) for v in tasks.values())
+                    else:
+                        bucket_id = self._bucket_id(conn, 'date', section.date, create=True)
+                        for key, cat in section.categories.items():
+                            for task in cat.tasks:
+                                conn.execute(
+                                    "INSERT INTO tasks (bucket_id, category, text) VALUES (?, ?, ?)",
+                                    (bucket_id, key, task.text)
+                                )
+                                count += 1
+        finally:
+            conn.close()
+        self.render()
+        return count
+
+    def load_document(self):
+        """Return the rendered view as a BacklogDocument"""
+        return BacklogDocument.parse(self.render_text())
+
+    def render_text(self):
+        """Render the whole backlog as markdown"""
+        conn = self._connect()
+        try:
+            buckets = conn.execute("SELECT id, kind, date, body FROM buckets ORDER BY id").fetchall()
+            rows = conn.execute(
+                """SELECT t.bucket_id, t.category, t.text, o.origin_date FROM tasks t
+                   LEFT JOIN carryover_origins o ON o.task_id = t.id
+                   ORDER BY t.id"""
+            ).fetchall()
+        finally:
+            conn.close()
+
+        by_bucket = {}
+        for bucket_id, category, text, origin_date in rows:
+            by_bucket.setdefault(bucket_id, {}).setdefault(category, []).append((text, origin_date))
+
+        parts = [new_backlog_text()]
+        for bucket_id, kind, date, body in buckets:
+            tasks = by_bucket.get(bucket_id, {})
+            if kind == 'other':
+                parts.append(body)
+            elif kind == 'carryover':
+                section = build_carryover_section(date, tasks)
+                if section is not None:
+                    parts.append(''.join(section.lines))
+            elif tasks:
+                lines = [date_header(date) + "\n"]
+                for category, task_list in tasks.items():
+                    lines.append("\n" + category_header(category) + "\n")
+                    lines.extend(f"- [ ] {text}\n" for text, _ in task_list)
+                lines.append("\n---\n\n")
+                parts.append(''.join(lines))
+
+        return ''.join(parts)
+
+    def render(self):
+        """Regenerate backlog.md from the database"""
+        os.makedirs(os.path.dirname(self.backlog_file), exist_ok=True)
+        vault_io.write_text(self.backlog_file, self.render_text())
@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+Backlog Stores
+Storage backends behind BacklogManager. MarkdownBacklogStore keeps backlog.md
+as the system of record (optionally journaled); ShardedBacklogStore (see
+backlog_shards.py) splits it into one markdown file per month;
+SQLiteBacklogStore (see backlog_sqlite.py) keeps a database and renders
+backlog.md as a view.
+
+Stores raise on failure; BacklogManager owns validation and user messages.
+"""
+
+import os
+from datetime import datetime
+
+import vault_io
+from backlog_cache import BacklogParseCache
+from backlog_document import (
+    collect_carryover_tasks,
+    iter_sections,
+    new_backlog_text,
+    rewrite_sections,
+)
+from backlog_journal import BacklogJournal, DEFAULT_COMPACT_THRESHOLD, replay
+
+
+def backlog_paths(vault_path):
+    """Return (backlog.md path, backlog.db path) for a vault"""
+    daily_plans = os.path.join(vault_path, "DailyPlans")
+    return os.path.join(daily_plans, "backlog.md"), os.path.join(daily_plans, "backlog.db")
+
+
+def shard_dir(vault_path):
+    """Directory holding month-sharded backlog files (DailyPlans/backlog/)"""
+    return os.path.join(vault_path, "DailyPlans", "backlog")
+
+
+def open_store(vault_path, compact_threshold=DEFAULT_COMPACT_THRESHOLD):
+    """
+    Pick the store for a vault
+
+    Vaults with DailyPlans/backlog.db use SQLite (see
+    `backlog_manager.py migrate-sqlite`), vaults with a DailyPlans/backlog/
+    directory use month shards (see `backlog_manager.py migrate-shards`);
+    everything else uses a single backlog.md.
+    """
+    backlog_file, db_file = backlog_paths(vault_path)
+
+    if os.path.exists(db_file):
+        from backlog_sqlite import SQLiteBacklogStore
+        return SQLiteBacklogStore(db_file, backlog_file)
+
+    if os.path.isdir(shard_dir(vault_path)):
+        from backlog_shards import ShardedBacklogStore
+        return ShardedBacklogStore(shard_dir(vault_path), compact_threshold)
+
+    return MarkdownBacklogStore(backlog_file, compact_threshold)
+
+
+class MarkdownBacklogStore:
+    """backlog.md as the system of record, with an optional append-only journal"""
+
+    name = 'markdown'
+
+    def __init__(self, backlog_file, compact_threshold=DEFAULT_COMPACT_THRESHOLD, title='Task Backlog'):
+        self.backlog_file = backlog_file
+        self.journal = BacklogJournal(backlog_file)
+        self.cache = BacklogParseCache(backlog_file)
+        self.compact_threshold = compact_threshold
+        self.title = title
+
+    @property
+    def journaled(self):
+        """Journaled mode is on while DailyPlans/backlog.journal exists"""
+        return self.journal.exists()
+
+    def ensure_exists(self):
+        """
+        Create backlog.md if it doesn't exist
+
+        Returns:
+            bool: True if the file was created
+        """
+        if vault_io.exists(self.backlog_file):
+            return False
+
+        os.makedirs(os.path.dirname(self.backlog_file), exist_ok=True)
+        vault_io.write_text(self.backlog_file, new_backlog_text(title=self.title))
+        return True
+
+    def load_document(self):
+        """
+        Read and parse backlog.md, replaying pending journal records on top
+
+        An unchanged backlog.md is restored from the parse cache instead of
+        being parsed again.
+
+        Returns:
+            BacklogDocument: Current view of the backlog
+        """
+        self.ensure_exists()
+
+        document = self.cache.load()
+
+        if self.journal.size():
+            replay(document, self.journal.records())
+
+        return document
+
+    def save_document(self, document):
+        """
+        Stamp last_updated and write the document back in a single write
+
+        The written document already contains any replayed journal records,
+        so the journal is emptied afterwards.
+        """
+        document.touch()
+        text = document.to_text()
+
+        vault_io.write_text(self.backlog_file, text)
+        self.cache.store(text, document)
+
+        if self.journal.size():
+            self.journal.truncate()
+
+    def compact(self):
+        """
+        Fold the journal back into backlog.md
+
+        Returns:
+            int: Number of journal records compacted
+        """
+        if not self.journal.size():
+            return 0
+
+        record_count = len(self.journal.records())
+        self.save_document(self.load_document())
+        return record_count
+
+    def _streamable(self):
+        """Streaming reads/writes are only valid with no pending journal records"""
+        return not self.journal.size()
+
+    def _scan(self, want):
+        """Stream the sections matching want(kind, date) without loading the file"""
+        self.ensure_exists()
+        with vault_io.open_text(self.backlog_file) as f:
+            yield from iter_sections(f, want)
+
+    def _rewrite(self, drop, keep_dropped=True):
+        """
+        Stream backlog.md into a temp file without the dropped sections
+
+        The file is only replaced when something was dropped, and only after
+        the read handle is closed (Windows can't replace an open file).
+
+        Returns:
+            tuple: (number of sections dropped, list of dropped sections)
+        """
+        self.ensure_exists()
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+
+        with vault_io.AtomicFile(self.backlog_file) as dst:
+            with vault_io.open_text(self.backlog_file) as src:
+                count, dropped = rewrite_sections(src, dst, drop, timestamp, keep_dropped)
+            if count:
+                dst.commit()
+
+        return count, dropped
+
+    def _append_journal(self, *records):
+        """Append records in journaled mode, compacting past the size threshold"""
+        self.journal.append(*records)
+
+        if self.journal.size() > self.compact_threshold:
+            self.compact()
+
+    def add_tasks(self, tasks):
+        """
+        Add validated tasks in one write (or one journal append)
+
+        Tasks already present for their date are skipped. In journaled mode
+        duplicates are dropped when the journal is replayed instead.
+
+        Args:
+            tasks: List of (date, category, task) tuples
+
+        Returns:
+            list: One bool per task, False for skipped duplicates
+        """
+        if self.journaled:
+            self._append_journal(*[
+                {'op': 'add', 'date': date, 'category': category, 'task': task}
+                for date, category, task in tasks
+            ])
+            return [True] * len(tasks)
+
+        document = self.load_document()
+        added = [document.add_task(date, category, task) for date, category, task in tasks]
+        if any(added):
+            self.save_document(document)
+        return added
+
+    def _cached_document(self):
+        """
+        The current document if it can be had without parsing: restored from
+        the parse cache, with no journal records pending
+
+        Returns:
+            BacklogDocument or None: None means stream (or parse) instead
+        """
+        return self.cache.cached() if self._streamable() else None
+
+    def get_tasks_for_date(self, date):
+        """Return {category: [task_text, ...]} for a date"""
+        document = self._cached_document()
+        if document is None:
+            if self._streamable():
+                # Stop reading as soon as the date's section has been seen
+                for section in self._scan(lambda kind, d: kind == 'date' and d == date):
+                    return section.tasks_by_category()
+                return {}
+            document = self.load_document()
+
+        section = document.get_section(date)
+        return section.tasks_by_category() if section else {}
+
+    def get_tasks_between(self, start, end):
+        """
+        Return {date: {category: [task_text, ...]}} for every date from start
+        to end (inclusive), in date order
+
+        Uses the document's sorted date index, so an unchanged backlog is
+        answered from the parse cache without re-parsing.
+        """
+        result = {}
+        for section in self.load_document().sections_between(start, end):
+            tasks = section.tasks_by_category()
+            if tasks:
+                result[section.date] = tasks
+        return result
+
+    def get_carryover_tasks(self):
+        """Return {category: [(task_text, carryover_date), ...]} across carryover sections"""
+        document = self._cached_document()
+        if document is None:
+            if self._streamable():
+                return collect_carryover_tasks(self._scan(lambda kind, d: kind == 'carryover'))
+            document = self.load_document()
+
+        return document.carryover_tasks()
+
+    def take_tasks_for_date(self, date, remove=False):
+        """
+        Read a date's tasks and all carryover tasks in one pass
+
+        Args:
+            date: Date in YYYY-MM-DD format
+            remove: Also drop the date section and every carryover section,
+                    writing the pruned backlog once
+
+        Returns:
+            tuple: ({category: [task_text]}, {category: [(task_text, carryover_date)]})
+        """
+        def wanted(kind, d):
+            return kind == 'carryover' or (kind == 'date' and d == date)
+
+        document = self._cached_document()
+        if document is None and self._streamable():
+            if remove and not self.journaled:
+                _, sections = self._rewrite(wanted)
+            else:
+                sections = list(self._scan(wanted))
+                if remove and sections:
+                    self._append_journal(
+                        {'op': 'remove_date', 'date': date},
+                        {'op': 'remove_all_carryover'}
+                    )
+
+            date_sections = [s for s in sections if s.kind == 'date']
+            tasks = date_sections[0].tasks_by_category() if date_sections else {}
+            return tasks, collect_carryover_tasks(s for s in sections if s.kind == 'carryover')
+
+        if document is None:
+            document = self.load_document()
+        section = document.get_section(date)
+        tasks = section.tasks_by_category() if section else {}
+        carryover_tasks = document.carryover_tasks()
+
+        if remove and (section is not None or document.carryover_sections()):
+            if self.journaled:
+                self._append_journal(
+                    {'op': 'remove_date', 'date': date},
+                    {'op': 'remove_all_carryover'}
+                )
+            else:
+                document.remove_date_section(date)
+                document.remove_carryover_sections()
+                self.save_document(document)
+
+        return tasks, carryover_tasks
+
+    def remove_date(self, date):
+        """
+        Remove a date section
+
+        Returns:
+            bool: True if a section was (or, when journaled, will be) removed
+        """
+        if self.journaled:
+            self._append_journal({'op': 'remove_date', 'date': date})
+            return True
+
+        document = self.load_document()
+        if not document.remove_date_section(date):
+            return False
+        self.save_document(document)
+        return True
+
+    def remove_carryover(self, date):
+        """
+        Remove the carryover section for a date
+
+        Returns:
+            bool: True if a section was (or, when journaled, will be) removed
+        """
+        if self.journaled:
+            self._append_journal({'op': 'remove_carryover', 'date': date})
+            return True
+
+        document = self.load_document()
+        if not document.remove_carryover_section(date):
+            return False
+        self.save_document(document)
+        return True
+
+    def remove_all_carryover(self):
+        """
+        Remove every carryover section
+
+        Returns:
+            int: Number of sections removed
+        """
+        if self.journaled:
+            if self._streamable():
+                sections_removed = sum(1 for _ in self._scan(lambda kind, d: kind == 'carryover'))
+            else:
+                sections_removed = len(self.load_document().carryover_sections())
+            if sections_removed:
+                self._append_journal({'op': 'remove_all_carryover'})
+            return sections_removed
+
+        if self._streamable():
+            sections_removed, _ = self._rewrite(lambda kind, d: kind == 'carryover', keep_dropped=False)
+            return sections_removed
+
+        document = self.load_document()
+        sections_removed = document.remove_carryover_sections()
+        if sections_removed:
+            self.save_document(document)
+        return sections_removed
+
+    def stale_sections(self, cutoff):
+        """Return date and carryover sections dated before cutoff (YYYY-MM-DD)"""
+        def stale(kind, d):
+            return kind in ('date', 'carryover') and d < cutoff
+
+        if not self._streamable():
+            return [s for s in self.load_document().sections if stale(s.kind, s.date)]
+        return list(self._scan(stale))
+
+    def remove_before(self, cutoff):
+        """
+        Remove date and carryover sections dated before cutoff
+
+        Pending journal records are compacted first so the streaming rewrite
+        sees the current backlog.
+
+        Returns:
+            int: Number of sections removed
+        """
+        self.compact()
+        sections_removed, _ = self._rewrite(
+            lambda kind, d: kind in ('date', 'carryover') and d < cutoff, keep_dropped=False
+        )
+        return sections_removed
+
+    def add_carryover_section(self, date, tasks):
+        """
+        Append a "Backlog due from <date>" section
+
+        Tasks already in another carryover section are merged into it
+        (keeping the oldest "Carried over from" date) instead of repeated.
+
+        Args:
+            date: Date the tasks were carried over from (YYYY-MM-DD)
+            tasks: Dict of category -> list of (task_text, original_carryover_date)
+
+        Returns:
+            int or None: Number of duplicates merged, or None if a carryover
+                         section for the date already exists
+        """
+        return self.add_carryover_sections([(date, tasks)])[0]
+
+    def add_carryover_sections(self, sections):
+        """
+        Append several carryover sections with a single backlog write
+
+        Args:
+            sections: List of (date, tasks) pairs, oldest first
+
+        Returns:
+            list: Per section, the number of duplicates merged or None if a
+                  carryover section for that date already exists
+        """
+        document = self.load_document()
+        results = []
+        changed = False
+
+        for date, tasks in sections:
+            if document.get_carryover_section(date) is not None:
+                results.append(None)
+            elif any(tasks.values()):
+                results.append(document.add_carryover_section(date, tasks))
+                changed = True
+            else:
+                results.append(0)
+
+        if changed:
+            self.save_document(document)
+        return results
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Task Categories
+The single registry of task categories and the header classifier shared by
+the backlog parser, the daily plan parser and carryover.
+
+Canonical keys: focus, comms, learning, work, email, message, reading, other.
+
+A header is classified with one regex match and dictionary lookups:
+exact header -> leading emoji -> keyword in the title. Results are cached
+per header line, so repeated headers cost a single lookup.
+"""
+
+import re
+from functools import lru_cache
+
+
+# Category display maps (shared with BacklogManager)
+CATEGORY_EMOJI = {
+    'focus': '🧠',
+    'comms': '💬',
+    'learning': '🎓',
+    'work': '💼',
+    'email': '📧',
+    'message': '💬',
+    'reading': '📚',
+    'other': '📋'
+}
+
+CATEGORY_NAME = {
+    'focus': 'Focus Work',
+    'comms': 'Communications',
+    'learning': 'Learning & Development',
+    'work': 'Work Tasks',
+    'email': 'Emails',
+    'message': 'Messages',
+    'reading': 'Reading & Learning',
+    'other': 'Other Tasks'
+}
+
+# Carryover sections list categories in this order, with the plan's email header
+CARRYOVER_ORDER = ['focus', 'comms', 'learning', 'work', 'email', 'message', 'reading', 'other']
+CARRYOVER_CATEGORY_NAME = dict(CATEGORY_NAME, email='Flagged Emails')
+
+# Leading emoji -> category. 💬 is shared by comms and message and is
+# resolved by the title (see _resolve_speech_balloon).
+EMOJI_TO_CATEGORY = {
+    '🧠': 'focus',
+    '💬': None,
+    '🎓': 'learning',
+    '💼': 'work',
+    '📧': 'email',
+    '📚': 'reading',
+    '📋': 'other',
+    '🔄': 'other',  # "Old tasks backlog" section of a daily plan
+}
+
+# Title keyword (lowercase) -> category
+KEYWORD_TO_CATEGORY = {
+    'email': 'email',
+    'message': 'message',
+    'reading': 'reading',
+    'learning': 'learning',
+    'focus': 'focus',
+    'communication': 'comms',
+    'comms': 'comms',
+    'work': 'work',
+    'other': 'other',
+}
+
+# "## Title" / "### 📧 Title": hashes, optional leading symbol, title
+HEADER_RE = re.compile(r'^#{2,}\s*(?:([^\w\s#*\[(]+)\s*)?(.*?)\s*$')
+KEYWORD_RE = re.compile('|'.join(KEYWORD_TO_CATEGORY), re.IGNORECASE)
+
+# Exact "### {emoji} {name}" headers written by BacklogManager and cleanup
+HEADER_TO_CATEGORY = {
+    f"### {CATEGORY_EMOJI[cat]} {name}": cat for cat, name in CATEGORY_NAME.items()
+}
+HEADER_TO_CATEGORY[f"### {CATEGORY_EMOJI['email']} {CARRYOVER_CATEGORY_NAME['email']}"] = 'email'
+
+
+def _keyword_category(title):
+    match = KEYWORD_RE.search(title)
+    return KEYWORD_TO_CATEGORY[match.group(0).lower()] if match else None
+
+
+def _resolve_speech_balloon(title):
+    """💬 headers are Communications (comms) or legacy Messages (message)"""
+    return 'comms' if _keyword_category(title) == 'comms' else 'message'
+
+
+@lru_cache(maxsize=512)
+def classify_header(line, keywords=True):
+    """
+    Map a "##"/"###" header line to a category key
+
+    Args:
+        line: Header line (trailing newline/whitespace is ignored)
+        keywords: Fall back to keywords in the title (e.g. "Flagged Emails")
+                  when there is no category emoji
+
+    Returns:
+        str or None: Category key, or None if the header names no category
+    """
+    line = line.rstrip()
+    category = HEADER_TO_CATEGORY.get(line)
+    if category is not None:
+        return category
+
+    match = HEADER_RE.match(line)
+    if not match:
+        return None
+    symbol, title = match.groups()
+
+    if symbol:
+        for char in symbol:
+            if char in EMOJI_TO_CATEGORY:
+                category = EMOJI_TO_CATEGORY[char]
+                return category if category else _resolve_speech_balloon(title)
+
+    return _keyword_category(title) if keywords else None
+
+
+def category_header(category, names=CATEGORY_NAME):
+    """Return the "### {emoji} {name}" header for a category"""
+    emoji = CATEGORY_EMOJI.get(category, '📋')
+    name = names.get(category, 'Tasks')
+    return f"### {emoji} {name}"
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Vault I/O
+Shared file layer for everything the skills write into a vault (daily
+plans, backlog.md, shards, the backlog journal) and for local caches.
+
+- Unchanged content is never rewritten, so no-op edits don't trigger an
+  Obsidian sync upload.
+- Files are replaced atomically: written to a temp file in the same
+  directory, then renamed over the original.
+- Inside `with vault_io.batch():` writes are held in memory and each file is
+  written once when the batch ends. Reads through this module see the
+  pending content, so several edits to the same file coalesce into one write.
+- fsync policy is configurable with PM_VAULT_FSYNC (or set_fsync_policy):
+    none  - never fsync (fastest; a crash can lose the last writes)
+    file  - fsync each file before it replaces the original (default)
+    full  - also fsync the directory after the rename
+"""
+
+import io
+import os
+import tempfile
+from contextlib import contextmanager
+
+
+FSYNC_POLICIES = ('none', 'file', 'full')
+FSYNC_ENV = 'PM_VAULT_FSYNC'
+
+_fsync_policy = os.environ.get(FSYNC_ENV, 'file').strip().lower()
+if _fsync_policy not in FSYNC_POLICIES:
+    _fsync_policy = 'file'
+
+# Pending writes while a batch is open (see batch())
+_batch = None
+
+
+def set_fsync_policy(policy):
+    """Set the fsync policy: 'none', 'file' or 'full'"""
+    global _fsync_policy
+    if policy not in FSYNC_POLICIES:
+        raise ValueError(f"Unknown fsync policy: {policy} (expected one of {', '.join(FSYNC_POLICIES)})")
+    _fsync_policy = policy
+
+
+def fsync_policy():
+    """Return the current fsync policy"""
+    return _fsync_policy
+
+
+class WriteBatch:
+    """File contents waiting to be written, keyed by absolute path"""
+
+    def __init__(self):
+        self._pending = {}
+
+    def get(self, path):
+        """Pending text for a path, or None"""
+        return self._pending.get(os.path.abspath(path))
+
+    def put(self, path, text):
+        self._pending[os.path.abspath(path)] = text
+
+    def discard(self, path):
+        self._pending.pop(os.path.abspath(path), None)
+
+    def flush(self):
+        """
+        Write every pending file, in the order each was first edited
+
+        Returns:
+            int: Number of files actually written (unchanged ones are skipped)
+        """
+        written = 0
+        pending, self._pending = self._pending, {}
+        for path, text in pending.items():
+            if _replace_file(path, text, durable=True):
+                written += 1
+        return written
+
+
+@contextmanager
+def batch():
+    """
+    Hold writes until the end of the block, then write each file once
+
+    Nested batches join the outermost one. Pending writes are flushed even if
+    the block raises, matching what unbatched writes would have left on disk.
+    """
+    global _batch
+    if _batch is not None:
+        yield _batch
+        return
+
+    _batch = WriteBatch()
+    try:
+        yield _batch
+    finally:
+        current, _batch = _batch, None
+        current.flush()
+
+
+def _pending(path):
+    return _batch.get(path) if _batch is not None else None
+
+
+def is_pending(path):
+    """True if a batch holds unwritten content for path"""
+    return _pending(path) is not None
+
+
+def exists(path):
+    """os.path.exists, counting files only written in the open batch"""
+    return is_pending(path) or os.path.exists(path)
+
+
+def getsize(path):
+    """File size in bytes (pending content included); 0 if missing"""
+    text = _pending(path)
+    if text is not None:
+        return len(text.encode('utf-8'))
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def read_text(path):
+    """Read a UTF-8 text file (or its pending content)"""
+    text = _pending(path)
+    if text is not None:
+        return text
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def open_text(path):
+    """Open a UTF-8 text file for streaming reads (or its pending content)"""
+    text = _pending(path)
+    if text is not None:
+        return io.StringIO(text)
+    return open(path, 'r', encoding='utf-8')
+
+
+def write_text(path, text, durable=True):
+    """
+    Replace a file's content, skipping the write if it is unchanged
+
+    Args:
+        path: File to write
+        text: Complete new content
+        durable: False for rebuildable caches: written straight away (never
+                 batched) and never fsynced
+
+    Returns:
+        bool: True if the content changed
+    """
+    if _batch is not None and durable:
+        try:
+            if read_text(path) == text:
+                return False
+        except OSError:
+            pass
+        _batch.put(path, text)
+        return True
+
+    return _replace_file(path, text, durable)
+
+
+def write_bytes(path, data):
+    """
+    Atomically replace a binary file (e.g. a gzip archive)
+
+    Binary files are never batched; they are written straight away and
+    fsynced according to the policy.
+    """
+    with AtomicFile(path, binary=True) as f:
+        f.write(data)
+        f.commit()
+
+
+def append_text(path, text):
+    """Append to a file (used by the backlog journal)"""
+    if _batch is not None and is_pending(path):
+        _batch.put(path, _pending(path) + text)
+        return
+
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(text)
+        if _fsync_policy != 'none':
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def remove(path):
+    """Delete a file and drop any pending content for it"""
+    if _batch is not None:
+        _batch.discard(path)
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def _replace_file(path, text, durable):
+    """Atomically replace path with text unless it already holds it"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.read() == text:
+                return False
+    except (OSError, UnicodeDecodeError):
+        pass
+
+    with AtomicFile(path, durable=durable) as f:
+        f.write(text)
+        f.commit()
+    return True
+
+
+def _default_mode():
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+class AtomicFile:
+    """
+    File written to a temp file that replaces the target on commit()
+
+    Leaving the with-block without commit() (or on an exception) discards the
+    temp file and leaves the target untouched. Inside a batch, text content is
+    buffered and handed to write_text() instead.
+    """
+
+    def __init__(self, path, durable=True, binary=False):
+        self.path = path
+        self.durable = durable
+        self.binary = binary
+        self._file = None
+        self._tmp_path = None
+        self._buffer = None
+        self._committed = False
+
+    def __enter__(self):
+        if _batch is not None and self.durable and not self.binary:
+            self._buffer = io.StringIO()
+            return self
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, self._tmp_path = tempfile.mkstemp(
+            dir=directory, prefix='.' + os.path.basename(self.path) + '.', suffix='.tmp'
+        )
+        self._file = os.fdopen(fd, 'wb') if self.binary else os.fdopen(fd, 'w', encoding='utf-8')
+        return self
+
+    def write(self, text):
+        (self._buffer if self._buffer is not None else self._file).write(text)
+
+    def writelines(self, lines):
+        (self._buffer if self._buffer is not None else self._file).writelines(lines)
+
+    def commit(self):
+        """Replace the target with what was written"""
+        if self._buffer is not None:
+            write_text(self.path, self._buffer.getvalue())
+            self._committed = True
+            return
+
+        sync = self.durable and _fsync_policy != 'none'
+        self._file.flush()
+        if sync:
+            os.fsync(self._file.fileno())
+        self._file.close()
+
+        try:
+            mode = os.stat(self.path).st_mode & 0o777
+        except OSError:
+            mode = _default_mode()
+        os.chmod(self._tmp_path, mode)
+
+        os.replace(self._tmp_path, self.path)
+        self._committed = True
+
+        if sync and _fsync_policy == 'full' and hasattr(os, 'O_DIRECTORY'):
+            fd = os.open(os.path.dirname(os.path.abspath(self.path)), os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._file is not None and not self._file.closed:
+            self._file.close()
+        if self._tmp_path and not self._committed and os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+        return False
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Multi-Vault End of Day Cleanup
+Runs end-of-day cleanup for every vault in a registry file, fanned out over a
+process pool, and writes per-vault results and timings as JSON.
+
+Registry format: one vault path per line; blank lines and lines starting
+with # are ignored. Default: plan-my-day/config/vaults.txt
+
+Usage:
+    python cleanup_all_vaults.py [--registry vaults.txt] [--workers 8] [--output results.json]
+"""
+
+import sys
+import os
+import io
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stderr, redirect_stdout
+from datetime import datetime
+
+
+DEFAULT_REGISTRY = os.path.join(
+    os.path.dirname(__file__),
+    '../../plan-my-day/config/vaults.txt'
+)
+
+
+def read_registry(registry_file):
+    """
+    Read vault paths from a registry file
+
+    Returns:
+        list: Vault paths in file order, without duplicates
+    """
+    vaults = []
+    with open(registry_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#') and line not in vaults:
+                vaults.append(line)
+    return vaults
+
+
+def clean_vault(vault_path, archive_days=0, since=None):
+    """
+    Run end-of-day cleanup for one vault (executed in a worker process)
+
+    The cleanup's console output (stdout and stderr, e.g. tracebacks) is
+    captured so logs from parallel vaults don't interleave.
+
+    Returns:
+        dict: {'vault', 'success', 'seconds', 'log', 'error'}
+    """
+    started = time.perf_counter()
+    log = io.StringIO()
+    success = False
+    error = None
+
+    try:
+        # Imported in the worker so each process sets up its own sys.path
+        from end_of_day_cleanup import EndOfDayCleanup
+
+        with redirect_stdout(log), redirect_stderr(log):
+            if not os.path.isdir(vault_path):
+                raise FileNotFoundError(f"Vault not found: {vault_path}")
+
+            cleanup = EndOfDayCleanup(vault_path, archive_days=archive_days)
+            success = cleanup.run_catch_up(since) if since else cleanup.run_cleanup()
+
+    except BaseException as e:
+        # SystemExit included: a failed import in end_of_day_cleanup exits
+        error = str(e) or e.__class__.__name__
+
+    return {
+        'vault': vault_path,
+        'success': bool(success),
+        'seconds': round(time.perf_counter() - started, 3),
+        'log': log.getvalue(),
+        'error': error
+    }
+
+
+def run_all(vaults, workers=None, archive_days=0, since=None):
+    """
+    Clean up every vault with at most `workers` running at once
+
+    Args:
+        vaults: List of vault paths
+        workers: Maximum concurrent vaults (default: CPU count)
+        archive_days: Passed to each EndOfDayCleanup
+        since: Catch-up start date (YYYY-MM-DD), or None for today only
+
+    Returns:
+        list: Result dicts (see clean_vault) in registry order
+    """
+    workers = max(1, min(workers or os.cpu_count() or 1, len(vaults) or 1))
+    results = {}
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(clean_vault, vault, archive_days, since): vault
+            for vault in vaults
+        }
+        for future in as_completed(futures):
+            vault = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # Worker process died (e.g. killed); report it like any other failure
+                result = {'vault': vault, 'success': False, 'seconds': None, 'log': '', 'error': str(e)}
+
+            results[vault] = result
+            status = "[OK]" if result['success'] else "[ERROR]"
+            print(f"{status} {vault} ({result['seconds']}s)" + (f": {result['error']}" if result['error'] else ""))
+
+    return [results[vault] for vault in vaults]
+
+
+def main():
+    """CLI interface"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='End of day cleanup for many vaults in parallel')
+    parser.add_argument('--registry', default=DEFAULT_REGISTRY, help='File listing one vault path per line')
+    parser.add_argument('--workers', type=int, help='Maximum vaults cleaned at once (default: CPU count)')
+    parser.add_argument('--output', help='Write JSON results to this file (default: stdout)')
+    parser.add_argument('--archive-days', type=int, default=0,
+                        help='Archive backlog sections older than this many days (default: 0, no archival)')
+    parser.add_argument('--since', metavar='YYYY-MM-DD',
+                        help='Catch up on in-progress plans from this date through yesterday')
+
+    args = parser.parse_args()
+
+    if not os.path.exists(args.registry):
+        print(f"[ERROR] Vault registry not found: {args.registry}")
+        sys.exit(1)
+
+    vaults = read_registry(args.registry)
+    if not vaults:
+        print(f"[*] No vaults listed in {args.registry}")
+        sys.exit(0)
+
+    print(f"[*] Running end-of-day cleanup for {len(vaults)} vault(s) at {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+    started_at = datetime.now().isoformat(timespec='seconds')
+    started = time.perf_counter()
+    results = run_all(vaults, args.workers, args.archive_days, args.since)
+
+    report = {
+        'started_at': started_at,
+        'total_seconds': round(time.perf_counter() - started, 3),
+        'succeeded': sum(1 for r in results if r['success']),
+        'failed': sum(1 for r in results if not r['success']),
+        'vaults': results
+    }
+
+    if args.output:
+        tmp_path = args.output + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, args.output)
+        print(f"[OK] Results written to {args.output}")
+    else:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+
+    print(f"[*] {report['succeeded']} succeeded, {report['failed']} failed in {report['total_seconds']}s")
+    sys.exit(0 if report['failed'] == 0 else 1)
+
+
+if __name__ == '__main__':
+    # Fix encoding for Windows console
+    if sys.platform == 'win32':
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+    main()
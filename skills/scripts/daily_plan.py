@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Daily Plan Model
+Parses a daily plan once into a section/task tree with line spans, so
+end-of-day cleanup can extract unchecked tasks, prune them (with their
+indented metadata) and flip the plan status from the same parse and write
+the file back once.
+"""
+
+import io
+import os
+import re
+import sys
+
+# Shared category classifier and vault I/O live with the add-task scripts
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../add-task/scripts'))
+
+import vault_io
+from task_categories import classify_header
+
+
+UNCHECKED_RE = re.compile(r'^(?:- \[ \]|\d+\.\s*\[\s*\])')
+CHECKED_RE = re.compile(r'^(?:- \[[xX]\]|\d+\.\s*\[[xX]\])')
+CHECKBOX_RE = re.compile(r'^(?:- \[[ xX]\]|\d+\.\s*\[[\sxX]\])')
+CARRIED_OVER_RE = re.compile(r'-\s*\*Carried over from:\*\s*(\d{4}-\d{2}-\d{2})')
+
+STATUS_IN_PROGRESS = 'status: in-progress'
+STATUS_COMPLETE = 'status: complete'
+
+# Marker returned for "##" lines that don't change the current section
+_KEEP = object()
+# Marker for the reflection section, where extraction stops
+_STOP = object()
+
+
+def classify_plan_header(line):
+    """
+    Map a "##" header line of a daily plan to a carryover section key
+
+    Category headers use the shared classifier; title keywords (e.g.
+    "## Flagged Emails") only count for top-level "## " headers so sub-headers
+    like "### Email drafts" inside another section don't switch sections.
+
+    Returns:
+        str: Category key, None for sections whose tasks are not carried over
+             (calendar), _STOP for the reflection section, or _KEEP if the
+             header doesn't start a new section
+    """
+    if '💡' in line:
+        # Reflection section - stop processing
+        return _STOP
+    if '📅' in line:
+        # Calendar section - meetings aren't tasks to carry over
+        return None
+
+    key = classify_header(line, keywords=line.startswith('## '))
+    return key if key is not None else _KEEP
+
+
+def clean_task_text(text):
+    """Clean task text - remove bold markers, extract main text"""
+    # Remove bold markers
+    text = re.sub(r'\*\*(.*?)\*\*:', r'\1:', text)
+    text = re.sub(r'\*\*(.*?)\*\*', r'\1', text)
+
+    # If it's a multi-line task with details, just take the first line
+    if '\n' in text:
+        text = text.split('\n')[0]
+
+    return text.strip()
+
+
+class PlanTask:
+    """A task checkbox line plus (for unchecked tasks) the indented metadata lines under it"""
+
+    __slots__ = ('section', 'text', 'carryover_date', 'start', 'end', 'done')
+
+    def __init__(self, section, text, carryover_date, start, end, done=False):
+        self.section = section                # Category section key, or None outside them
+        self.text = text                      # Cleaned task text, or None for metadata-only lines
+        self.carryover_date = carryover_date  # From a "*Carried over from:*" line
+        self.start = start                    # Line index of the checkbox
+        self.end = end                        # Exclusive; includes metadata lines
+        self.done = done                      # Checked ("- [x]")
+
+
+class PlanSection:
+    """A "##" block of the plan that tasks are carried over from"""
+
+    __slots__ = ('key', 'start', 'end', 'tasks')
+
+    def __init__(self, key, start):
+        self.key = key
+        self.start = start  # Header line index
+        self.end = start + 1
+        self.tasks = []
+
+
+class DailyPlan:
+    """
+    Section/task tree of a daily plan
+
+    Every unchecked task in the file is recorded in tasks with its line span;
+    tasks inside a carried-over section (before the reflection section) also
+    carry their section key. Checked tasks are recorded in done_tasks. Edits
+    only mark lines for removal, so to_text() rebuilds the file in one pass.
+    """
+
+    def __init__(self, lines):
+        self.lines = lines  # Raw lines, each keeping its trailing newline
+        self.sections = []
+        self.tasks = []       # Unchecked
+        self.done_tasks = []  # Checked
+        self._removed = set()
+        self._complete = False
+        self._index()
+
+    @classmethod
+    def parse(cls, text):
+        """Parse daily plan markdown into a DailyPlan"""
+        return cls(list(io.StringIO(text)))
+
+    @classmethod
+    def load(cls, path):
+        """Read and parse a daily plan file"""
+        return cls.parse(vault_io.read_text(path))
+
+    def _index(self):
+        lines = self.lines
+        current = None      # PlanSection tasks are carried over from
+        stopped = False     # Past the reflection section
+        task = None         # Task whose metadata lines are being collected
+
+        for i, line in enumerate(lines):
+            stripped = line.strip()
+
+            if not stopped and line.startswith('##'):
+                key = classify_plan_header(line)
+                if key is _STOP:
+                    stopped = True
+                    current = None
+                elif key is None:
+                    current = None
+                elif key is not _KEEP:
+                    current = PlanSection(key, i)
+                    self.sections.append(current)
+
+            if current is not None:
+                current.end = i + 1
+
+            if UNCHECKED_RE.match(stripped):
+                task = self._task_at(i, stripped, current)
+                self.tasks.append(task)
+                if current is not None:
+                    current.tasks.append(task)
+                continue
+
+            if task is not None and line.startswith('  ') and stripped.startswith('-'):
+                # Indented metadata for the task (like "- *Estimated time:*")
+                task.end = i + 1
+                continue
+            task = None
+
+            if CHECKED_RE.match(stripped):
+                self.done_tasks.append(self._task_at(i, stripped, current, done=True))
+
+    def _task_at(self, i, stripped, section, done=False):
+        """Build the PlanTask for the checkbox on line i"""
+        # Both "- [ ]" and numbered "1. [ ]" formats
+        task_text = CHECKBOX_RE.sub('', stripped).strip()
+        key = section.key if section is not None else None
+
+        # Metadata lines ("*Note*", "- ...") are pruned but not extracted; bold task text is kept
+        if not task_text or task_text.startswith('-') or (task_text.startswith('*') and not task_text.startswith('**')):
+            return PlanTask(key, None, None, i, i + 1, done)
+
+        carryover_date = None
+        if i + 1 < len(self.lines):
+            match = CARRIED_OVER_RE.match(self.lines[i + 1].strip())
+            if match:
+                carryover_date = match.group(1)
+
+        return PlanTask(key, clean_task_text(task_text) or None, carryover_date, i, i + 1, done)
+
+    @property
+    def status(self):
+        """Value of the frontmatter status field (e.g. 'in-progress'), or None"""
+        if not self.lines or self.lines[0].strip() != '---':
+            return None
+        for line in self.lines[1:]:
+            if line.strip() == '---':
+                break
+            if line.startswith('status:'):
+                return line[len('status:'):].strip()
+        return None
+
+    def unchecked_tasks(self):
+        """
+        Unchecked tasks to carry over, by section
+
+        Returns:
+            dict: Section key -> list of (task_text, carryover_date) tuples;
+                  carryover_date is None for new tasks
+        """
+        tasks = {
+            'focus': [],
+            'comms': [],
+            'learning': [],
+            'work': [],
+            'email': [],
+            'message': [],
+            'reading': [],
+            'other': []
+        }
+        for task in self.tasks:
+            if task.section is not None and task.text:
+                tasks[task.section].append((task.text, task.carryover_date))
+        return tasks
+
+    def all_tasks(self):
+        """Every checked and unchecked task with text, in file order"""
+        return sorted(
+            (task for task in self.tasks + self.done_tasks if task.text),
+            key=lambda task: task.start
+        )
+
+    def remove_unchecked_tasks(self):
+        """
+        Drop every unchecked task and its indented metadata
+
+        Returns:
+            int: Number of task lines removed
+        """
+        for task in self.tasks:
+            self._removed.update(range(task.start, task.end))
+        return len(self.tasks)
+
+    def mark_complete(self):
+        """Flip "status: in-progress" to "status: complete" """
+        self._complete = True
+
+    def to_text(self):
+        """Serialize the plan with all pending edits applied"""
+        parts = []
+        for i, line in enumerate(self.lines):
+            if i in self._removed:
+                continue
+            if self._complete and STATUS_IN_PROGRESS in line:
+                line = line.replace(STATUS_IN_PROGRESS, STATUS_COMPLETE)
+            parts.append(line)
+        return ''.join(parts)
+
+    def save(self, path):
+        """
+        Write the plan back in a single write
+
+        Returns:
+            bool: False if nothing changed (the file is left untouched)
+        """
+        return vault_io.write_text(path, self.to_text())
@@ -8,32 +8,40 @@ This ensures incomplete tasks flow to the next day.
 
 import sys
 import os
-import re
-from datetime import datetime
+from datetime import datetime, timedelta
 
 # Add add-task scripts to path for BacklogManager
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../add-task/scripts'))
 
 try:
     from backlog_manager import BacklogManager
+    import vault_io
 except ImportError:
     print("[ERROR] Could not import BacklogManager")
     sys.exit(1)
 
+from daily_plan import DailyPlan, clean_task_text
+
 
 class EndOfDayCleanup:
     """Handles end-of-day task cleanup and carryover"""
 
-    def __init__(self, vault_path):
+    def __init__(self, vault_path, archive_days=0):
+        """
+        Args:
+            vault_path: Path to Obsidian vault
+            archive_days: Archive backlog sections older than this many days
+                          (0, the default, disables archival)
+        """
         self.vault_path = vault_path
+        self.archive_days = archive_days
         self.backlog_manager = BacklogManager(vault_path)
 
-    def get_todays_plan_path(self):
-        """Get path to today's daily plan"""
-        today = datetime.now()
-        year = today.strftime("%Y")
-        month = today.strftime("%m")
-        date = today.strftime("%Y-%m-%d")
+    def get_plan_path(self, day):
+        """Get path to the daily plan for a datetime"""
+        year = day.strftime("%Y")
+        month = day.strftime("%m")
+        date = day.strftime("%Y-%m-%d")
 
         plan_path = os.path.join(
             self.vault_path,
@@ -45,6 +53,35 @@ class EndOfDayCleanup:
 
         return plan_path, date
 
+    def get_todays_plan_path(self):
+        """Get path to today's daily plan"""
+        return self.get_plan_path(datetime.now())
+
+    def find_unfinished_plans(self, start_date, end_date):
+        """
+        Find daily plans still marked in-progress between two dates
+
+        Args:
+            start_date: First date in YYYY-MM-DD format
+            end_date: Last date in YYYY-MM-DD format (inclusive)
+
+        Returns:
+            list: (date, plan_path, DailyPlan) tuples, oldest first
+        """
+        plans = []
+        day = datetime.strptime(start_date, "%Y-%m-%d")
+        end = datetime.strptime(end_date, "%Y-%m-%d")
+
+        while day <= end:
+            plan_path, date = self.get_plan_path(day)
+            if os.path.exists(plan_path):
+                plan = DailyPlan.load(plan_path)
+                if plan.status == 'in-progress':
+                    plans.append((date, plan_path, plan))
+            day += timedelta(days=1)
+
+        return plans
+
     def extract_unchecked_tasks(self, plan_content):
         """
         Extract all unchecked tasks from daily plan
@@ -53,100 +90,11 @@ class EndOfDayCleanup:
             dict: Tasks organized by section, with tuples of (task_text, carryover_date)
                   carryover_date is None for new tasks
         """
-        tasks = {
-            'focus': [],
-            'comms': [],
-            'learning': [],
-            'work': [],
-            'emails': [],
-            'messages': [],
-            'reading': [],
-            'other': []
-        }
-
-        current_section = None
-        lines = plan_content.split('\n')
-        i = 0
-
-        while i < len(lines):
-            line = lines[i]
-
-            # Detect section headers
-            if '🧠' in line and line.startswith('##'):
-                current_section = 'focus'
-            elif '💬' in line and line.startswith('##'):
-                # Could be Communications or Messages (legacy)
-                if 'Communications' in line:
-                    current_section = 'comms'
-                else:
-                    current_section = 'messages'
-            elif '🎓' in line and line.startswith('##'):
-                current_section = 'learning'
-            elif '💼' in line and line.startswith('##'):
-                current_section = 'work'
-            elif '📧' in line and line.startswith('##'):
-                # IMPORTANT: Always carry over flagged emails
-                current_section = 'emails'
-            elif 'Flagged Emails' in line and line.startswith('##'):
-                # Additional check for email section (in case emoji doesn't match)
-                current_section = 'emails'
-            elif '📚' in line and line.startswith('##'):
-                current_section = 'reading'
-            elif '📋' in line and line.startswith('##'):
-                # Could be Work Tasks or other sections
-                current_section = 'other'
-            elif '🔄' in line and line.startswith('##'):
-                # Old tasks backlog section
-                current_section = 'other'
-            elif '💡' in line and line.startswith('##'):
-                # Reflection section - stop processing
-                break
-            elif '📅' in line and line.startswith('##'):
-                # Calendar section - skip (meetings aren't tasks to carry over)
-                current_section = None
-
-            # Extract unchecked tasks (both - [ ] and numbered 1. [ ] formats)
-            stripped = line.strip()
-            if current_section and (stripped.startswith('- [ ]') or re.match(r'^\d+\.\s*\[\s*\]', stripped)):
-                # Extract task text (remove checkbox)
-                if stripped.startswith('- [ ]'):
-                    task_text = stripped[6:].strip()
-                else:
-                    # Numbered format like "1. [ ]"
-                    task_text = re.sub(r'^\d+\.\s*\[\s*\]', '', stripped).strip()
-
-                # Skip if it's metadata line
-                if task_text and not task_text.startswith('*') and not task_text.startswith('-'):
-                    # Clean up task text - remove formatting like ** and other metadata
-                    task_text = self._clean_task_text(task_text)
-
-                    # Check next line for "Carried over from:" indicator
-                    carryover_date = None
-                    if i + 1 < len(lines):
-                        next_line = lines[i + 1].strip()
-                        # Check if next line has carryover date
-                        match = re.match(r'-\s*\*Carried over from:\*\s*(\d{4}-\d{2}-\d{2})', next_line)
-                        if match:
-                            carryover_date = match.group(1)
-
-                    if task_text:
-                        tasks[current_section].append((task_text, carryover_date))
-
-            i += 1
-
-        return tasks
+        return DailyPlan.parse(plan_content).unchecked_tasks()
 
     def _clean_task_text(self, text):
         """Clean task text - remove bold markers, extract main text"""
-        # Remove bold markers
-        text = re.sub(r'\*\*(.*?)\*\*:', r'\1:', text)
-        text = re.sub(r'\*\*(.*?)\*\*', r'\1', text)
-
-        # If it's a multi-line task with details, just take the first line
-        if '\n' in text:
-            text = text.split('\n')[0]
-
-        return text.strip()
+        return clean_task_text(text)
 
     def add_to_backlog_carryover(self, date, tasks):
         """
@@ -155,83 +103,27 @@ class EndOfDayCleanup:
         Args:
             date: Date in YYYY-MM-DD format (today's date)
             tasks: Dict of tasks by category, with tuples of (task_text, original_carryover_date)
-        """
-        backlog_file = self.backlog_manager.backlog_file
-        self.backlog_manager.ensure_backlog_exists()
-
-        try:
-            with open(backlog_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Parse date for display
-            date_obj = datetime.strptime(date, "%Y-%m-%d")
-            day_name = date_obj.strftime("%A")
-
-            # Create carryover section header
-            carryover_header = f"## 🔄 Backlog due from {date} ({day_name})"
 
-            # Count total tasks
-            total_tasks = sum(len(task_list) for task_list in tasks.values())
+        Returns:
+            int or None: Number of tasks written to the backlog (duplicates of
+                         tasks already waiting there are merged, not written),
+                         or None on failure
+        """
+        # Count total tasks
+        total_tasks = sum(len(task_list) for task_list in tasks.values())
 
-            if total_tasks == 0:
-                print(f"[*] No unchecked tasks to carry over from {date}")
-                return True
+        if total_tasks == 0:
+            print(f"[*] No unchecked tasks to carry over from {date}")
+            return 0
 
-            # Check if section already exists (shouldn't happen, but handle it)
-            if carryover_header in content:
-                print(f"[!] Warning: Carryover section for {date} already exists")
-                return False
+        backlog_tasks = {category: task_list for category, task_list in tasks.items() if task_list}
 
-            # Build carryover section
-            section_lines = [f"\n{carryover_header}\n"]
-            section_lines.append(f"*{total_tasks} tasks carried over from {day_name}*\n")
-
-            # Add tasks by category
-            category_map = {
-                'focus': ('🧠', 'Focus Work'),
-                'comms': ('💬', 'Communications'),
-                'learning': ('🎓', 'Learning & Development'),
-                'work': ('💼', 'Work Tasks'),
-                'emails': ('📧', 'Flagged Emails'),
-                'messages': ('💬', 'Messages'),
-                'reading': ('📚', 'Reading & Learning'),
-                'other': ('📋', 'Other Tasks')
-            }
-
-            for category, (emoji, name) in category_map.items():
-                if tasks.get(category):
-                    section_lines.append(f"\n### {emoji} {name}")
-                    for task_tuple in tasks[category]:
-                        # task_tuple is (task_text, original_carryover_date or None)
-                        task_text, original_date = task_tuple
-                        section_lines.append(f"- [ ] {task_text}")
-                        # Use original carryover date if it exists, otherwise use today's date
-                        carryover_date = original_date if original_date else date
-                        section_lines.append(f"  - *Carried over from:* {carryover_date}")
-
-            section_lines.append("\n---\n")
-
-            # Insert at the end (before final newlines)
-            new_section = '\n'.join(section_lines)
-            content = content.rstrip() + '\n' + new_section + '\n'
-
-            # Update last_updated timestamp
-            content = re.sub(
-                r'last_updated: .*',
-                f'last_updated: {datetime.now().strftime("%Y-%m-%d %H:%M")}',
-                content
-            )
-
-            # Write back
-            with open(backlog_file, 'w', encoding='utf-8') as f:
-                f.write(content)
-
-            print(f"[OK] Carried over {total_tasks} tasks to backlog (preserving original dates)")
-            return True
+        written = self.backlog_manager.add_carryover_section(date, backlog_tasks)
+        if written is None:
+            return None
 
-        except Exception as e:
-            print(f"[ERROR] Failed to add tasks to backlog: {e}")
-            return False
+        print(f"[OK] Carried over {written} tasks to backlog (preserving original dates)")
+        return written
 
     def remove_unchecked_tasks(self, plan_path):
         """
@@ -241,35 +133,12 @@ class EndOfDayCleanup:
             plan_path: Path to the daily plan file
         """
         try:
-            with open(plan_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-
-            cleaned_lines = []
-            skip_next_indent = False
-
-            for i, line in enumerate(lines):
-                # Check if this is an unchecked task
-                stripped = line.strip()
-                if stripped.startswith('- [ ]') or re.match(r'^\d+\.\s*\[\s*\]', stripped):
-                    # Skip this unchecked task
-                    skip_next_indent = True
-                    continue
-
-                # Skip indented metadata lines immediately after unchecked tasks
-                if skip_next_indent and line.startswith('  ') and stripped.startswith('-'):
-                    # This is metadata for the task (like "- *Estimated time:*")
-                    continue
-                else:
-                    skip_next_indent = False
-
-                # Keep this line
-                cleaned_lines.append(line)
-
-            # Write back
-            with open(plan_path, 'w', encoding='utf-8') as f:
-                f.writelines(cleaned_lines)
-
-            print(f"[OK] Removed unchecked tasks from daily plan")
+            plan = DailyPlan.load(plan_path)
+            plan.remove_unchecked_tasks()
+            if plan.save(plan_path):
+                print(f"[OK] Removed unchecked tasks from daily plan")
+            else:
+                print(f"[*] No unchecked tasks in daily plan")
             return True
 
         except Exception as e:
@@ -284,31 +153,46 @@ class EndOfDayCleanup:
             plan_path: Path to the daily plan file
         """
         try:
-            with open(plan_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Update status from in-progress to complete
-            updated_content = re.sub(
-                r'status: in-progress',
-                'status: complete',
-                content
-            )
-
-            # Write back
-            with open(plan_path, 'w', encoding='utf-8') as f:
-                f.write(updated_content)
-
-            print(f"[OK] Plan status updated to 'complete'")
+            plan = DailyPlan.load(plan_path)
+            plan.mark_complete()
+            if plan.save(plan_path):
+                print(f"[OK] Plan status updated to 'complete'")
+            else:
+                print(f"[*] Plan is not marked in-progress; left unchanged")
             return True
 
         except Exception as e:
             print(f"[ERROR] Failed to mark plan as complete: {e}")
             return False
 
+    def maintain_backlog(self):
+        """Daily backlog housekeeping done before carrying tasks over"""
+        # Fold any journaled backlog writes back into backlog.md once a day
+        self.backlog_manager.compact()
+
+        # Move stale backlog sections out of the hot file
+        if self.archive_days > 0:
+            self.backlog_manager.archive_stale_sections(self.archive_days)
+
     def run_cleanup(self):
-        """Main cleanup process"""
+        """
+        Main cleanup process
+
+        Backlog housekeeping, the carryover and the plan edits are batched so
+        each file is written at most once.
+        """
+        try:
+            with vault_io.batch():
+                return self._run_cleanup()
+        except OSError as e:
+            print(f"[ERROR] Failed to write cleanup changes: {e}")
+            return False
+
+    def _run_cleanup(self):
         print(f"[*] Running end-of-day cleanup at {datetime.now().strftime('%Y-%m-%d %H:%M')}")
 
+        self.maintain_backlog()
+
         # Get today's plan
         plan_path, today_date = self.get_todays_plan_path()
 
@@ -320,12 +204,12 @@ class EndOfDayCleanup:
         print(f"[*] Reading daily plan: {plan_path}")
 
         try:
-            with open(plan_path, 'r', encoding='utf-8') as f:
-                plan_content = f.read()
+            # One parse serves extraction, pruning and the status flip
+            plan = DailyPlan.load(plan_path)
 
             # Extract unchecked tasks
             print(f"[*] Extracting unchecked tasks...")
-            tasks = self.extract_unchecked_tasks(plan_content)
+            tasks = plan.unchecked_tasks()
 
             # Count tasks
             total = sum(len(task_list) for task_list in tasks.values())
@@ -334,7 +218,8 @@ class EndOfDayCleanup:
                 print(f"[OK] All tasks completed! Nothing to carry over.")
                 # Mark plan as complete even when all tasks are done
                 print(f"[*] Marking daily plan as complete...")
-                self.mark_plan_complete(plan_path)
+                plan.mark_complete()
+                plan.save(plan_path)
                 print(f"[OK] Daily plan marked as complete")
                 return True
 
@@ -344,24 +229,22 @@ class EndOfDayCleanup:
                     print(f"  - {category}: {len(task_list)} tasks")
 
             # Explicitly warn if no emails were found (they should usually be there)
-            if not tasks.get('emails'):
+            if not tasks.get('email'):
                 print(f"[*] Note: No flagged emails found to carry over")
 
             # Add to backlog
             print(f"[*] Adding tasks to backlog...")
-            success = self.add_to_backlog_carryover(today_date, tasks)
+            written = self.add_to_backlog_carryover(today_date, tasks)
 
-            if success:
-                # Remove unchecked tasks from daily plan
-                print(f"[*] Removing unchecked tasks from daily plan...")
-                self.remove_unchecked_tasks(plan_path)
-
-                # Mark today's plan as complete
-                print(f"[*] Marking daily plan as complete...")
-                self.mark_plan_complete(plan_path)
+            if written is not None:
+                # Remove unchecked tasks and mark the plan complete in a single write
+                print(f"[*] Removing unchecked tasks and marking daily plan as complete...")
+                plan.remove_unchecked_tasks()
+                plan.mark_complete()
+                plan.save(plan_path)
 
                 print(f"[OK] End-of-day cleanup completed successfully!")
-                print(f"[OK] {total} tasks moved to backlog and removed from daily plan")
+                print(f"[OK] {total} tasks removed from daily plan, {written} added to backlog")
                 print(f"[OK] Tasks will appear in tomorrow's 'Old tasks backlog' section")
                 print(f"[OK] Daily plan marked as complete")
                 return True
@@ -375,6 +258,84 @@ class EndOfDayCleanup:
             traceback.print_exc()
             return False
 
+    def run_catch_up(self, start_date, end_date=None):
+        """
+        Clean up every plan left in-progress between two dates (e.g. nights
+        the machine was asleep at 11:45 PM)
+
+        All carryover sections are added to the backlog with a single write;
+        each plan is then pruned and marked complete with one write. Writes
+        are batched like run_cleanup.
+
+        Args:
+            start_date: First date in YYYY-MM-DD format
+            end_date: Last date in YYYY-MM-DD format (default: yesterday, so
+                      today's in-progress plan is left alone)
+
+        Returns:
+            bool: Success status
+        """
+        try:
+            with vault_io.batch():
+                return self._run_catch_up(start_date, end_date)
+        except OSError as e:
+            print(f"[ERROR] Failed to write catch-up changes: {e}")
+            return False
+
+    def _run_catch_up(self, start_date, end_date):
+        end_date = end_date or (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+        print(f"[*] Running end-of-day catch-up for {start_date} to {end_date}")
+
+        try:
+            self.maintain_backlog()
+
+            plans = self.find_unfinished_plans(start_date, end_date)
+            if not plans:
+                print(f"[*] No in-progress daily plans found")
+                return True
+
+            print(f"[*] Found {len(plans)} in-progress daily plan(s)")
+
+            carryover = []
+            totals = {}
+            for date, plan_path, plan in plans:
+                tasks = {category: task_list for category, task_list in plan.unchecked_tasks().items() if task_list}
+                totals[date] = sum(len(task_list) for task_list in tasks.values())
+                print(f"  - {date}: {totals[date]} unchecked tasks")
+                if tasks:
+                    carryover.append((date, tasks))
+
+            # One backlog write for every missed day
+            added = dict(zip(
+                [date for date, _ in carryover],
+                self.backlog_manager.add_carryover_sections(carryover) if carryover else []
+            ))
+
+            success = True
+            removed = 0
+            carried = 0
+            for date, plan_path, plan in plans:
+                if date in added and added[date] is None:
+                    print(f"[ERROR] Skipping {date}: its tasks could not be carried over")
+                    success = False
+                    continue
+
+                plan.remove_unchecked_tasks()
+                plan.mark_complete()
+                plan.save(plan_path)
+                removed += totals[date]
+                carried += added.get(date, 0)
+
+            print(f"[OK] {removed} tasks removed from {len(plans)} plan(s), {carried} added to backlog; "
+                  f"plans marked as complete")
+            return success
+
+        except Exception as e:
+            print(f"[ERROR] Error during catch-up: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+
 
 def main():
     """CLI interface"""
@@ -383,6 +344,13 @@ def main():
     parser = argparse.ArgumentParser(description='End of day cleanup for daily plans')
     parser.add_argument('vault_path', nargs='?', help='Path to Obsidian vault')
     parser.add_argument('--config', help='Use vault path from plan-my-day config', action='store_true')
+    parser.add_argument('--since', metavar='YYYY-MM-DD',
+                        help='Catch up on every in-progress plan from this date through yesterday '
+                             '(use --range to include today)')
+    parser.add_argument('--range', nargs=2, metavar=('START', 'END'),
+                        help='Catch up on every in-progress plan between two dates (inclusive)')
+    parser.add_argument('--archive-days', type=int, default=0,
+                        help='Archive backlog sections older than this many days (default: 0, no archival)')
 
     args = parser.parse_args()
 
@@ -407,8 +375,13 @@ def main():
         vault_path = args.vault_path
 
     # Run cleanup
-    cleanup = EndOfDayCleanup(vault_path)
-    success = cleanup.run_cleanup()
+    cleanup = EndOfDayCleanup(vault_path, archive_days=args.archive_days)
+    if args.range:
+        success = cleanup.run_catch_up(*args.range)
+    elif args.since:
+        success = cleanup.run_catch_up(args.since)
+    else:
+        success = cleanup.run_cleanup()
 
     sys.exit(0 if success else 1)
 
@@ -16,6 +16,85 @@ except ImportError:
     print("Run: pip install pywin32")
     sys.exit(1)
 
+from outlook_table import PR_BODY, PR_DISPLAY_CC, PR_DISPLAY_TO, count_names, table_rows
+from recurrence import occurrences_between
+from recurrence_index import RecurrenceIndex, read_master
+
+
+def _once(load):
+    """Wrap a loader so the COM item it returns is only fetched on first use"""
+    loaded = []
+
+    def get():
+        if not loaded:
+            loaded.append(load())
+        return loaded[0]
+    return get
+
+
+# Event fields that cost extra COM calls (or Table columns); they are only
+# read when a caller asks for them (see CalendarEvent)
+LAZY_FIELDS = ('organizer', 'categories', 'attendee_count', 'body_preview')
+
+# Defaults when a lazy field can't be read
+LAZY_DEFAULTS = {'organizer': "", 'categories': "", 'attendee_count': 0, 'body_preview': ""}
+
+
+def _attendee_count(item):
+    recipients = item.Recipients
+    return recipients.Count if recipients else 0
+
+
+def _lazy_fields(open_item):
+    """Loaders for an appointment's LAZY_FIELDS (open_item returns the item)"""
+    return {
+        'organizer': lambda: open_item().Organizer or "",
+        'categories': lambda: open_item().Categories or "",
+        'attendee_count': lambda: _attendee_count(open_item()),
+        'body_preview': lambda: (open_item().Body or "")[:100].strip()
+    }
+
+
+class CalendarEvent(dict):
+    """
+    Parsed calendar event: a dict whose LAZY_FIELDS are read from Outlook
+    on first access (event['attendee_count'], event.get(...)) and then kept
+
+    Lazy fields not read yet aren't in keys()/items() or JSON output; call
+    load() first when the whole event is needed.
+    """
+
+    def __init__(self, fields, loaders=None):
+        super().__init__(fields)
+        self._loaders = {key: loader for key, loader in (loaders or {}).items() if not dict.__contains__(self, key)}
+
+    def __missing__(self, key):
+        loader = self._loaders.pop(key, None)
+        if loader is None:
+            raise KeyError(key)
+        try:
+            value = loader()
+        except Exception:
+            value = LAZY_DEFAULTS.get(key)
+        self[key] = value
+        return value
+
+    def __contains__(self, key):
+        return super().__contains__(key) or key in self._loaders
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def load(self, fields=None):
+        """Read the given lazy fields now (all of them if fields is None)"""
+        for key in list(self._loaders if fields is None else fields):
+            if key in self._loaders:
+                self[key]
+        return self
+
+    def copy(self):
+        return CalendarEvent(self, self._loaders)
+
 
 class OutlookMAPIFetcher:
     """Direct access to Outlook via MAPI"""
@@ -35,172 +114,104 @@ class OutlookMAPIFetcher:
             print("  3. You've opened Outlook at least once")
             sys.exit(1)
 
-    def fetch_today_events(self, accepted_only=True):
+    # Keywords to exclude from calendar (personal blocks, not real meetings)
+    EXCLUDE_KEYWORDS = [
+        'focus time',
+        'lunch',
+        'break',
+        'personal time',
+        'deep work',
+        'do not schedule',
+        'hold',
+        'block',
+        'learning time'
+    ]
+
+    # Event fields used by format_for_daily_plan (the /plan-my-day path)
+    DAILY_PLAN_FIELDS = (
+        'subject', 'start', 'end', 'start_datetime', 'end_datetime', 'duration_minutes',
+        'location', 'is_all_day', 'response_status', 'attendee_count'
+    )
+
+    # Table columns for _fetch_table (see outlook_table.py)
+    EVENT_COLUMNS = {
+        'entry_id': "EntryID",
+        'subject': "Subject",
+        'start': "Start",
+        'end': "End",
+        'all_day': "AllDayEvent",
+        'location': "Location",
+        'meeting_status': "MeetingStatus",
+        'response_status': "ResponseStatus",
+        'is_recurring': "IsRecurring",
+        'modified': "LastModificationTime"
+    }
+
+    # Extra Table columns for each lazy field, added only when it is requested
+    LAZY_COLUMNS = {
+        'organizer': {'organizer': "Organizer"},
+        'categories': {'categories': "Categories"},
+        'attendee_count': {'display_to': PR_DISPLAY_TO, 'display_cc': PR_DISPLAY_CC},
+        'body_preview': {'body': PR_BODY}
+    }
+
+    def fetch_today_events(self, accepted_only=True, fields=None):
         """Fetch today's calendar appointments INCLUDING recurring meetings and exceptions
 
+        Today's appointments and the recurring masters are read in bulk from
+        a calendar Table (see _fetch_table). If that fails, Outlook expands
+        today's window itself (Items.Restrict with IncludeRecurrences), and
+        failing that the calendar's recurring masters are walked item by item
+        (see _fetch_by_master_walk).
+
         Args:
             accepted_only: If True, only return accepted meetings (default: True)
+            fields: Event fields the caller needs (e.g. DAILY_PLAN_FIELDS), or
+                    None for all. Organizer, categories, attendee count and body
+                    preview are only read for returned events that need them;
+                    the others stay available on first access.
         """
         try:
-            import pythoncom
-
             # Get default calendar folder
             calendar = self.namespace.GetDefaultFolder(9)  # 9 = olFolderCalendar
 
             # Set filter for today
             today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+            today_end = today_start + timedelta(days=1)
 
             print(f"[*] Fetching events for {today_start.strftime('%Y-%m-%d')}...")
 
-            # Keywords to exclude from calendar (personal blocks, not real meetings)
-            exclude_keywords = [
-                'focus time',
-                'lunch',
-                'break',
-                'personal time',
-                'deep work',
-                'do not schedule',
-                'hold',
-                'block',
-                'learning time'
-            ]
-
-            # NEW APPROACH: Get master appointments and handle exceptions
-            # This is the only reliable way to get modified recurring occurrences
-            items = calendar.Items
-            items.IncludeRecurrences = False  # Get MASTER appointments only
-            items.Sort("[Start]")
-
-            print(f"[*] Checking calendar for recurring patterns and exceptions...")
+            try:
+                found, exceptions_found, occurrences_found = self._fetch_table(
+                    calendar, today_start, today_end, fields
+                )
+            except Exception as e:
+                print(f"[!] Table read failed ({e}), querying items instead...")
+                try:
+                    found, exceptions_found, occurrences_found = self._fetch_window(calendar, today_start, today_end)
+                except Exception as e:
+                    print(f"[!] Date-window query failed ({e}), checking recurring patterns instead...")
+                    found, exceptions_found, occurrences_found = self._fetch_by_master_walk(calendar, today_start, today_end)
 
             # Parse events
             events = []
-            total_found = 0
+            total_found = len(found)
             excluded_count = 0
-            exceptions_found = 0
-            occurrences_found = 0
-
-            for item in items:
-                try:
-                    if item.IsRecurring:
-                        # This is a recurring master - check for today's occurrence
-                        rec_pattern = item.GetRecurrencePattern()
-
-                        # Check if today is within the recurrence range
-                        pattern_start = rec_pattern.PatternStartDate.date()
-                        pattern_end = rec_pattern.PatternEndDate.date()
-                        today_date = today_start.date()
-
-                        if pattern_start <= today_date <= pattern_end:
-                            # FIRST: Check exceptions (modified occurrences)
-                            try:
-                                exceptions = rec_pattern.Exceptions
-                                for i in range(1, exceptions.Count + 1):  # COM collections are 1-indexed
-                                    try:
-                                        exception = exceptions.Item(i)
-                                        exception_original_date = exception.OriginalDate.date()
-
-                                        # Skip deleted exceptions
-                                        if exception.Deleted:
-                                            continue
-
-                                        # Get the modified appointment
-                                        modified_appt = exception.AppointmentItem
-
-                                        # Check the ACTUAL date of the modified appointment, not the original date
-                                        # This handles meetings that were moved to a different date
-                                        actual_date = modified_appt.Start.date()
-
-                                        # Only include if the ACTUAL date is today
-                                        if actual_date == today_date:
-                                            exceptions_found += 1
-
-                                            event = self._parse_event(modified_appt)
-                                            if event:
-                                                total_found += 1
-
-                                                # Check exclusions
-                                                subject_lower = event['subject'].lower()
-                                                is_excluded = any(kw in subject_lower for kw in exclude_keywords)
-
-                                                if is_excluded:
-                                                    excluded_count += 1
-                                                    continue
-
-                                                # Filter by response status
-                                                if accepted_only:
-                                                    if event['response_status'] in [1, 3]:  # Organizer or Accepted
-                                                        events.append(event)
-                                                else:
-                                                    events.append(event)
-                                    except:
-                                        continue
-                            except:
-                                pass
-
-                            # SECOND: Try to get regular occurrence (if no exception)
-                            # Check if we already have this meeting from exceptions
-                            already_added = any(e['subject'] == item.Subject and
-                                              e['start_datetime'][:10] == today_start.strftime('%Y-%m-%d')
-                                              for e in events)
-
-                            if not already_added:
-                                try:
-                                    # Try to get occurrence
-                                    start_time = rec_pattern.StartTime
-                                    occurrence_dt = datetime.combine(today_date, start_time.time())
-                                    occurrence = rec_pattern.GetOccurrence(occurrence_dt)
-
-                                    occurrences_found += 1
-
-                                    event = self._parse_event(occurrence)
-                                    if event:
-                                        total_found += 1
-
-                                        # Check exclusions
-                                        subject_lower = event['subject'].lower()
-                                        is_excluded = any(kw in subject_lower for kw in exclude_keywords)
-
-                                        if is_excluded:
-                                            excluded_count += 1
-                                            continue
-
-                                        # Filter by response status
-                                        if accepted_only:
-                                            if event['response_status'] in [1, 3]:
-                                                events.append(event)
-                                        else:
-                                            events.append(event)
-                                except pythoncom.com_error:
-                                    # No occurrence for today
-                                    pass
-                    else:
-                        # Non-recurring appointment
-                        event_start = item.Start
-                        if event_start.date() == today_start.date():
-                            event = self._parse_event(item)
-                            if event:
-                                total_found += 1
-
-                                # Check exclusions
-                                subject_lower = event['subject'].lower()
-                                is_excluded = any(kw in subject_lower for kw in exclude_keywords)
-
-                                if is_excluded:
-                                    excluded_count += 1
-                                    continue
-
-                                # Filter by response status
-                                if accepted_only:
-                                    if event['response_status'] in [1, 3]:
-                                        events.append(event)
-                                else:
-                                    events.append(event)
 
-                except Exception as e:
-                    # Silently skip items that can't be processed
+            for event in found:
+                # Check exclusions
+                subject_lower = event['subject'].lower()
+                if any(kw in subject_lower for kw in self.EXCLUDE_KEYWORDS):
+                    excluded_count += 1
                     continue
 
+                # Filter by response status
+                if accepted_only:
+                    if event['response_status'] in [1, 3]:  # Organizer or Accepted
+                        events.append(event)
+                else:
+                    events.append(event)
+
             if accepted_only:
                 print(f"[OK] Found {exceptions_found} recurring exceptions, {occurrences_found} recurring occurrences")
                 print(f"[OK] Found {len(events)} accepted meetings (out of {total_found} total, {excluded_count} personal blocks filtered)")
@@ -208,12 +219,355 @@ class OutlookMAPIFetcher:
                 print(f"[OK] Found {exceptions_found} recurring exceptions, {occurrences_found} recurring occurrences")
                 print(f"[OK] Found {len(events)} events ({excluded_count} personal blocks filtered)")
 
+            for event in events:
+                event.load(fields)
+
             return events
 
         except Exception as e:
             print(f"[ERROR] Error fetching calendar: {e}")
             return []
 
+    def _fetch_table(self, calendar, window_start, window_end, fields=None):
+        """
+        Fetch appointments starting in [window_start, window_end) from a
+        calendar Table: the window's single appointments and every recurring
+        master come back in a few bulk transfers
+
+        Tables don't expand recurrences, so each master's occurrences are
+        worked out from its rule (recurrence index + recurrence.py) and built
+        from the master's row. Items are only opened to read a changed
+        master's rule or a modified occurrence in the window.
+
+        Args:
+            fields: Event fields to read as columns (None for all); other lazy
+                    fields are read from the item if accessed
+
+        Returns:
+            tuple: (parsed events, recurring exceptions, recurring occurrences)
+        """
+        columns = dict(self.EVENT_COLUMNS)
+        for field in LAZY_FIELDS if fields is None else fields:
+            columns.update(self.LAZY_COLUMNS.get(field, {}))
+
+        restriction = (
+            f"([Start] >= '{window_start.strftime('%m/%d/%Y %I:%M %p')}' "
+            f"AND [Start] < '{window_end.strftime('%m/%d/%Y %I:%M %p')}') "
+            f"OR [IsRecurring] = True"
+        )
+        rows = table_rows(calendar, columns, restriction, sort="[Start]")
+
+        try:
+            index = RecurrenceIndex.for_calendar(calendar)
+        except Exception:
+            index = None
+
+        events = []
+        exceptions_found = 0
+        occurrences_found = 0
+        seen_masters = []
+
+        for row in rows:
+            try:
+                if not row['is_recurring']:
+                    if window_start.date() <= row['start'].date() < window_end.date():
+                        events.append(self._parse_row(row))
+                    continue
+
+                entry_id = row['entry_id']
+                seen_masters.append(entry_id)
+                open_master = _once(lambda: self.namespace.GetItemFromID(entry_id))
+
+                entry, _ = self._master_entry(index, entry_id, str(row['modified']), open_master)
+                if entry is None:
+                    found, exceptions, occurrences = self._probe_occurrence(open_master(), window_start.date())
+                else:
+                    found, exceptions, occurrences = self._recurring_events(
+                        entry, lambda: self._parse_row(row), open_master, window_start, window_end
+                    )
+                events.extend(found)
+                exceptions_found += exceptions
+                occurrences_found += occurrences
+            except Exception:
+                # Silently skip items that can't be processed
+                continue
+
+        if index is not None:
+            index.prune(seen_masters)
+            index.save()
+
+        return events, exceptions_found, occurrences_found
+
+    def _fetch_window(self, calendar, window_start, window_end):
+        """
+        Fetch appointments starting in [window_start, window_end), with
+        recurring meetings expanded by Outlook
+
+        Modified occurrences come back at their actual (possibly moved) time
+        and deleted ones not at all, so no recurrence pattern is read here.
+
+        Returns:
+            tuple: (parsed events, recurring exceptions, recurring occurrences)
+        """
+        items = calendar.Items
+        items.Sort("[Start]")
+        items.IncludeRecurrences = True  # Must be set after Sort to expand occurrences
+
+        restriction = (
+            f"[Start] >= '{window_start.strftime('%m/%d/%Y %I:%M %p')}' "
+            f"AND [Start] < '{window_end.strftime('%m/%d/%Y %I:%M %p')}'"
+        )
+        restricted = items.Restrict(restriction)
+
+        events = []
+        exceptions_found = 0
+        occurrences_found = 0
+
+        # Items.Count is meaningless with IncludeRecurrences, so walk with GetFirst/GetNext
+        item = restricted.GetFirst()
+        while item is not None:
+            try:
+                item_start = item.Start
+                if item_start.date() >= window_end.date():
+                    # Sorted by start: nothing later can be in the window
+                    break
+
+                if item_start.date() == window_start.date():
+                    event = self._parse_event(item)
+                    if event:
+                        events.append(event)
+
+                        recurrence_state = item.RecurrenceState  # 2=occurrence, 3=exception
+                        if recurrence_state == 3:
+                            exceptions_found += 1
+                        elif recurrence_state == 2:
+                            occurrences_found += 1
+            except Exception:
+                # Silently skip items that can't be processed
+                pass
+            item = restricted.GetNext()
+
+        return events, exceptions_found, occurrences_found
+
+    def _fetch_by_master_walk(self, calendar, today_start, today_end):
+        """
+        Fallback: walk every master appointment and work out today's
+        occurrences of each recurring series locally
+
+        Recurring masters are looked up in the recurrence index by EntryID and
+        LastModificationTime, and their rules evaluated in Python
+        (recurrence.py), so a master that doesn't occur today costs no COM
+        calls beyond those two properties. Regular occurrences are built from
+        the master; only modified occurrences that land today are opened.
+
+        Returns:
+            tuple: (parsed events, recurring exceptions, recurring occurrences)
+        """
+        # Get master appointments and handle exceptions
+        items = calendar.Items
+        items.IncludeRecurrences = False  # Get MASTER appointments only
+        items.Sort("[Start]")
+
+        today_date = today_start.date()
+        events = []
+        exceptions_found = 0
+        occurrences_found = 0
+
+        try:
+            index = RecurrenceIndex.for_calendar(calendar)
+        except Exception:
+            index = None
+        seen_masters = []
+        cached_masters = 0
+        skipped_masters = 0
+
+        for item in items:
+            try:
+                if item.IsRecurring:
+                    entry_id = item.EntryID
+                    seen_masters.append(entry_id)
+
+                    entry, cached = self._master_entry(index, entry_id, str(item.LastModificationTime), lambda: item)
+                    if cached:
+                        cached_masters += 1
+
+                    if entry is None:
+                        found, exceptions, occurrences = self._probe_occurrence(item, today_date)
+                    else:
+                        found, exceptions, occurrences = self._recurring_events(
+                            entry, lambda: self._parse_event(item), lambda: item, today_start, today_end
+                        )
+                        if not (found or exceptions or occurrences):
+                            skipped_masters += 1
+                    events.extend(found)
+                    exceptions_found += exceptions
+                    occurrences_found += occurrences
+                else:
+                    # Non-recurring appointment
+                    if item.Start.date() == today_date:
+                        event = self._parse_event(item)
+                        if event:
+                            events.append(event)
+
+            except Exception as e:
+                # Silently skip items that can't be processed
+                continue
+
+        if index is not None:
+            index.prune(seen_masters)
+            index.save()
+            print(f"[*] Recurring masters: {len(seen_masters)} total, {cached_masters} from index, "
+                  f"{skipped_masters} ruled out for today without COM calls")
+
+        return events, exceptions_found, occurrences_found
+
+    def _master_entry(self, index, entry_id, modified, open_master):
+        """
+        Recurrence rule and exceptions of a recurring master, from the index
+        when it is unchanged, otherwise read over COM (and indexed)
+
+        Args:
+            index: RecurrenceIndex, or None to always read the master
+            entry_id: Master's EntryID
+            modified: str(LastModificationTime)
+            open_master: Callable returning the master AppointmentItem
+
+        Returns:
+            tuple: (entry or None if the rule can't be read, bool: from index)
+        """
+        if index is not None:
+            entry = index.lookup(entry_id, modified)
+            if entry is not None:
+                return entry, True
+
+        try:
+            entry = read_master(open_master())
+        except Exception:
+            return None, False
+        if index is not None:
+            index.update(entry_id, modified, entry)
+        return entry, False
+
+    def _recurring_events(self, entry, parse_master, open_master, window_start, window_end):
+        """
+        Events for a recurring master's occurrences in [window_start, window_end)
+
+        Args:
+            entry: Recurrence index entry for the master
+            parse_master: Callable returning the master parsed as an event
+            open_master: Callable returning the master AppointmentItem
+            window_start, window_end: Naive datetimes
+
+        Returns:
+            tuple: (parsed events, recurring exceptions, recurring occurrences)
+        """
+        events = []
+        exceptions_found = 0
+        occurrences_found = 0
+        master_event = None
+
+        for occurrence in occurrences_between(entry['pattern'], entry['exceptions'], window_start, window_end):
+            if occurrence.exception is not None:
+                # Modified occurrence: its subject, time or response may differ
+                modified_appt = self._exception_item(open_master(), occurrence.exception['original_date'])
+                if modified_appt is None:
+                    continue
+                exceptions_found += 1
+                event = self._parse_event(modified_appt)
+            else:
+                occurrences_found += 1
+                if master_event is None:
+                    master_event = parse_master()
+                event = self._at_occurrence(master_event, occurrence) if master_event else None
+            if event:
+                events.append(event)
+
+        return events, exceptions_found, occurrences_found
+
+    def _exception_item(self, master, original_date):
+        """
+        The modified appointment replacing a series' occurrence on original_date
+
+        Returns:
+            AppointmentItem, or None if the exception is gone
+        """
+        exceptions = master.GetRecurrencePattern().Exceptions
+        for i in range(1, exceptions.Count + 1):  # COM collections are 1-indexed
+            try:
+                exception = exceptions.Item(i)
+                if not exception.Deleted and exception.OriginalDate.date().isoformat() == original_date:
+                    return exception.AppointmentItem
+            except Exception:
+                continue
+        return None
+
+    def _at_occurrence(self, event, occurrence):
+        """Move an event parsed from a recurring master to one of its occurrences"""
+        # Keep the master's tzinfo so occurrences sort with other events
+        tzinfo = datetime.fromisoformat(event['start_datetime']).tzinfo
+        start_dt = occurrence.start.replace(tzinfo=tzinfo)
+        end_dt = occurrence.end.replace(tzinfo=tzinfo)
+
+        event = event.copy()
+        event['start_datetime'] = start_dt.isoformat()
+        event['end_datetime'] = end_dt.isoformat()
+        event['duration_minutes'] = int((end_dt - start_dt).total_seconds() / 60)
+        if not event['is_all_day']:
+            event['start'] = start_dt.strftime("%I:%M %p").lstrip('0')
+            event['end'] = end_dt.strftime("%I:%M %p").lstrip('0')
+        return event
+
+    def _probe_occurrence(self, item, today_date):
+        """
+        Find today's occurrence of a master whose rule couldn't be read,
+        by asking Outlook for it directly
+
+        Returns:
+            tuple: (parsed events, recurring exceptions, recurring occurrences)
+        """
+        import pythoncom
+
+        events = []
+        exceptions_found = 0
+        occurrences_found = 0
+
+        rec_pattern = item.GetRecurrencePattern()
+        if not rec_pattern.PatternStartDate.date() <= today_date <= rec_pattern.PatternEndDate.date():
+            return events, exceptions_found, occurrences_found
+
+        # Modified occurrences moved onto today
+        try:
+            exceptions = rec_pattern.Exceptions
+            for i in range(1, exceptions.Count + 1):  # COM collections are 1-indexed
+                try:
+                    exception = exceptions.Item(i)
+                    if exception.Deleted:
+                        continue
+                    modified_appt = exception.AppointmentItem
+                    if modified_appt.Start.date() == today_date:
+                        exceptions_found += 1
+                        event = self._parse_event(modified_appt)
+                        if event:
+                            events.append(event)
+                except:
+                    continue
+        except:
+            pass
+
+        if not events:
+            try:
+                occurrence_dt = datetime.combine(today_date, rec_pattern.StartTime.time())
+                occurrence = rec_pattern.GetOccurrence(occurrence_dt)
+                occurrences_found += 1
+                event = self._parse_event(occurrence)
+                if event:
+                    events.append(event)
+            except pythoncom.com_error:
+                # No occurrence for today
+                pass
+
+        return events, exceptions_found, occurrences_found
+
     def _parse_event(self, item):
         """Parse Outlook appointment item"""
         try:
@@ -242,12 +596,6 @@ class OutlookMAPIFetcher:
             # Get location
             location = item.Location or ""
 
-            # Get organizer
-            try:
-                organizer = item.Organizer or ""
-            except:
-                organizer = ""
-
             # Get meeting status
             meeting_status = item.MeetingStatus  # 0=non-meeting, 1=organizer, 3=attendee
 
@@ -257,26 +605,8 @@ class OutlookMAPIFetcher:
             except:
                 response_status = 0
 
-            # Get categories
-            try:
-                categories = item.Categories or ""
-            except:
-                categories = ""
-
-            # Get body/notes (first 100 chars)
-            try:
-                body = item.Body[:100] if item.Body else ""
-            except:
-                body = ""
-
-            # Get attendees count
-            try:
-                recipients = item.Recipients
-                attendee_count = recipients.Count if recipients else 0
-            except:
-                attendee_count = 0
-
-            return {
+            # Organizer, categories, body preview and attendee count are read on first access
+            return CalendarEvent({
                 'subject': subject,
                 'start': start_time,
                 'end': end_time,
@@ -284,19 +614,56 @@ class OutlookMAPIFetcher:
                 'end_datetime': end_dt.isoformat(),
                 'duration_minutes': duration_minutes,
                 'location': location,
-                'organizer': organizer,
                 'is_all_day': is_all_day,
                 'meeting_status': meeting_status,
-                'response_status': response_status,
-                'categories': categories,
-                'attendee_count': attendee_count,
-                'body_preview': body.strip()
-            }
+                'response_status': response_status
+            }, _lazy_fields(lambda: item))
 
         except Exception as e:
             print(f"[!] Error parsing event: {e}")
             return None
 
+    def _parse_row(self, row):
+        """Parse a calendar Table row (see EVENT_COLUMNS) like _parse_event
+
+        Lazy fields whose columns weren't fetched are read from the item if accessed.
+        """
+        start_dt = row['start']
+        end_dt = row['end']
+        is_all_day = bool(row['all_day'])
+
+        if is_all_day:
+            start_time = "All day"
+            end_time = ""
+        else:
+            start_time = start_dt.strftime("%I:%M %p").lstrip('0')
+            end_time = end_dt.strftime("%I:%M %p").lstrip('0')
+
+        event = {
+            'subject': row['subject'] or "Untitled",
+            'start': start_time,
+            'end': end_time,
+            'start_datetime': start_dt.isoformat(),
+            'end_datetime': end_dt.isoformat(),
+            'duration_minutes': int((end_dt - start_dt).total_seconds() / 60),
+            'location': row['location'] or "",
+            'is_all_day': is_all_day,
+            'meeting_status': row['meeting_status'],
+            'response_status': row['response_status'] or 0
+        }
+        if 'organizer' in row:
+            event['organizer'] = row['organizer'] or ""
+        if 'categories' in row:
+            event['categories'] = row['categories'] or ""
+        if 'display_to' in row:
+            # Recipients can't be a Table column: count the To/Cc display names
+            event['attendee_count'] = count_names(row['display_to'], row['display_cc'])
+        if 'body' in row:
+            event['body_preview'] = (row['body'] or "")[:100].strip()
+
+        open_item = _once(lambda: self.namespace.GetItemFromID(row['entry_id']))
+        return CalendarEvent(event, _lazy_fields(open_item))
+
     def format_for_daily_plan(self, events):
         """Format events for daily plan markdown"""
         if not events:
@@ -413,7 +780,10 @@ def main():
 
         # Fetch events (accepted only by default, unless --all flag used)
         accepted_only = not args.all
-        events = fetcher.fetch_today_events(accepted_only=accepted_only)
+        events = fetcher.fetch_today_events(
+            accepted_only=accepted_only,
+            fields=None if args.json else OutlookMAPIFetcher.DAILY_PLAN_FIELDS
+        )
 
         if not events:
             print("\n[*] No events found for today")
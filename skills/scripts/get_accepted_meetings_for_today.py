@@ -25,11 +25,16 @@ def get_accepted_meetings_for_today():
     """
     Main function: Get accepted meetings for today
 
+    Meetings are plain dicts holding only OutlookMAPIFetcher.DAILY_PLAN_FIELDS
+    (subject, start, end, start_datetime, end_datetime, duration_minutes,
+    location, is_all_day, response_status, attendee_count); they keep no
+    reference to Outlook, so they can be stored or serialized as is.
+
     Returns:
         dict: {
             'success': bool,
             'count': int,
-            'meetings': list,
+            'meetings': list,  # dicts of DAILY_PLAN_FIELDS
             'formatted_markdown': str,
             'total_meeting_hours': float,
             'available_focus_hours': float
@@ -40,7 +45,9 @@ def get_accepted_meetings_for_today():
         fetcher = OutlookMAPIFetcher()
 
         # Fetch accepted meetings only (filters tentative, declined, personal blocks)
-        events = fetcher.fetch_today_events(accepted_only=True)
+        events = fetcher.fetch_today_events(
+            accepted_only=True, fields=OutlookMAPIFetcher.DAILY_PLAN_FIELDS
+        )
 
         if not events:
             return {
@@ -55,6 +62,12 @@ def get_accepted_meetings_for_today():
         # Format for daily plan
         formatted = fetcher.format_for_daily_plan(events)
 
+        # Plain dicts of the fields read above, detached from the COM items
+        meetings = [
+            {field: event[field] for field in OutlookMAPIFetcher.DAILY_PLAN_FIELDS}
+            for event in events
+        ]
+
         # Calculate totals
         total_minutes = sum(e['duration_minutes'] for e in events)
         total_hours = total_minutes / 60.0
@@ -63,7 +76,7 @@ def get_accepted_meetings_for_today():
         return {
             'success': True,
             'count': len(events),
-            'meetings': events,
+            'meetings': meetings,
             'formatted_markdown': formatted,
             'total_meeting_hours': round(total_hours, 1),
             'available_focus_hours': round(available_hours, 1)
@@ -21,6 +21,19 @@ except ImportError:
     sys.exit(1)
 
 
+# The daily plan has no Messages section; legacy "💬 Messages" tasks are
+# shown under Communications, as before categories were split
+PLAN_CATEGORY = {'message': 'comms'}
+
+
+def plan_categories(by_category):
+    """Merge categories without a daily plan section into the one that shows them"""
+    merged = {}
+    for category, task_list in by_category.items():
+        merged.setdefault(PLAN_CATEGORY.get(category, category), []).extend(task_list)
+    return merged
+
+
 def get_carryover_tasks(vault_path):
     """
     Get all carryover tasks (from "Backlog due from" sections) organized by category
@@ -29,96 +42,21 @@ def get_carryover_tasks(vault_path):
         dict: Tasks organized by category with carryover date info
               e.g., {'focus': [('task text', '2026-02-09')], 'email': [...]}
     """
-    try:
-        backlog_file = os.path.join(vault_path, "DailyPlans", "backlog.md")
-
-        if not os.path.exists(backlog_file):
-            return {}
-
-        with open(backlog_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Parse all "Backlog due from" sections
-        carryover_by_category = {}
-        lines = content.split('\n')
-        in_carryover = False
-        current_date = None
-        current_category = None
-
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-
-            # Check for carryover section header
-            if line.startswith('## 🔄 Backlog due from'):
-                in_carryover = True
-                # Extract date from header like "## 🔄 Backlog due from 2026-02-09 (Monday)"
-                import re
-                match = re.search(r'from (\d{4}-\d{2}-\d{2})', line)
-                if match:
-                    current_date = match.group(1)
-
-            # Check for new main section (not in carryover anymore)
-            elif line.startswith('## ') and not line.startswith('###'):
-                in_carryover = False
-                current_category = None
-                current_date = None
-
-            # Check for category subsections within carryover
-            elif in_carryover and line.startswith('### '):
-                # Map emoji headers to category names
-                if '🧠' in line or 'Focus Work' in line:
-                    current_category = 'focus'
-                elif '📧' in line or 'Flagged Emails' in line or 'Email' in line:
-                    current_category = 'email'
-                elif '💬' in line or 'Communications' in line or 'Messages' in line:
-                    current_category = 'comms'
-                elif '💼' in line or 'Work Tasks' in line:
-                    current_category = 'work'
-                elif '🎓' in line or 'Learning' in line:
-                    current_category = 'learning'
-                elif '📚' in line or 'Reading' in line:
-                    current_category = 'reading'
-                else:
-                    current_category = 'other'
-
-            # Check for task lines
-            elif in_carryover and current_category and line.strip().startswith('- [ ]'):
-                # Extract task text (remove checkbox)
-                task = line.strip()[6:].strip()
-
-                # Initialize category if needed
-                if current_category not in carryover_by_category:
-                    carryover_by_category[current_category] = []
-
-                # Check next line for "Carried over from:" indicator
-                task_carryover_date = current_date  # Default to section date
-                if i + 1 < len(lines):
-                    next_line = lines[i + 1].strip()
-                    # Check if next line has carryover date
-                    match = re.match(r'-\s*\*Carried over from:\*\s*(\d{4}-\d{2}-\d{2})', next_line)
-                    if match:
-                        task_carryover_date = match.group(1)  # Use task's own date!
-
-                # Add task with its own carryover date (not section date)
-                carryover_by_category[current_category].append((task, task_carryover_date))
-
-            i += 1
-
-        return carryover_by_category
-
-    except Exception as e:
-        print(f"[ERROR] Failed to get carryover tasks: {e}")
-        return {}
+    return plan_categories(BacklogManager(vault_path).get_carryover_tasks())
 
 
-def get_backlog_tasks_for_date(vault_path, date):
+def get_backlog_tasks_for_date(vault_path, date, remove=False):
     """
     Get backlog tasks for a specific date and format for daily plan
 
+    The backlog is read once; date tasks and carryover tasks come out of the
+    same pass. With remove=True the date's tasks and ALL carryover sections
+    are pruned and the backlog is written once.
+
     Args:
         vault_path: Path to Obsidian vault
         date: Date in YYYY-MM-DD format
+        remove: Remove the returned tasks from the backlog
 
     Returns:
         dict: {
@@ -126,17 +64,17 @@ def get_backlog_tasks_for_date(vault_path, date):
             'tasks_by_category': dict,
             'total_count': int,
             'formatted_sections': dict,  # Formatted markdown by category (includes carryover)
-            'carryover_count': int  # Number of carryover tasks
+            'carryover_count': int,  # Number of carryover tasks
+            'removed': bool  # True if tasks were removed from the backlog
         }
     """
     try:
         manager = BacklogManager(vault_path)
 
-        # Get tasks for this date
-        tasks = manager.get_tasks_for_date(date)
-
-        # Get carryover tasks organized by category
-        carryover_tasks = get_carryover_tasks(vault_path)
+        # Date tasks and carryover tasks from a single read (and single write on remove)
+        tasks, carryover_tasks = manager.take_tasks_for_date(date, remove=remove)
+        tasks = plan_categories(tasks)
+        carryover_tasks = plan_categories(carryover_tasks)
 
         if not tasks and not carryover_tasks:
             return {
@@ -144,7 +82,8 @@ def get_backlog_tasks_for_date(vault_path, date):
                 'tasks_by_category': {},
                 'total_count': 0,
                 'formatted_sections': {},
-                'carryover_count': 0
+                'carryover_count': 0,
+                'removed': False
             }
 
         # Format tasks by category for daily plan
@@ -190,7 +129,8 @@ def get_backlog_tasks_for_date(vault_path, date):
             'tasks_by_category': tasks,
             'total_count': total_count,
             'formatted_sections': formatted_sections,
-            'carryover_count': carryover_count
+            'carryover_count': carryover_count,
+            'removed': remove
         }
 
     except Exception as e:
@@ -220,19 +160,17 @@ def remove_backlog_tasks(vault_path, date):
         date: Date in YYYY-MM-DD format
 
     Returns:
-        bool: Success status
+        bool: True if any tasks were removed; False if there were none or
+              the backlog couldn't be written
     """
     try:
         manager = BacklogManager(vault_path)
 
-        # Remove date-specific tasks
-        date_removed = manager.remove_tasks_for_date(date)
-
-        # Remove ALL carryover sections (not just for this date)
-        # Since when we create a daily plan, all carryover tasks are moved to it
-        sections_removed = manager.remove_all_carryover_sections()
+        # Remove date-specific tasks and ALL carryover sections (not just for
+        # this date) in one write, since they are all now in the daily plan
+        tasks, carryover_tasks = manager.take_tasks_for_date(date, remove=True)
 
-        return date_removed or sections_removed > 0
+        return bool(tasks or carryover_tasks)
     except Exception as e:
         print(f"[ERROR] Could not remove backlog tasks: {e}")
         return False
@@ -253,8 +191,8 @@ def main():
     if not args.date:
         args.date = datetime.now().strftime("%Y-%m-%d")
 
-    # Get tasks
-    result = get_backlog_tasks_for_date(args.vault_path, args.date)
+    # Get tasks (and prune them from the backlog in the same pass if requested)
+    result = get_backlog_tasks_for_date(args.vault_path, args.date, remove=args.remove)
 
     if result['success']:
         new_task_count = result['total_count']
@@ -280,13 +218,8 @@ def main():
         else:
             print("\nNo tasks for this date.")
 
-        # Remove tasks if requested
-        if args.remove and total > 0:
-            print(f"\n[*] Removing tasks from backlog...")
-            if remove_backlog_tasks(args.vault_path, args.date):
-                print(f"[OK] Tasks removed from backlog")
-            else:
-                print(f"[ERROR] Failed to remove tasks from backlog")
+        if result['removed']:
+            print(f"[OK] Tasks removed from backlog")
     else:
         print(f"\n[ERROR] Failed to fetch backlog tasks")
         print(f"[ERROR] {result.get('error', 'Unknown error')}")
@@ -17,6 +17,28 @@ except ImportError:
     print("Run: pip install pywin32")
     sys.exit(1)
 
+from outlook_table import PR_FLAG_STATUS, table_rows
+
+
+# 4501-01-01 is Outlook's "no date"
+NO_DATE_YEAR = 4501
+
+
+def flag_due_date(*values):
+    """First real date among flag due values (TaskDueDate, FlagDueBy), or None"""
+    for value in values:
+        if value and value.year != NO_DATE_YEAR:
+            return value.date()
+    return None
+
+
+def _item_property(item, name):
+    """A COM item's property, or None if it can't be read"""
+    try:
+        return getattr(item, name)
+    except Exception:
+        return None
+
 
 class OutlookEmailFetcher:
     """Fetch flagged emails from Outlook"""
@@ -35,6 +57,10 @@ class OutlookEmailFetcher:
     def fetch_flagged_emails_from_folder(self, folder_id, folder_name):
         """Fetch emails flagged with due date of today from a specific folder
 
+        Flagged messages are read in bulk from a folder Table restricted to
+        flagged items (see _flagged_from_table); if the Table can't be read,
+        the most recent messages are checked one by one instead.
+
         Args:
             folder_id: Outlook folder constant (6=Inbox, 5=Sent Items)
             folder_name: Human-readable folder name for logging
@@ -45,75 +71,24 @@ class OutlookEmailFetcher:
         try:
             # Get folder
             folder = self.namespace.GetDefaultFolder(folder_id)
-            messages = folder.Items
-
-            # Sort by received/sent time (most recent first)
-            time_field = "[ReceivedTime]" if folder_id == 6 else "[SentOn]"
-            messages.Sort(time_field, True)
 
             # Get today's date range
             today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
 
             print(f"[*] Searching {folder_name} for flagged emails due today ({today_start.strftime('%Y-%m-%d')})...")
 
-            flagged_emails = []
-            checked_count = 0
-            max_check = 500  # Only check recent emails (last 500)
-
-            for message in messages:
-                checked_count += 1
-                if checked_count > max_check:
-                    break
-
-                try:
-                    # Check if email is flagged
-                    flag_status = message.FlagStatus
-                    # 0 = not flagged, 1 = complete, 2 = flagged
-                    if flag_status != 2:
-                        continue
-
-                    # Get flag due date - try both TaskDueDate and FlagDueBy
-                    due_date = None
-                    try:
-                        # Try TaskDueDate first (this is where Outlook stores flag due dates)
-                        task_due = message.TaskDueDate
-                        if task_due and task_due.year != 4501:  # 4501 is Outlook's default "no date"
-                            due_date = task_due.date()
-                    except:
-                        pass
-
-                    # If TaskDueDate didn't work, try FlagDueBy
-                    if not due_date:
-                        try:
-                            flag_due = message.FlagDueBy
-                            if flag_due and flag_due.year != 4501:
-                                due_date = flag_due.date()
-                        except:
-                            pass
-
-                    # Check if due date is today
-                    if due_date and due_date == today_start.date():
-                        # Get timestamp (received or sent depending on folder)
-                        timestamp = message.ReceivedTime if folder_id == 6 else message.SentOn
-
-                        email_info = {
-                            'subject': message.Subject or "No Subject",
-                            'sender': message.SenderName or "Unknown",
-                            'sender_email': message.SenderEmailAddress or "",
-                            'received': timestamp.strftime("%Y-%m-%d %H:%M") if timestamp else "",
-                            'due_date': due_date.strftime("%Y-%m-%d"),
-                            'importance': message.Importance,  # 0=low, 1=normal, 2=high
-                            'unread': message.UnRead,
-                            'size_kb': message.Size / 1024 if message.Size else 0,
-                            'folder': folder_name  # Track which folder this came from
-                        }
-                        flagged_emails.append(email_info)
-
-                except Exception as e:
-                    # Skip emails that can't be processed
-                    continue
+            try:
+                flagged_emails, checked_count = self._flagged_from_table(
+                    folder, folder_id, folder_name, today_start.date()
+                )
+                print(f"[OK] Checked {checked_count} flagged emails in {folder_name}")
+            except Exception as e:
+                print(f"[!] Table read failed ({e}), checking messages one by one...")
+                flagged_emails, checked_count = self._flagged_from_items(
+                    folder, folder_id, folder_name, today_start.date()
+                )
+                print(f"[OK] Checked {checked_count} emails in {folder_name}")
 
-            print(f"[OK] Checked {checked_count} emails in {folder_name}")
             print(f"[OK] Found {len(flagged_emails)} flagged emails due today")
 
             return flagged_emails
@@ -122,6 +97,114 @@ class OutlookEmailFetcher:
             print(f"[ERROR] Error fetching emails from {folder_name}: {e}")
             return []
 
+    def _flagged_from_table(self, folder, folder_id, folder_name, today):
+        """
+        Read the folder's flagged messages in bulk and keep those due today
+
+        Only flagged messages (PR_FLAG_STATUS = 2) are returned by the Table,
+        with just the columns needed, so no message is opened. The due date
+        is TaskDueDate, falling back to FlagDueBy like the per-message path.
+
+        Returns:
+            tuple: (list of email dictionaries, int: flagged messages checked)
+        """
+        time_field = "ReceivedTime" if folder_id == 6 else "SentOn"
+        columns = {
+            'subject': "Subject",
+            'sender': "SenderName",
+            'sender_email': "SenderEmailAddress",
+            'timestamp': time_field,
+            'task_due': "TaskDueDate",
+            'flag_due': "FlagDueBy",
+            'importance': "Importance",
+            'unread': "UnRead",
+            'size': "Size"
+        }
+        rows = table_rows(
+            folder, columns, f'@SQL="{PR_FLAG_STATUS}" = 2', sort=f"[{time_field}]", descending=True
+        )
+
+        flagged_emails = []
+        checked_count = 0
+        for row in rows:
+            checked_count += 1
+            if flag_due_date(row['task_due'], row['flag_due']) != today:
+                continue
+
+            timestamp = row['timestamp']
+            flagged_emails.append({
+                'subject': row['subject'] or "No Subject",
+                'sender': row['sender'] or "Unknown",
+                'sender_email': row['sender_email'] or "",
+                'received': timestamp.strftime("%Y-%m-%d %H:%M") if timestamp else "",
+                'due_date': today.strftime("%Y-%m-%d"),
+                'importance': row['importance'],  # 0=low, 1=normal, 2=high
+                'unread': row['unread'],
+                'size_kb': row['size'] / 1024 if row['size'] else 0,
+                'folder': folder_name  # Track which folder this came from
+            })
+
+        return flagged_emails, checked_count
+
+    def _flagged_from_items(self, folder, folder_id, folder_name, today):
+        """
+        Check the most recent messages one by one (fallback when the folder
+        Table can't be read)
+
+        Returns:
+            tuple: (list of email dictionaries, int: messages checked)
+        """
+        messages = folder.Items
+
+        # Sort by received/sent time (most recent first)
+        time_field = "[ReceivedTime]" if folder_id == 6 else "[SentOn]"
+        messages.Sort(time_field, True)
+
+        flagged_emails = []
+        checked_count = 0
+        max_check = 500  # Only check recent emails (last 500)
+
+        for message in messages:
+            checked_count += 1
+            if checked_count > max_check:
+                break
+
+            try:
+                # Check if email is flagged
+                flag_status = message.FlagStatus
+                # 0 = not flagged, 1 = complete, 2 = flagged
+                if flag_status != 2:
+                    continue
+
+                # Flag due date: TaskDueDate (where Outlook stores it), else FlagDueBy
+                due_date = flag_due_date(
+                    _item_property(message, 'TaskDueDate'), _item_property(message, 'FlagDueBy')
+                )
+
+                # Check if due date is today
+                if due_date and due_date == today:
+                    # Get timestamp (received or sent depending on folder)
+                    timestamp = message.ReceivedTime if folder_id == 6 else message.SentOn
+
+                    email_info = {
+                        'subject': message.Subject or "No Subject",
+                        'sender': message.SenderName or "Unknown",
+                        'sender_email': message.SenderEmailAddress or "",
+                        'received': timestamp.strftime("%Y-%m-%d %H:%M") if timestamp else "",
+                        'due_date': due_date.strftime("%Y-%m-%d"),
+                        'importance': message.Importance,  # 0=low, 1=normal, 2=high
+                        'unread': message.UnRead,
+                        'size_kb': message.Size / 1024 if message.Size else 0,
+                        'folder': folder_name  # Track which folder this came from
+                    }
+                    flagged_emails.append(email_info)
+
+            except Exception as e:
+                # Skip emails that can't be processed
+                continue
+
+        return flagged_emails, checked_count
+
     def fetch_flagged_emails_today(self):
         """Fetch emails flagged with due date of today from Inbox and Sent Items
 
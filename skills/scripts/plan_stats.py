@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+"""
+Plan Stats
+Completion analytics over every daily plan in a vault: completion rate,
+carryover counts and meeting load per day, per ISO week and per category.
+
+Each plan is reduced to a small per-file summary that is cached (keyed by
+the file's mtime and size) outside the vault, so a rerun only re-parses the
+plans that changed. Changed plans are parsed in a process pool, one job per
+month directory.
+
+Counted tasks are the checkboxes in category sections (focus, comms,
+email, ...); the End-of-Day Review checklist is not counted. Meetings are
+the "- **9:00am - 9:30am**: ..." entries of the Calendar section.
+
+End-of-day cleanup removes unchecked tasks from a plan, so carried-out tasks
+are counted from where they ended up. A carried task keeps the date it was
+first carried over from ("*Carried over from:*"), and it rolled out of every
+plan from that date until the plan it now sits in, or through the date of
+the "Backlog due from" section (in the backlog or its archive) holding it.
+Each plan after that first date also had it carried in, and it counts
+towards every one of those plans' task totals.
+
+Usage:
+    python plan_stats.py <vault_path> [--by week] [--since 2024-01-01] [--until 2026-12-31]
+    python plan_stats.py <vault_path> --by category --json
+"""
+
+import sys
+import os
+import re
+import json
+import hashlib
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+# Add add-task scripts to path for the shared cache directory
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../add-task/scripts'))
+
+import vault_io
+from backlog_archive import BacklogArchive
+from backlog_cache import cache_dir
+from backlog_store import backlog_paths, open_store, shard_dir
+from daily_plan import DailyPlan
+from task_index import scan_plan_files
+
+
+# Bump when the per-file summary changes; older cache entries are re-parsed
+STATS_VERSION = 2
+
+MEETING_RE = re.compile(r'^- \*\*(.+?)\*\*:')
+TIME_RANGE_RE = re.compile(
+    r'(\d{1,2})(?::(\d{2}))?\s*([ap]m)?\s*[-–]\s*(\d{1,2})(?::(\d{2}))?\s*([ap]m)',
+    re.IGNORECASE
+)
+
+COUNTERS = ('tasks', 'done', 'carried_in', 'carried_out')
+DAY_COUNTERS = COUNTERS + ('meetings', 'meeting_minutes')
+
+
+def default_cache_path(vault_path):
+    """Per-file summary cache for a vault, in the local cache directory"""
+    name = hashlib.sha1(os.path.abspath(vault_path).encode('utf-8')).hexdigest()[:16]
+    return os.path.join(cache_dir(), f"plan-stats-{name}.json")
+
+
+def _minutes(hour, minute, meridiem):
+    hour = int(hour) % 12
+    if meridiem.lower() == 'pm':
+        hour += 12
+    return hour * 60 + int(minute or 0)
+
+
+def meeting_minutes(slot):
+    """
+    Length of a "9:00am - 9:30am" time slot in minutes
+
+    Returns:
+        int: Minutes, or 0 if the slot isn't a time range
+    """
+    match = TIME_RANGE_RE.search(slot)
+    if not match:
+        return 0
+    start_h, start_m, start_ampm, end_h, end_m, end_ampm = match.groups()
+    # "11:30 - 12:00pm": the start shares the end's am/pm unless that makes it later
+    start = _minutes(start_h, start_m, start_ampm or end_ampm)
+    end = _minutes(end_h, end_m, end_ampm)
+    if start > end and not start_ampm:
+        start = _minutes(start_h, start_m, 'am')
+    return max(end - start, 0)
+
+
+def summarize_plan(path):
+    """
+    Reduce one daily plan to per-category task counts and meeting load
+
+    Returns:
+        dict: {'categories': {category: [tasks, done, carried_in]},
+               'carried_from': {category: {carryover_date: n}},
+               'meetings': n, 'meeting_minutes': n}
+    """
+    plan = DailyPlan.load(path)
+
+    categories = {}
+    carried_from = {}
+    for task in plan.all_tasks():
+        if task.section is None:
+            continue
+        counts = categories.setdefault(task.section, [0, 0, 0])
+        counts[0] += 1
+        if task.done:
+            counts[1] += 1
+        if task.carryover_date:
+            counts[2] += 1
+            by_date = carried_from.setdefault(task.section, {})
+            by_date[task.carryover_date] = by_date.get(task.carryover_date, 0) + 1
+
+    meetings = 0
+    minutes = 0
+    in_calendar = False
+    for line in plan.lines:
+        if line.startswith('## '):
+            in_calendar = '📅' in line
+            continue
+        if in_calendar:
+            match = MEETING_RE.match(line)
+            if match:
+                meetings += 1
+                minutes += meeting_minutes(match.group(1))
+
+    return {'categories': categories, 'carried_from': carried_from,
+            'meetings': meetings, 'meeting_minutes': minutes}
+
+
+def summarize_month(vault_path, rel_paths):
+    """
+    Summarize a batch of plans from one month directory (runs in a worker process)
+
+    Returns:
+        dict: relative path -> summary, or None if the file couldn't be read
+    """
+    summaries = {}
+    for rel_path in rel_paths:
+        try:
+            summaries[rel_path] = summarize_plan(os.path.join(vault_path, rel_path))
+        except (OSError, UnicodeDecodeError):
+            summaries[rel_path] = None
+    return summaries
+
+
+def backlog_carryover(vault_path):
+    """
+    Tasks waiting in "Backlog due from <date>" sections of the backlog and
+    its archive
+
+    A vault without a backlog is read as having none; loading the store
+    would create an empty backlog.md.
+
+    Returns:
+        list: (category, carried over since, section date) per task
+    """
+    documents = []
+    backlog_file, db_file = backlog_paths(vault_path)
+    if os.path.exists(backlog_file) or os.path.exists(db_file) or os.path.isdir(shard_dir(vault_path)):
+        documents.append(open_store(vault_path).load_document())
+    archive = BacklogArchive(vault_path)
+    documents.extend(archive.load_document(month) for month in archive.months())
+
+    tasks = []
+    for document in documents:
+        for section in document.sections:
+            if section.kind != 'carryover':
+                continue
+            for key, category in section.categories.items():
+                for task in category.tasks:
+                    tasks.append((key, task.carryover_date or section.date, section.date))
+    return tasks
+
+
+def _empty(counters):
+    return dict.fromkeys(counters, 0)
+
+
+def _with_rate(counts):
+    counts['completion_rate'] = round(counts['done'] / counts['tasks'], 3) if counts['tasks'] else None
+    return counts
+
+
+class PlanStats:
+    """Per-file cached summaries of a vault's daily plans, aggregated on demand"""
+
+    def __init__(self, vault_path, cache_file=None, workers=None):
+        self.vault_path = vault_path
+        self.cache_file = cache_file or default_cache_path(vault_path)
+        self.workers = workers
+
+    def _read_cache(self):
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if cache.get('version') != STATS_VERSION:
+            return {}
+        return cache.get('files', {})
+
+    def _write_cache(self, files):
+        try:
+            vault_io.write_text(
+                self.cache_file,
+                json.dumps({'version': STATS_VERSION, 'files': files}, separators=(',', ':')),
+                durable=False
+            )
+        except OSError:
+            # The cache is an optimization; stats are still correct without it
+            pass
+
+    def summaries(self):
+        """
+        Per-plan summaries for every plan in the vault, re-parsing only changed files
+
+        Returns:
+            tuple: (dict: date -> summary, int: plans parsed this run)
+        """
+        found = scan_plan_files(self.vault_path)
+        cached = self._read_cache()
+
+        stale_by_month = {}
+        for rel_path, (_, mtime_ns, size) in found.items():
+            entry = cached.get(rel_path)
+            if not entry or entry['mtime_ns'] != mtime_ns or entry['size'] != size:
+                stale_by_month.setdefault(os.path.dirname(rel_path), []).append(rel_path)
+
+        parsed = {}
+        if len(stale_by_month) > 1 and self.workers != 1:
+            workers = min(self.workers or os.cpu_count() or 1, len(stale_by_month))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                jobs = [
+                    pool.submit(summarize_month, self.vault_path, paths)
+                    for paths in stale_by_month.values()
+                ]
+                for job in jobs:
+                    parsed.update(job.result())
+        else:
+            for paths in stale_by_month.values():
+                parsed.update(summarize_month(self.vault_path, paths))
+
+        files = {}
+        for rel_path, (date, mtime_ns, size) in found.items():
+            if rel_path in parsed:
+                if parsed[rel_path] is None:
+                    print(f"[!] Warning: Could not read {rel_path}")
+                    continue
+                files[rel_path] = {'mtime_ns': mtime_ns, 'size': size, 'date': date,
+                                   'summary': parsed[rel_path]}
+            else:
+                files[rel_path] = cached[rel_path]
+
+        if parsed or len(files) != len(cached):
+            self._write_cache(files)
+
+        return {entry['date']: entry['summary'] for entry in files.values()}, len(parsed)
+
+    def carried_tasks(self, summaries):
+        """
+        Tasks carried out of each plan and carried into it but gone after
+        cleanup, by category
+
+        Args:
+            summaries: date -> summary (see summaries())
+
+        Returns:
+            dict: date -> {category: [carried_out, removed carried_in]}
+        """
+        dates = sorted(summaries)
+
+        # (category, first plan date, last date, last date included, tasks)
+        spans = []
+        for date, summary in summaries.items():
+            for category, by_date in summary['carried_from'].items():
+                for since, count in by_date.items():
+                    spans.append((category, since, date, False, count))
+        try:
+            for category, since, section_date in backlog_carryover(self.vault_path):
+                spans.append((category, since, section_date, True, 1))
+        except Exception as e:
+            print(f"[!] Warning: Could not read backlog: {e}")
+
+        carried = {}
+        for category, since, until, inclusive, count in spans:
+            end = bisect_right(dates, until) if inclusive else bisect_left(dates, until)
+            for date in dates[bisect_left(dates, since):end]:
+                counts = carried.setdefault(date, {}).setdefault(category, [0, 0])
+                counts[0] += count
+                if date > since:
+                    counts[1] += count
+        return carried
+
+    def compute(self, start=None, end=None):
+        """
+        Aggregate plan summaries by day, ISO week and category
+
+        Args:
+            start: First plan date to include (YYYY-MM-DD), or None
+            end: Last plan date to include (YYYY-MM-DD), or None
+
+        Returns:
+            dict: {'days': {date: counts}, 'weeks': {'YYYY-Www': counts},
+                   'categories': {category: counts}, 'total': counts, 'parsed': n}
+        """
+        summaries, parsed = self.summaries()
+        carried = self.carried_tasks(summaries)
+
+        days = {}
+        weeks = {}
+        categories = {}
+        total = _empty(DAY_COUNTERS)
+        total['plans'] = 0
+
+        for date in sorted(summaries):
+            if (start and date < start) or (end and date > end):
+                continue
+            summary = summaries[date]
+
+            day = _empty(DAY_COUNTERS)
+            day['meetings'] = summary['meetings']
+            day['meeting_minutes'] = summary['meeting_minutes']
+            day_carried = carried.get(date, {})
+            for category in set(summary['categories']) | set(day_carried):
+                tasks, done, carried_in = summary['categories'].get(category, (0, 0, 0))
+                carried_out, removed_in = day_carried.get(category, (0, 0))
+                counts = (tasks + carried_out, done, carried_in + removed_in, carried_out)
+                by_category = categories.setdefault(category, _empty(COUNTERS))
+                for name, value in zip(COUNTERS, counts):
+                    day[name] += value
+                    by_category[name] += value
+            days[date] = day
+
+            year, week, _ = datetime.strptime(date, "%Y-%m-%d").isocalendar()
+            by_week = weeks.setdefault(f"{year}-W{week:02d}", dict(_empty(DAY_COUNTERS), plans=0))
+            by_week['plans'] += 1
+            total['plans'] += 1
+            for name in DAY_COUNTERS:
+                by_week[name] += day[name]
+                total[name] += day[name]
+
+        return {
+            'days': {key: _with_rate(value) for key, value in days.items()},
+            'weeks': {key: _with_rate(value) for key, value in weeks.items()},
+            'categories': {key: _with_rate(value) for key, value in sorted(categories.items())},
+            'total': _with_rate(total),
+            'parsed': parsed
+        }
+
+
+def _format_rate(rate):
+    return f"{rate:.0%}" if rate is not None else "-"
+
+
+def print_report(stats, by):
+    """Print the aggregated stats as a table"""
+    rows = {'day': stats['days'], 'week': stats['weeks'], 'category': stats['categories']}[by]
+    label = {'day': 'Date', 'week': 'Week', 'category': 'Category'}[by]
+
+    if by == 'category':
+        print(f"{label:<12} {'Tasks':>6} {'Done':>6} {'Rate':>5} {'In':>5} {'Out':>5}")
+    else:
+        print(f"{label:<12} {'Tasks':>6} {'Done':>6} {'Rate':>5} {'In':>5} {'Out':>5} {'Mtgs':>5} {'Mtg h':>6}")
+
+    for key, counts in rows.items():
+        line = (f"{key:<12} {counts['tasks']:>6} {counts['done']:>6} {_format_rate(counts['completion_rate']):>5} "
+                f"{counts['carried_in']:>5} {counts['carried_out']:>5}")
+        if by != 'category':
+            line += f" {counts['meetings']:>5} {counts['meeting_minutes'] / 60:>6.1f}"
+        print(line)
+
+    total = stats['total']
+    print(f"\n[*] {total['plans']} plan(s): {total['done']}/{total['tasks']} tasks done "
+          f"({_format_rate(total['completion_rate'])}), {total['carried_out']} carried out, "
+          f"{total['meetings']} meetings ({total['meeting_minutes'] / 60:.1f}h)")
+
+
+def main():
+    """CLI interface"""
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description='Completion analytics over all daily plans')
+    parser.add_argument('vault_path', help='Path to Obsidian vault')
+    parser.add_argument('--by', choices=['day', 'week', 'category'], default='week',
+                        help='Group rows by day, ISO week or category (default: week)')
+    parser.add_argument('--since', metavar='YYYY-MM-DD', help='Only plans on or after this date')
+    parser.add_argument('--until', metavar='YYYY-MM-DD', help='Only plans on or before this date')
+    parser.add_argument('--workers', type=int, help='Parser processes (default: CPU count, 1 disables the pool)')
+    parser.add_argument('--cache', help='Summary cache path (default: local cache directory)')
+    parser.add_argument('--json', action='store_true', help='Print the full results as JSON')
+
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.vault_path):
+        print(f"[ERROR] Vault not found: {args.vault_path}")
+        sys.exit(1)
+
+    started = time.perf_counter()
+    stats = PlanStats(args.vault_path, args.cache, args.workers).compute(args.since, args.until)
+
+    if args.json:
+        print(json.dumps(stats, indent=2, ensure_ascii=False))
+        return
+
+    print_report(stats, args.by)
+    print(f"[*] {stats['parsed']} plan(s) parsed, the rest from cache, in {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == '__main__':
+    # Fix encoding for Windows console
+    if sys.platform == 'win32':
+        import io
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+    main()
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Recurrence Rules
+Pure-Python evaluation of Outlook RecurrencePattern rules, so the calendar
+fetcher can tell which recurring meetings occur in a window without
+probing GetOccurrence over COM.
+
+A pattern is the dict stored by recurrence_index.read_master:
+    type               OlRecurrenceType (0 daily, 1 weekly, 2 monthly,
+                       3 month-nth, 5 yearly, 6 year-nth)
+    interval           Days / weeks / months between occurrences (yearly
+                       patterns may report it in months: 12, 24, ...)
+    day_of_week_mask   OlDaysOfWeek bits (Sunday=1, Monday=2, ... Saturday=64)
+    day_of_month       Day for monthly/yearly patterns
+    month_of_year      Month for yearly patterns
+    instance           1-4 = first..fourth, 5 = last (month-nth/year-nth)
+    pattern_start      First day of the series (YYYY-MM-DD)
+    pattern_end        Last possible day (YYYY-MM-DD); Outlook keeps it in
+                       step with occurrences for counted series
+    occurrences        Occurrence count, used only when pattern_end is missing
+    no_end_date        True for open-ended series
+    start_time         Occurrence start time (HH:MM)
+    duration           Minutes
+
+Exceptions are dicts with original_date, deleted and, for modified
+occurrences, actual_start/actual_end (YYYY-MM-DDTHH:MM).
+"""
+
+import calendar
+from datetime import date, datetime, timedelta
+
+
+OL_RECURS_DAILY = 0
+OL_RECURS_WEEKLY = 1
+OL_RECURS_MONTHLY = 2
+OL_RECURS_MONTH_NTH = 3
+OL_RECURS_YEARLY = 5
+OL_RECURS_YEAR_NTH = 6
+
+# OlDaysOfWeek bit for datetime.weekday() (Monday = 0)
+WEEKDAY_MASK = [2, 4, 8, 16, 32, 64, 1]
+
+
+class Occurrence:
+    """One occurrence of a recurring meeting"""
+
+    __slots__ = ('original_date', 'start', 'end', 'exception')
+
+    def __init__(self, original_date, start, end, exception=None):
+        self.original_date = original_date  # Date the rule put it on
+        self.start = start                  # Actual start (moved for exceptions)
+        self.end = end
+        self.exception = exception          # Exception dict for modified occurrences
+
+    def __repr__(self):
+        kind = 'exception' if self.exception else 'occurrence'
+        return f"<{kind} {self.start.isoformat()}-{self.end.strftime('%H:%M')}>"
+
+
+def _in_mask(day, mask):
+    return bool(mask & WEEKDAY_MASK[day.weekday()])
+
+
+def _clamped_day(year, month, day):
+    """day of month, or the month's last day if it is shorter (e.g. the 31st)"""
+    return date(year, month, min(max(day, 1), calendar.monthrange(year, month)[1]))
+
+
+def _nth_weekday(year, month, mask, instance):
+    """The instance-th (5 = last) day of a month whose weekday is in mask"""
+    days = [
+        date(year, month, d)
+        for d in range(1, calendar.monthrange(year, month)[1] + 1)
+        if _in_mask(date(year, month, d), mask)
+    ]
+    if not days:
+        return None
+    if instance >= 5:
+        return days[-1]
+    return days[instance - 1] if 0 < instance <= len(days) else None
+
+
+def _months(first, last):
+    """(year, month) pairs from first's month to last's month"""
+    year, month = first.year, first.month
+    while (year, month) <= (last.year, last.month):
+        yield year, month
+        month += 1
+        if month > 12:
+            year, month = year + 1, 1
+
+
+def _week_start(day):
+    """Sunday starting the (Outlook default) week containing day"""
+    return day - timedelta(days=(day.weekday() + 1) % 7)
+
+
+def _rule_days(pattern, first, last):
+    """
+    Days in [first, last] the rule generates, ascending, ignoring exceptions
+    and the series bounds
+    """
+    kind = pattern['type']
+    interval = max(pattern.get('interval') or 1, 1)
+    mask = pattern.get('day_of_week_mask') or 0
+    start = date.fromisoformat(pattern['pattern_start'])
+
+    if kind == OL_RECURS_DAILY:
+        if mask:
+            # "Every weekday"
+            day = first
+            while day <= last:
+                if _in_mask(day, mask):
+                    yield day
+                day += timedelta(days=1)
+            return
+        # Jump straight to the first occurrence on or after first
+        offset = max((first - start).days, 0)
+        day = start + timedelta(days=-(-offset // interval) * interval)
+        while day <= last:
+            yield day
+            day += timedelta(days=interval)
+
+    elif kind == OL_RECURS_WEEKLY:
+        first_week = _week_start(start)
+        day = first
+        while day <= last:
+            weeks = (_week_start(day) - first_week).days // 7
+            if weeks % interval == 0 and _in_mask(day, mask):
+                yield day
+            day += timedelta(days=1)
+
+    elif kind in (OL_RECURS_MONTHLY, OL_RECURS_MONTH_NTH):
+        for year, month in _months(first, last):
+            if ((year - start.year) * 12 + month - start.month) % interval:
+                continue
+            if kind == OL_RECURS_MONTHLY:
+                day = _clamped_day(year, month, pattern.get('day_of_month') or start.day)
+            else:
+                day = _nth_weekday(year, month, mask, pattern.get('instance') or 1)
+            if day is not None and first <= day <= last:
+                yield day
+
+    elif kind in (OL_RECURS_YEARLY, OL_RECURS_YEAR_NTH):
+        years = interval // 12 if interval >= 12 and interval % 12 == 0 else interval
+        month = pattern.get('month_of_year') or start.month
+        for year in range(first.year, last.year + 1):
+            if (year - start.year) % years:
+                continue
+            if kind == OL_RECURS_YEARLY:
+                day = _clamped_day(year, month, pattern.get('day_of_month') or start.day)
+            else:
+                day = _nth_weekday(year, month, mask, pattern.get('instance') or 1)
+            if day is not None and first <= day <= last:
+                yield day
+
+
+def rule_dates(pattern, first, last):
+    """
+    Days in [first, last] on which the series has an occurrence by rule
+    (before exceptions)
+
+    Args:
+        pattern: Pattern dict (see module docstring)
+        first, last: datetime.date bounds (inclusive)
+
+    Returns:
+        list: datetime.date values, ascending
+    """
+    start = date.fromisoformat(pattern['pattern_start'])
+    end = date.fromisoformat(pattern['pattern_end']) if pattern.get('pattern_end') else None
+    count = 0 if pattern.get('no_end_date') else (pattern.get('occurrences') or 0)
+
+    if end is None and count:
+        # Counted series without an end date: count from the first occurrence
+        days = []
+        for index, day in enumerate(_rule_days(pattern, start, last)):
+            if index >= count:
+                break
+            if day >= first:
+                days.append(day)
+        return days
+
+    first = max(first, start)
+    if end is not None:
+        last = min(last, end)
+    if first > last:
+        return []
+    return list(_rule_days(pattern, first, last))
+
+
+def occurrences_between(pattern, exceptions, window_start, window_end):
+    """
+    Occurrences starting in [window_start, window_end), exceptions applied
+
+    Deleted occurrences are dropped; modified ones are returned at their
+    actual time with their exception attached, including occurrences moved
+    into the window from another day.
+
+    Args:
+        pattern: Pattern dict
+        exceptions: Exception dicts
+        window_start, window_end: Naive datetimes
+
+    Returns:
+        list: Occurrence objects ordered by start
+    """
+    replaced = {exception['original_date'] for exception in exceptions}
+    start_time = datetime.strptime(pattern.get('start_time') or '00:00', '%H:%M').time()
+    duration = timedelta(minutes=pattern.get('duration') or 0)
+
+    occurrences = []
+    last_day = (window_end - timedelta(microseconds=1)).date()
+    for day in rule_dates(pattern, window_start.date(), last_day):
+        if day.isoformat() in replaced:
+            continue
+        start = datetime.combine(day, start_time)
+        if window_start <= start < window_end:
+            occurrences.append(Occurrence(day, start, start + duration))
+
+    for exception in exceptions:
+        if exception.get('deleted') or not exception.get('actual_start'):
+            continue
+        start = datetime.fromisoformat(exception['actual_start'])
+        if window_start <= start < window_end:
+            end = datetime.fromisoformat(exception['actual_end']) if exception.get('actual_end') else start + duration
+            occurrences.append(
+                Occurrence(date.fromisoformat(exception['original_date']), start, end, exception)
+            )
+
+    occurrences.sort(key=lambda occurrence: occurrence.start)
+    return occurrences
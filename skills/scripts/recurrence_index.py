@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Outlook Recurrence Master Index
+On-disk index of the recurring meetings in an Outlook calendar, keyed by
+each master's EntryID and LastModificationTime. For every master it keeps
+the recurrence rule fields and its exceptions (original date, actual start
+and end of modified occurrences, deleted flag).
+
+fetch_calendar_outlook.py reads only EntryID and LastModificationTime for
+an unchanged master (as calendar Table columns, or item properties in the
+item-by-item fallback) and works out its occurrences locally
+(recurrence.py). The pattern and exceptions are only read over COM
+for masters that changed since the last run.
+
+The index is derived data and lives in the local cache directory (see
+backlog_cache.cache_dir).
+"""
+
+import os
+import sys
+import json
+import hashlib
+
+# Shared cache directory and file layer live with the add-task scripts
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../add-task/scripts'))
+
+import vault_io
+from backlog_cache import cache_dir
+
+
+# Bump when the entry format changes; older indexes are rebuilt
+INDEX_VERSION = 2
+
+
+def _date(value):
+    return value.date().isoformat()
+
+
+def _datetime(value):
+    """Naive local YYYY-MM-DDTHH:MM (pywin32 datetimes carry a tzinfo)"""
+    return value.replace(tzinfo=None).isoformat(timespec='minutes')
+
+
+def read_master(item):
+    """
+    Read a recurring master's rule and exceptions over COM
+
+    Returns:
+        dict: Index entry ('pattern' and 'exceptions')
+    """
+    rec_pattern = item.GetRecurrencePattern()
+
+    pattern = {
+        'type': rec_pattern.RecurrenceType,
+        'interval': rec_pattern.Interval,
+        'day_of_week_mask': rec_pattern.DayOfWeekMask,
+        'day_of_month': rec_pattern.DayOfMonth,
+        'month_of_year': rec_pattern.MonthOfYear,
+        'instance': rec_pattern.Instance,
+        'occurrences': rec_pattern.Occurrences,
+        'no_end_date': bool(rec_pattern.NoEndDate),
+        'pattern_start': _date(rec_pattern.PatternStartDate),
+        'pattern_end': _date(rec_pattern.PatternEndDate),
+        'start_time': rec_pattern.StartTime.strftime('%H:%M'),
+        'duration': rec_pattern.Duration
+    }
+
+    exceptions = []
+    rec_exceptions = rec_pattern.Exceptions
+    for i in range(1, rec_exceptions.Count + 1):  # COM collections are 1-indexed
+        try:
+            exception = rec_exceptions.Item(i)
+            record = {'original_date': _date(exception.OriginalDate), 'deleted': bool(exception.Deleted)}
+            if not record['deleted']:
+                appointment = exception.AppointmentItem
+                record['actual_start'] = _datetime(appointment.Start)
+                record['actual_end'] = _datetime(appointment.End)
+            exceptions.append(record)
+        except Exception:
+            continue
+
+    return {'pattern': pattern, 'exceptions': exceptions}
+
+
+class RecurrenceIndex:
+    """EntryID -> recurrence entry, persisted as JSON"""
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        self._changed = False
+        self.load()
+
+    @classmethod
+    def for_calendar(cls, calendar):
+        """Index file for an Outlook calendar folder"""
+        key = f"{calendar.StoreID}:{calendar.EntryID}"
+        name = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+        return cls(os.path.join(cache_dir(), f"outlook-recurrence-{name}.json"))
+
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') == INDEX_VERSION:
+            self.entries = data.get('masters', {})
+
+    def lookup(self, entry_id, modified):
+        """Cached entry for a master, or None if unknown or modified since"""
+        entry = self.entries.get(entry_id)
+        if entry and entry.get('modified') == modified:
+            return entry
+        return None
+
+    def update(self, entry_id, modified, entry):
+        entry['modified'] = modified
+        self.entries[entry_id] = entry
+        self._changed = True
+
+    def prune(self, entry_ids):
+        """Drop masters that are no longer in the calendar"""
+        for entry_id in set(self.entries) - set(entry_ids):
+            del self.entries[entry_id]
+            self._changed = True
+
+    def save(self):
+        """Write the index if anything changed"""
+        if not self._changed:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            vault_io.write_text(
+                self.path,
+                json.dumps({'version': INDEX_VERSION, 'masters': self.entries}, separators=(',', ':')),
+                durable=False
+            )
+            self._changed = False
+        except OSError:
+            # The index is an optimization; the next run just reads the masters again
+            pass
@@ -0,0 +1,675 @@
+#!/usr/bin/env python3
+"""
+Vault Task Index
+Incremental SQLite index of every task in DailyPlans/YYYY/MM/YYYY-MM-DD.md,
+checked and unchecked, with its section and carryover date, plus the tasks
+currently in the backlog.
+
+Appearances of the same task (by task_fingerprint) are linked into a
+lineage row - origin date, plans it appeared in, whether it is still open -
+that is updated only for the tasks touched by a refresh, so aging and
+carryover-rate reports are single indexed queries.
+
+Each refresh stats the plan files and re-parses only those whose mtime or
+size changed since the last run (plus new ones); deleted plans are dropped.
+The database is derived data and lives outside the vault (see
+backlog_cache.cache_dir) unless --db is given.
+
+Usage:
+    python task_index.py <vault_path> refresh
+    python task_index.py <vault_path> open [--category focus] [--plans-only]
+    python task_index.py <vault_path> done [--category work] [--since 2026-01-01] [--until 2026-03-31]
+    python task_index.py <vault_path> open --no-refresh   # while vault_watcher.py runs
+    python task_index.py <vault_path> oldest [--limit 20]
+    python task_index.py <vault_path> rates
+    python task_index.py <vault_path> lineage "Review PRD draft"
+"""
+
+import sys
+import os
+import re
+import json
+import sqlite3
+import hashlib
+from datetime import datetime
+
+# Add add-task scripts to path for the shared cache directory and backlog stores
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../add-task/scripts'))
+
+from backlog_cache import cache_dir
+from backlog_document import task_fingerprint
+from backlog_store import backlog_paths, open_store, shard_dir
+from daily_plan import DailyPlan
+
+
+# Bump when the schema or plan parsing changes; older indexes are rebuilt
+INDEX_VERSION = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS plans (
+    path TEXT PRIMARY KEY,           -- Relative to the vault
+    date TEXT NOT NULL,              -- Plan date (YYYY-MM-DD)
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    status TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_plans_date ON plans (date);
+
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL REFERENCES plans (path) ON DELETE CASCADE,
+    date TEXT NOT NULL,
+    line INTEGER NOT NULL,           -- 1-based line number in the plan
+    section TEXT,                    -- Category key, NULL outside category sections
+    text TEXT NOT NULL,
+    done INTEGER NOT NULL,
+    carryover_date TEXT,
+    fingerprint TEXT NOT NULL        -- task_fingerprint(text)
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_path ON tasks (path);
+CREATE INDEX IF NOT EXISTS idx_tasks_done_date ON tasks (done, date);
+CREATE INDEX IF NOT EXISTS idx_tasks_section_date ON tasks (section, date);
+CREATE INDEX IF NOT EXISTS idx_tasks_fingerprint ON tasks (fingerprint);
+
+CREATE TABLE IF NOT EXISTS backlog_tasks (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,              -- 'date' or 'carryover' section
+    section_date TEXT NOT NULL,
+    category TEXT,
+    text TEXT NOT NULL,
+    carryover_date TEXT,
+    fingerprint TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_backlog_tasks_fingerprint ON backlog_tasks (fingerprint);
+
+CREATE TABLE IF NOT EXISTS lineage (
+    fingerprint TEXT PRIMARY KEY,
+    text TEXT NOT NULL,              -- Most recent wording
+    category TEXT,                   -- Most recent category
+    origin_date TEXT NOT NULL,       -- Earliest plan date or "Carried over from" date
+    first_seen TEXT,                 -- First plan it appeared in
+    last_seen TEXT,                  -- Last plan it appeared in
+    appearances INTEGER NOT NULL,    -- Number of plans it appeared in
+    in_backlog INTEGER NOT NULL,
+    open INTEGER NOT NULL,           -- Unchecked in its last plan, or still in the backlog
+    carried INTEGER NOT NULL         -- Carried over at least once
+);
+CREATE INDEX IF NOT EXISTS idx_lineage_open_origin ON lineage (open, origin_date);
+CREATE INDEX IF NOT EXISTS idx_lineage_category ON lineage (category);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+YEAR_RE = re.compile(r'^\d{4}$')
+MONTH_RE = re.compile(r'^\d{2}$')
+PLAN_FILE_RE = re.compile(r'^(\d{4}-\d{2}-\d{2})\.md$')
+
+
+def default_db_path(vault_path):
+    """Index database for a vault, in the local cache directory"""
+    name = hashlib.sha1(os.path.abspath(vault_path).encode('utf-8')).hexdigest()[:16]
+    return os.path.join(cache_dir(), f"tasks-{name}.db")
+
+
+def scan_plan_files(vault_path):
+    """
+    Stat every DailyPlans/YYYY/MM/YYYY-MM-DD.md file in a vault
+
+    Returns:
+        dict: Path relative to the vault -> (date, mtime_ns, size)
+    """
+    found = {}
+    for year in _subdirs(os.path.join(vault_path, "DailyPlans"), YEAR_RE):
+        for month in _subdirs(year.path, MONTH_RE):
+            with os.scandir(month.path) as entries:
+                for entry in entries:
+                    match = PLAN_FILE_RE.match(entry.name)
+                    if match and entry.is_file():
+                        stat = entry.stat()
+                        rel_path = os.path.relpath(entry.path, vault_path)
+                        found[rel_path] = (match.group(1), stat.st_mtime_ns, stat.st_size)
+    return found
+
+
+def _subdirs(path, pattern):
+    try:
+        with os.scandir(path) as entries:
+            return [e for e in entries if pattern.match(e.name) and e.is_dir()]
+    except OSError:
+        return []
+
+
+class TaskIndex:
+    """SQLite index of the tasks in a vault's daily plans"""
+
+    def __init__(self, vault_path, db_file=None):
+        self.vault_path = vault_path
+        self.db_file = db_file or default_db_path(vault_path)
+
+    def _connect(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_file)), exist_ok=True)
+        conn = sqlite3.connect(self.db_file)
+        conn.execute("PRAGMA foreign_keys = ON")
+        if conn.execute("PRAGMA user_version").fetchone()[0] != INDEX_VERSION:
+            conn.executescript(
+                "DROP TABLE IF EXISTS tasks; DROP TABLE IF EXISTS plans; "
+                "DROP TABLE IF EXISTS backlog_tasks; DROP TABLE IF EXISTS lineage; "
+                "DROP TABLE IF EXISTS meta;"
+            )
+            conn.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+        conn.executescript(SCHEMA)
+        return conn
+
+    def scan_plans(self):
+        """
+        Stat every DailyPlans/YYYY/MM/YYYY-MM-DD.md file
+
+        Returns:
+            dict: relative path -> (date, mtime_ns, size)
+        """
+        return scan_plan_files(self.vault_path)
+
+    def refresh(self):
+        """
+        Bring the index up to date, re-parsing only changed plans
+
+        Returns:
+            dict: {'updated': n, 'removed': n, 'unchanged': n}
+        """
+        found = self.scan_plans()
+        conn = self._connect()
+        try:
+            known = {
+                path: (mtime_ns, size)
+                for path, mtime_ns, size in conn.execute("SELECT path, mtime_ns, size FROM plans")
+            }
+            changed = [
+                path for path, (_, mtime_ns, size) in found.items()
+                if known.get(path) != (mtime_ns, size)
+            ]
+            removed = [path for path in known if path not in found]
+
+            with conn:
+                touched = set()
+                for path in removed:
+                    touched.update(self._drop_plan(conn, path))
+                for path in changed:
+                    touched.update(self._index_plan(conn, path, *found[path]))
+                touched.update(self._index_backlog(conn))
+                self._update_lineage(conn, touched)
+        finally:
+            conn.close()
+
+        return {
+            'updated': len(changed),
+            'removed': len(removed),
+            'unchanged': len(found) - len(changed)
+        }
+
+    def update_plan(self, path):
+        """
+        Re-index a single plan file, or drop it if the file is gone
+
+        Used by vault_watcher.py so a change costs one parse instead of a scan.
+
+        Args:
+            path: Plan file path (absolute or relative to the cwd)
+
+        Returns:
+            bool: True if the index changed
+        """
+        rel_path = os.path.relpath(os.path.abspath(path), os.path.abspath(self.vault_path))
+        parts = rel_path.split(os.sep)
+        if (len(parts) != 4 or parts[0] != "DailyPlans" or not YEAR_RE.match(parts[1])
+                or not MONTH_RE.match(parts[2]) or not PLAN_FILE_RE.match(parts[3])):
+            return False
+        date = PLAN_FILE_RE.match(parts[3]).group(1)
+
+        try:
+            stat = os.stat(os.path.join(self.vault_path, rel_path))
+        except OSError:
+            stat = None
+
+        conn = self._connect()
+        try:
+            with conn:
+                known = conn.execute(
+                    "SELECT mtime_ns, size FROM plans WHERE path = ?", (rel_path,)
+                ).fetchone()
+                if stat is None:
+                    self._update_lineage(conn, self._drop_plan(conn, rel_path))
+                    return known is not None
+                if known == (stat.st_mtime_ns, stat.st_size):
+                    return False
+                self._update_lineage(
+                    conn, self._index_plan(conn, rel_path, date, stat.st_mtime_ns, stat.st_size)
+                )
+                return True
+        finally:
+            conn.close()
+
+    def refresh_backlog(self):
+        """
+        Re-index the backlog if any of its files changed (used by vault_watcher.py)
+
+        Returns:
+            bool: True if the index changed
+        """
+        conn = self._connect()
+        try:
+            with conn:
+                touched = self._index_backlog(conn)
+                self._update_lineage(conn, touched)
+                return bool(touched)
+        finally:
+            conn.close()
+
+    def _fingerprints_of(self, conn, path):
+        return {fp for (fp,) in conn.execute("SELECT fingerprint FROM tasks WHERE path = ?", (path,))}
+
+    def _drop_plan(self, conn, path):
+        """Delete one plan's rows; returns the fingerprints it had"""
+        touched = self._fingerprints_of(conn, path)
+        conn.execute("DELETE FROM plans WHERE path = ?", (path,))
+        return touched
+
+    def _index_plan(self, conn, path, date, mtime_ns, size):
+        """
+        Replace the rows for one plan file
+
+        Returns:
+            set: Fingerprints of the tasks removed or added
+        """
+        try:
+            plan = DailyPlan.load(os.path.join(self.vault_path, path))
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"[!] Warning: Could not read {path}: {e}")
+            return set()
+
+        touched = self._drop_plan(conn, path)
+        conn.execute(
+            "INSERT INTO plans (path, date, mtime_ns, size, status) VALUES (?, ?, ?, ?, ?)",
+            (path, date, mtime_ns, size, plan.status)
+        )
+        rows = [
+            (path, date, task.start + 1, task.section, task.text, int(task.done),
+             task.carryover_date, task_fingerprint(task.text))
+            for task in plan.all_tasks()
+        ]
+        conn.executemany(
+            """INSERT INTO tasks (path, date, line, section, text, done, carryover_date, fingerprint)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+            rows
+        )
+        touched.update(row[-1] for row in rows)
+        return touched
+
+    def _backlog_signature(self):
+        """(name, mtime_ns, size) of every file the backlog stores read"""
+        signature = []
+        daily_plans = os.path.join(self.vault_path, "DailyPlans")
+        for directory, prefix in ((daily_plans, "backlog."), (shard_dir(self.vault_path), "")):
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.name.startswith(prefix) and entry.is_file():
+                            stat = entry.stat()
+                            signature.append((entry.path, stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                continue
+        return json.dumps(sorted(signature))
+
+    def _backlog_exists(self):
+        """backlog.md, backlog.db or the shard directory exists"""
+        backlog_file, db_file = backlog_paths(self.vault_path)
+        return os.path.exists(backlog_file) or os.path.exists(db_file) or os.path.isdir(shard_dir(self.vault_path))
+
+    def _index_backlog(self, conn):
+        """
+        Replace the backlog rows if the backlog files changed
+
+        A vault without a backlog is indexed as having none; loading the
+        store would create an empty backlog.md.
+
+        Returns:
+            set: Fingerprints of the tasks removed or added
+        """
+        signature = self._backlog_signature()
+        row = conn.execute("SELECT value FROM meta WHERE key = 'backlog'").fetchone()
+        if row and row[0] == signature:
+            return set()
+
+        rows = []
+        if self._backlog_exists():
+            try:
+                document = open_store(self.vault_path).load_document()
+            except Exception as e:
+                print(f"[!] Warning: Could not read backlog: {e}")
+                return set()
+            for section in document.sections:
+                if section.kind not in ('date', 'carryover'):
+                    continue
+                for key, category in section.categories.items():
+                    for task in category.tasks:
+                        rows.append((section.kind, section.date, key, task.text,
+                                     task.carryover_date, task_fingerprint(task.text)))
+
+        touched = {fp for (fp,) in conn.execute("SELECT fingerprint FROM backlog_tasks")}
+        conn.execute("DELETE FROM backlog_tasks")
+        conn.executemany(
+            """INSERT INTO backlog_tasks (kind, section_date, category, text, carryover_date, fingerprint)
+               VALUES (?, ?, ?, ?, ?, ?)""",
+            rows
+        )
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('backlog', ?)", (signature,))
+        touched.update(row[-1] for row in rows)
+        return touched
+
+    def _update_lineage(self, conn, fingerprints):
+        """Recompute the lineage rows of the given tasks from their appearances"""
+        for fp in fingerprints:
+            conn.execute("DELETE FROM lineage WHERE fingerprint = ?", (fp,))
+            plan_rows = conn.execute(
+                """SELECT date, section, text, done, carryover_date FROM tasks
+                   WHERE fingerprint = ? ORDER BY date, path, line""",
+                (fp,)
+            ).fetchall()
+            backlog_rows = conn.execute(
+                "SELECT kind, section_date, category, text, carryover_date FROM backlog_tasks WHERE fingerprint = ?",
+                (fp,)
+            ).fetchall()
+            if not plan_rows and not backlog_rows:
+                continue
+
+            # Origin: the earliest day the task is known to have been on a plan
+            origins = [row[0] for row in plan_rows]
+            origins += [row[4] for row in plan_rows + backlog_rows if row[4]]
+            origins += [row[1] for row in backlog_rows if row[0] == 'carryover']
+            origin = min(origins) if origins else min(row[1] for row in backlog_rows)
+
+            plan_dates = sorted({row[0] for row in plan_rows})
+            if plan_rows:
+                last = plan_rows[-1]
+                text, category = last[2], last[1]
+                open_in_plan = any(not row[3] for row in plan_rows if row[0] == last[0])
+            else:
+                text, category = backlog_rows[0][3], backlog_rows[0][2]
+                open_in_plan = False
+
+            carried = (
+                len(plan_dates) > 1
+                or any(row[4] for row in plan_rows + backlog_rows)
+                or any(row[0] == 'carryover' for row in backlog_rows)
+            )
+
+            conn.execute(
+                """INSERT INTO lineage (fingerprint, text, category, origin_date, first_seen, last_seen,
+                                        appearances, in_backlog, open, carried)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (fp, text, category, origin, plan_dates[0] if plan_dates else None,
+                 plan_dates[-1] if plan_dates else None, len(plan_dates), int(bool(backlog_rows)),
+                 int(open_in_plan or bool(backlog_rows)), int(carried))
+            )
+
+    def _query(self, done, category=None, start=None, end=None):
+        sql = "SELECT date, section, text, carryover_date, path, line FROM tasks WHERE done = ?"
+        params = [int(done)]
+        if category:
+            sql += " AND section = ?"
+            params.append(category)
+        if start:
+            sql += " AND date >= ?"
+            params.append(start)
+        if end:
+            sql += " AND date <= ?"
+            params.append(end)
+        sql += " ORDER BY date, path, line"
+
+        conn = self._connect()
+        try:
+            rows = conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+
+        return [
+            {'date': d, 'category': c, 'task': t, 'carryover_date': co, 'source': 'plan', 'path': p, 'line': ln}
+            for d, c, t, co, p, ln in rows
+        ]
+
+    def _query_backlog(self, category=None, start=None, end=None):
+        """Tasks waiting in the backlog, dated by their backlog section"""
+        conditions = []
+        params = []
+        if category:
+            conditions.append("category = ?")
+            params.append(category)
+        if start:
+            conditions.append("section_date >= ?")
+            params.append(start)
+        if end:
+            conditions.append("section_date <= ?")
+            params.append(end)
+        sql = "SELECT kind, section_date, category, text, carryover_date FROM backlog_tasks"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY section_date, id"
+
+        conn = self._connect()
+        try:
+            rows = conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+
+        return [
+            {'date': d, 'category': c, 'task': t, 'carryover_date': co, 'source': 'backlog', 'kind': k}
+            for k, d, c, t, co in rows
+        ]
+
+    def lineage(self, task, today=None):
+        """
+        Every appearance of a task across daily plans and the backlog
+
+        Args:
+            task: Task text (matched by task_fingerprint)
+            today: Reference date for the age of open tasks (YYYY-MM-DD, default: today)
+
+        Returns:
+            dict: Lineage fields plus 'days_rolling', 'plans' and 'backlog', or None if unknown
+        """
+        fp = task_fingerprint(task)
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                """SELECT text, category, origin_date, first_seen, last_seen, appearances,
+                          in_backlog, open, carried FROM lineage WHERE fingerprint = ?""",
+                (fp,)
+            ).fetchone()
+            if row is None:
+                return None
+            plans = conn.execute(
+                "SELECT date, done, path, line FROM tasks WHERE fingerprint = ? ORDER BY date, path, line",
+                (fp,)
+            ).fetchall()
+            backlog = conn.execute(
+                "SELECT kind, section_date, category FROM backlog_tasks WHERE fingerprint = ? ORDER BY section_date",
+                (fp,)
+            ).fetchall()
+        finally:
+            conn.close()
+
+        result = self._lineage_row(row, today)
+        result['plans'] = [{'date': d, 'done': bool(done), 'path': p, 'line': ln} for d, done, p, ln in plans]
+        result['backlog'] = [{'kind': k, 'date': d, 'category': c} for k, d, c in backlog]
+        return result
+
+    def oldest_open(self, limit=20, category=None, today=None):
+        """
+        Open tasks that have been rolling the longest
+
+        Returns:
+            list: Lineage dicts (see lineage) without 'plans'/'backlog', oldest first
+        """
+        sql = """SELECT text, category, origin_date, first_seen, last_seen, appearances,
+                        in_backlog, open, carried FROM lineage WHERE open = 1 AND origin_date <= ?"""
+        # Tasks only scheduled for a future backlog date aren't rolling yet
+        today = today or datetime.now().strftime("%Y-%m-%d")
+        params = [today]
+        if category:
+            sql += " AND category = ?"
+            params.append(category)
+        sql += " ORDER BY origin_date LIMIT ?"
+        params.append(limit)
+
+        conn = self._connect()
+        try:
+            rows = conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+        return [self._lineage_row(row, today) for row in rows]
+
+    def carryover_rates(self):
+        """
+        Share of tasks carried over at least once, by category
+
+        Only tasks that appeared in a daily plan are counted.
+
+        Returns:
+            dict: category -> {'tasks': n, 'carried': n, 'rate': 0.0-1.0}
+        """
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                """SELECT category, COUNT(*), SUM(carried) FROM lineage
+                   WHERE appearances > 0 GROUP BY category ORDER BY category"""
+            ).fetchall()
+        finally:
+            conn.close()
+        return {
+            category or 'other': {'tasks': total, 'carried': carried, 'rate': carried / total}
+            for category, total, carried in rows
+        }
+
+    def _lineage_row(self, row, today=None):
+        text, category, origin, first_seen, last_seen, appearances, in_backlog, is_open, carried = row
+        today = today or datetime.now().strftime("%Y-%m-%d")
+        until = today if is_open else (last_seen or today)
+        days = (datetime.strptime(until, "%Y-%m-%d") - datetime.strptime(origin, "%Y-%m-%d")).days
+        return {
+            'task': text,
+            'category': category,
+            'origin_date': origin,
+            'first_seen': first_seen,
+            'last_seen': last_seen,
+            'appearances': appearances,
+            'in_backlog': bool(in_backlog),
+            'open': bool(is_open),
+            'carried': bool(carried),
+            'days_rolling': max(days, 0)
+        }
+
+    def open_tasks(self, category=None, start=None, end=None, include_backlog=True):
+        """
+        Open tasks (optionally filtered): unchecked tasks in the indexed plans
+        plus, unless include_backlog is False, the tasks in the backlog
+
+        End-of-day cleanup moves unchecked tasks out of the plan into the
+        backlog, so most open work is only found there. Backlog tasks are
+        dated by their section ("## 2026-03-14" or "Backlog due from ...").
+
+        Returns:
+            list: Task dicts ordered by date; 'source' is 'plan' or 'backlog'
+        """
+        tasks = self._query(False, category, start, end)
+        if include_backlog:
+            tasks += self._query_backlog(category, start, end)
+            tasks.sort(key=lambda task: task['date'])
+        return tasks
+
+    def completed_tasks(self, category=None, start=None, end=None):
+        """Checked tasks across all indexed plans (optionally filtered)"""
+        return self._query(True, category, start, end)
+
+
+def main():
+    """CLI interface"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Incremental index of daily plan tasks')
+    parser.add_argument('vault_path', help='Path to Obsidian vault')
+    parser.add_argument('command', choices=['refresh', 'open', 'done', 'oldest', 'rates', 'lineage'])
+    parser.add_argument('task', nargs='?', help='Task text (lineage command)')
+    parser.add_argument('--category', help='Only tasks in this category (focus, comms, work, email, ...)')
+    parser.add_argument('--since', metavar='YYYY-MM-DD', help='Only plans on or after this date')
+    parser.add_argument('--until', metavar='YYYY-MM-DD', help='Only plans on or before this date')
+    parser.add_argument('--limit', type=int, default=20, help='Number of tasks for oldest (default: 20)')
+    parser.add_argument('--plans-only', action='store_true',
+                        help='open: only unchecked tasks still in daily plans, not the backlog')
+    parser.add_argument('--db', help='Index database path (default: local cache directory)')
+    parser.add_argument('--no-refresh', action='store_true',
+                        help='Skip the scan (vault_watcher.py is keeping the index current)')
+
+    args = parser.parse_args()
+
+    index = TaskIndex(args.vault_path, args.db)
+    if not args.no_refresh or args.command == 'refresh':
+        counts = index.refresh()
+        print(f"[OK] Index refreshed: {counts['updated']} updated, {counts['removed']} removed, "
+              f"{counts['unchanged']} unchanged")
+
+    if args.command == 'refresh':
+        return
+
+    if args.command == 'oldest':
+        tasks = index.oldest_open(args.limit, args.category)
+        for task in tasks:
+            category = task['category'] or '-'
+            where = 'backlog' if task['in_backlog'] else f"plan {task['last_seen']}"
+            print(f"{task['days_rolling']:>4}d  [{category}]  {task['task']}  (since {task['origin_date']}, {where})")
+        print(f"\n[*] {len(tasks)} open task(s)")
+        return
+
+    if args.command == 'rates':
+        for category, rate in index.carryover_rates().items():
+            print(f"{category:<10} {rate['carried']:>4}/{rate['tasks']:<4} carried over ({rate['rate']:.0%})")
+        return
+
+    if args.command == 'lineage':
+        if not args.task:
+            parser.error('lineage needs the task text')
+        lineage = index.lineage(args.task)
+        if lineage is None:
+            print(f"[!] Task not found in any plan or the backlog: {args.task}")
+            sys.exit(1)
+        state = 'open' if lineage['open'] else 'done'
+        print(f"{lineage['task']}  [{lineage['category'] or '-'}]")
+        print(f"  {state}, rolling {lineage['days_rolling']} day(s) since {lineage['origin_date']}, "
+              f"in {lineage['appearances']} plan(s)")
+        for plan in lineage['plans']:
+            print(f"  {plan['date']}  {'[x]' if plan['done'] else '[ ]'}  {plan['path']}:{plan['line']}")
+        for entry in lineage['backlog']:
+            print(f"  {entry['date']}  backlog ({entry['kind']})")
+        return
+
+    if args.command == 'open':
+        tasks = index.open_tasks(args.category, args.since, args.until, include_backlog=not args.plans_only)
+    else:
+        tasks = index.completed_tasks(args.category, args.since, args.until)
+
+    for task in tasks:
+        category = task['category'] or '-'
+        where = "  (backlog)" if task['source'] == 'backlog' else ""
+        print(f"{task['date']}  [{category}]  {task['task']}{where}")
+    print(f"\n[*] {len(tasks)} task(s)")
+
+
+if __name__ == '__main__':
+    # Fix encoding for Windows console
+    if sys.platform == 'win32':
+        import io
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+    main()
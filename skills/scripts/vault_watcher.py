@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Vault Watcher
+Keeps the task index (task_index.py) and the backlog parse cache warm while
+it runs, so queries never have to scan the vault first.
+
+Watches DailyPlans/ (plan files under YYYY/MM/, the backlog files and the
+month shards under backlog/). A changed plan is re-parsed on its own and its
+rows replaced in the index; a changed backlog is re-parsed into its parse
+cache and the index's backlog rows. Nothing else is touched.
+
+On Linux the watcher uses inotify (through ctypes, no extra packages);
+elsewhere, or if inotify is unavailable, it polls file mtimes.
+
+Usage:
+    python vault_watcher.py <vault_path> [--poll] [--interval 2.0] [--db tasks.db]
+"""
+
+import sys
+import os
+import time
+import errno
+import select
+import struct
+import ctypes
+import ctypes.util
+
+# Add add-task scripts to path for the backlog parse cache
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../add-task/scripts'))
+
+from backlog_cache import BacklogParseCache
+from task_index import TaskIndex, YEAR_RE, MONTH_RE
+
+
+# inotify event masks (linux/inotify.h)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+
+EVENT_HEADER = struct.Struct('iIII')  # wd, mask, cookie, len
+
+# Editors often write a file in several syscalls; wait this long after the
+# first event so one save is handled once
+SETTLE_SECONDS = 0.02
+
+
+class InotifyWatcher:
+    """Directory watches through the Linux inotify API"""
+
+    def __init__(self):
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._add_watch.restype = ctypes.c_int
+
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self.watches = {}  # wd -> directory
+
+    def watch(self, directory):
+        """Watch one directory (not recursive)"""
+        wd = self._add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), directory)
+        self.watches[wd] = directory
+
+    def read(self, timeout=None):
+        """
+        Wait for events
+
+        Returns:
+            list: (path, mask) tuples; path is None for a queue overflow
+        """
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+
+        events = []
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            events.extend(self._parse(data))
+
+            # Coalesce the burst of events from a single save
+            ready, _, _ = select.select([self.fd], [], [], SETTLE_SECONDS)
+            if not ready:
+                break
+        return events
+
+    def _parse(self, data):
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                yield None, mask
+                continue
+            if mask & IN_IGNORED:
+                self.watches.pop(wd, None)
+                continue
+
+            directory = self.watches.get(wd)
+            if directory is not None:
+                yield (os.path.join(directory, os.fsdecode(name)) if name else directory), mask
+
+    def close(self):
+        os.close(self.fd)
+
+
+class VaultWatcher:
+    """Apply file changes in a vault to the task index and backlog parse cache"""
+
+    def __init__(self, vault_path, db_file=None, poll=False, interval=2.0):
+        self.vault_path = vault_path
+        self.plans_dir = os.path.join(vault_path, "DailyPlans")
+        self.shards_dir = os.path.join(self.plans_dir, "backlog")
+        self.index = TaskIndex(vault_path, db_file)
+        self.poll = poll
+        self.interval = interval
+
+    def is_backlog_file(self, path):
+        """backlog.md, its journal/database, or a month shard (DailyPlans/backlog/*.md)"""
+        parent = os.path.dirname(path)
+        if parent == self.plans_dir:
+            return os.path.basename(path).startswith("backlog.")
+        return parent == self.shards_dir and path.endswith('.md')
+
+    def handle(self, path):
+        """
+        Update derived data for one changed (or deleted) file
+
+        Returns:
+            bool: True if anything was updated
+        """
+        if self.is_backlog_file(path):
+            if path.endswith('.md'):
+                if not os.path.exists(path):
+                    BacklogParseCache(path).invalidate()
+                else:
+                    try:
+                        BacklogParseCache(path).load()
+                    except (OSError, UnicodeDecodeError) as e:
+                        print(f"[!] Warning: Could not read {path}: {e}")
+                        return False
+            return self.index.refresh_backlog()
+
+        return self.index.update_plan(path)
+
+    def warm_up(self):
+        """Bring everything up to date once, before watching"""
+        counts = self.index.refresh()
+        print(f"[OK] Index refreshed: {counts['updated']} updated, {counts['removed']} removed, "
+              f"{counts['unchanged']} unchanged")
+        for path in self.backlog_files():
+            self.handle(path)
+
+    def backlog_files(self):
+        paths = [
+            os.path.join(self.plans_dir, name)
+            for name in ("backlog.md", "backlog.journal", "backlog.db")
+        ]
+        try:
+            paths.extend(
+                os.path.join(self.shards_dir, name)
+                for name in sorted(os.listdir(self.shards_dir)) if name.endswith('.md')
+            )
+        except OSError:
+            pass
+        return [path for path in paths if os.path.isfile(path)]
+
+    def run(self):
+        """Watch until interrupted (Ctrl+C)"""
+        os.makedirs(self.plans_dir, exist_ok=True)
+        self.warm_up()
+
+        if not self.poll:
+            try:
+                watcher = InotifyWatcher()
+            except (OSError, AttributeError) as e:
+                # Not Linux, or no inotify in this libc
+                print(f"[!] inotify unavailable ({e}), polling every {self.interval}s")
+            else:
+                try:
+                    self._run_inotify(watcher)
+                finally:
+                    watcher.close()
+                return
+
+        self._run_polling()
+
+    def _watch_tree(self, watcher):
+        """Watch DailyPlans/, backlog/ and every YYYY/ and YYYY/MM/ directory"""
+        watcher.watch(self.plans_dir)
+        if os.path.isdir(self.shards_dir):
+            watcher.watch(self.shards_dir)
+        for year in sorted(os.listdir(self.plans_dir)):
+            year_dir = os.path.join(self.plans_dir, year)
+            if YEAR_RE.match(year) and os.path.isdir(year_dir):
+                watcher.watch(year_dir)
+                for month in sorted(os.listdir(year_dir)):
+                    month_dir = os.path.join(year_dir, month)
+                    if MONTH_RE.match(month) and os.path.isdir(month_dir):
+                        watcher.watch(month_dir)
+
+    def _is_watched_dir(self, path):
+        parent, name = os.path.split(path)
+        if path == self.shards_dir:
+            return True
+        if parent == self.plans_dir:
+            return bool(YEAR_RE.match(name))
+        return os.path.dirname(parent) == self.plans_dir and bool(MONTH_RE.match(name))
+
+    def _run_inotify(self, watcher):
+        try:
+            self._watch_tree(watcher)
+        except OSError as e:
+            if e.errno == errno.ENOSPC:
+                print("[!] inotify watch limit reached (fs.inotify.max_user_watches)")
+            raise
+        print(f"[*] Watching {self.plans_dir} (inotify)")
+
+        while True:
+            events = watcher.read()
+            changed = set()
+            for path, mask in events:
+                if path is None:
+                    # Kernel queue overflowed: events were lost, rescan
+                    print("[!] Event queue overflowed, rescanning")
+                    self.warm_up()
+                    changed.clear()
+                    continue
+
+                if mask & IN_ISDIR:
+                    if mask & (IN_CREATE | IN_MOVED_TO) and self._is_watched_dir(path):
+                        # New month/year directory (or backlog/): watch it and any
+                        # month directory created with it (os.makedirs of YYYY/MM),
+                        # and pick up files written before the watches existed
+                        for root, _, files in os.walk(path):
+                            if self._is_watched_dir(root):
+                                watcher.watch(root)
+                            changed.update(os.path.join(root, name) for name in files)
+                    continue
+                if mask & IN_DELETE_SELF:
+                    continue
+                changed.add(path)
+
+            self._apply(changed)
+
+    def _snapshot(self):
+        """(mtime_ns, size) of every watched file"""
+        files = {
+            os.path.join(self.vault_path, path): (mtime_ns, size)
+            for path, (_, mtime_ns, size) in self.index.scan_plans().items()
+        }
+        for path in self.backlog_files():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            files[path] = (stat.st_mtime_ns, stat.st_size)
+        return files
+
+    def _run_polling(self):
+        print(f"[*] Watching {self.plans_dir} (polling every {self.interval}s)")
+        previous = self._snapshot()
+        while True:
+            time.sleep(self.interval)
+            current = self._snapshot()
+            changed = {path for path, key in current.items() if previous.get(path) != key}
+            changed.update(path for path in previous if path not in current)
+            previous = current
+            self._apply(changed)
+
+    def _apply(self, paths):
+        for path in sorted(paths):
+            started = time.perf_counter()
+            if self.handle(path):
+                elapsed = (time.perf_counter() - started) * 1000
+                print(f"[OK] Updated {os.path.relpath(path, self.vault_path)} ({elapsed:.1f} ms)")
+
+
+def main():
+    """CLI interface"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Keep the vault task index and backlog cache warm')
+    parser.add_argument('vault_path', help='Path to Obsidian vault')
+    parser.add_argument('--poll', action='store_true', help='Poll file mtimes instead of using inotify')
+    parser.add_argument('--interval', type=float, default=2.0, help='Polling interval in seconds (default: 2)')
+    parser.add_argument('--db', help='Index database path (default: local cache directory)')
+
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.vault_path):
+        print(f"[ERROR] Vault not found: {args.vault_path}")
+        sys.exit(1)
+
+    watcher = VaultWatcher(args.vault_path, args.db, poll=args.poll, interval=args.interval)
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        print("\n[*] Watcher stopped")
+
+
+if __name__ == '__main__':
+    # Fix encoding for Windows console
+    if sys.platform == 'win32':
+        import io
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+    main()